@@ -1,4 +1,5 @@
 bind = "0.0.0.0:5000"
+# Settings, the library index, add-queue waiters and resumable sessions live in process memory.
 workers = 1
 threads = 4
 timeout = 120
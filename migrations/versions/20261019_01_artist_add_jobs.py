@@ -0,0 +1,59 @@
+"""add artist add jobs table
+
+Revision ID: 20261019_01
+Revises: 20260303_01
+Create Date: 2026-10-19 09:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_01"
+down_revision = "20260303_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = inspector.get_table_names()
+
+    if "artist_add_jobs" not in existing_tables:
+        op.create_table(
+            "artist_add_jobs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("artist_name", sa.String(length=255), nullable=False),
+            sa.Column("requested_by_id", sa.Integer(), nullable=True),
+            sa.Column("session_id", sa.String(length=128), nullable=True),
+            sa.Column("status", sa.String(length=20), nullable=False),
+            sa.Column("result", sa.String(length=40), nullable=True),
+            sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["requested_by_id"],
+                ["users.id"],
+                ondelete="SET NULL",
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_artist_add_jobs_artist_name"), "artist_add_jobs", ["artist_name"], unique=False)
+        op.create_index(op.f("ix_artist_add_jobs_status"), "artist_add_jobs", ["status"], unique=False)
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    existing_tables = inspector.get_table_names()
+
+    if "artist_add_jobs" in existing_tables:
+        existing_indexes = [idx["name"] for idx in inspector.get_indexes("artist_add_jobs") if idx["name"]]
+        for index_name in ("ix_artist_add_jobs_status", "ix_artist_add_jobs_artist_name"):
+            if index_name in existing_indexes:
+                op.drop_index(op.f(index_name), table_name="artist_add_jobs")
+        op.drop_table("artist_add_jobs")
@@ -108,6 +108,8 @@ def create_app(config_class: type[Config] = Config) -> Flask:
     # Database initialisation ----------------------------------------
     _run_database_initialisation(app, data_handler)
 
+    _start_background_services(app, data_handler)
+
     return app
 
 
@@ -156,7 +158,11 @@ def _init_core_extensions(app: Flask) -> None:
     login_manager.login_message = "Please log in to access Sonobarr."
     login_manager.login_message_category = "warning"
     csrf.init_app(app)
-    socketio.init_app(app, async_mode="gevent")
+    socketio.init_app(
+        app,
+        async_mode="gevent",
+        message_queue=app.config.get("SOCKETIO_MESSAGE_QUEUE") or None,
+    )
     oidc.init_app(app)
     oidc.register(
         name='sonobarr',
@@ -204,6 +210,19 @@ def _initialize_services(app: Flask) -> DataHandler:
     return data_handler
 
 
+def _start_background_services(app: Flask, data_handler: DataHandler) -> None:
+    """Start long-running maintenance tasks; skipped under test to keep runs deterministic."""
+    if app.config.get("TESTING"):
+        return
+    data_handler.add_queue.start()
+    reaper_interval = int(app.config.get("SESSION_REAPER_INTERVAL_SECONDS") or 0)
+    if reaper_interval > 0:
+        socketio.start_background_task(data_handler.run_session_reaper_loop, reaper_interval)
+    sync_hours = int(app.config.get("LIDARR_LIBRARY_SYNC_HOURS") or 0)
+    if sync_hours > 0:
+        socketio.start_background_task(data_handler.run_library_sync_loop, sync_hours * 3600)
+
+
 def _register_footer_metadata(app: Flask, release_client: ReleaseClient) -> None:
     """Register context processor for footer metadata (version info, update status)."""
     
@@ -73,6 +73,61 @@ class Config:
     RELEASE_CACHE_TTL_SECONDS = _get_int("release_cache_ttl_seconds", 60 * 60)
     LOG_LEVEL = (get_env_value("log_level", "INFO") or "INFO").upper()
     API_KEY = get_env_value("api_key")
+    # Full Lidarr library resync interval; Lidarr webhooks keep the cache current in between (0 disables).
+    LIDARR_LIBRARY_SYNC_HOURS = _get_int("lidarr_library_sync_hours", 24)
+    # Artist additions are queued and submitted to Lidarr by a small worker pool, spaced apart.
+    LIDARR_ADD_WORKERS = _get_int("lidarr_add_workers", 1)
+    LIDARR_ADD_INTERVAL_SECONDS = _get_int("lidarr_add_interval_seconds", 2)
+    # Seconds a disconnected discovery session is kept so a reconnecting tab can resume it (0 disables).
+    SESSION_RESUME_GRACE_SECONDS = _get_int("session_resume_grace_seconds", 300)
+    # Session housekeeping: idle/service session TTLs, reaper cadence and per-session retention caps.
+    SESSION_IDLE_TTL_SECONDS = _get_int("session_idle_ttl_seconds", 43200)
+    SERVICE_SESSION_TTL_SECONDS = _get_int("service_session_ttl_seconds", 600)
+    SESSION_REAPER_INTERVAL_SECONDS = _get_int("session_reaper_interval_seconds", 300)
+    SESSION_MAX_CARDS = _get_int("session_max_cards", 300)
+    SESSION_MAX_CANDIDATES = _get_int("session_max_candidates", 500)
+    # Artist cards produced within this window share one socket frame; replays are chunked.
+    CARD_COALESCE_WINDOW_MS = _get_int("card_coalesce_window_ms", 50)
+    CARD_CHUNK_SIZE = _get_int("card_chunk_size", 25)
+    # Ack-based flow control for card streams: max unacknowledged frames per socket (0 disables).
+    CARD_ACK_WINDOW = _get_int("card_ack_window", 0)
+    CARD_ACK_TIMEOUT_SECONDS = _get_int("card_ack_timeout_seconds", 10)
+    # Background work started from socket events: global cap, per-user cap and queue bound, debounce.
+    TASK_MAX_CONCURRENT = _get_int("task_max_concurrent", 16)
+    TASK_PER_USER_LIMIT = _get_int("task_per_user_limit", 2)
+    TASK_MAX_QUEUED_PER_USER = _get_int("task_max_queued_per_user", 20)
+    TASK_DEBOUNCE_MS = _get_int("task_debounce_ms", 250)
+    # Cache of LLM seed answers for repeated prompts (0 for either disables caching).
+    AI_SEED_CACHE_TTL_SECONDS = _get_int("ai_seed_cache_ttl_seconds", 86400)
+    AI_SEED_CACHE_MAX_ENTRIES = _get_int("ai_seed_cache_max_entries", 256)
+    # Stream LLM completions and start hydrating each seed artist as soon as it is named.
+    LLM_STREAM_SEEDS = _get_bool("llm_stream_seeds", True)
+    # Hedged AI requests: extra "model@base_url" endpoints raced against the configured model after a delay.
+    LLM_HEDGE_MODELS = get_env_value("llm_hedge_models", "")
+    LLM_HEDGE_DELAY_MS = _get_int("llm_hedge_delay_ms", 5000)
+    # Approximate token budget for the library summary sent with AI prompts (0 sends a plain name list).
+    LLM_LIBRARY_TOKEN_BUDGET = _get_int("llm_library_token_budget", 300)
+    # Check LLM-suggested artists exist on Last.fm before hydration and re-ask once for unknown ones.
+    LLM_VALIDATE_SEEDS = _get_bool("llm_validate_seeds", True)
+    # Await LLM requests on one shared asyncio event loop instead of a blocked worker thread each.
+    LLM_ASYNC_CLIENT = _get_bool("llm_async_client", True)
+    # Answer plain tag prompts ("post-rock") from the local tag index before asking the LLM.
+    AI_TAG_INDEX_FIRST = _get_bool("ai_tag_index_first", True)
+    TAG_INDEX_MAX_ARTISTS = _get_int("tag_index_max_artists", 20000)
+    # Last.fm artist.getSimilar answers shared by similar-artist discovery and Last.fm personal discovery.
+    SIMILAR_ARTIST_CACHE_TTL_SECONDS = _get_int("similar_artist_cache_ttl_seconds", 86400)
+    SIMILAR_ARTIST_CACHE_MAX_ENTRIES = _get_int("similar_artist_cache_max_entries", 2000)
+    # Per-username Last.fm/ListenBrainz discovery seeds; stale entries are served while refreshing in the background.
+    PERSONAL_SEED_CACHE_TTL_SECONDS = _get_int("personal_seed_cache_ttl_seconds", 86400)
+    PERSONAL_SEED_CACHE_MAX_STALE_SECONDS = _get_int("personal_seed_cache_max_stale_seconds", 7 * 86400)
+    # Top artists whose similar artists are fetched in parallel for Last.fm personal discovery.
+    LASTFM_SIMILAR_CONCURRENCY = _get_int("lastfm_similar_concurrency", 8)
+    # Seed artists (AI and personal discovery) hydrated in parallel per run.
+    SEED_HYDRATION_CONCURRENCY = _get_int("seed_hydration_concurrency", 4)
+    # Tabs of one user asking for the same discovery share a single run (per-worker).
+    SHARE_DISCOVERY_ACROSS_TABS = _get_bool("share_discovery_across_tabs", False)
+    # Lets other processes (scripts, a second container) emit to connected browsers.
+    SOCKETIO_MESSAGE_QUEUE = get_env_value("socketio_message_queue", "")
 
     CONFIG_DIR = str(CONFIG_DIR_PATH)
     SETTINGS_FILE = str(SETTINGS_FILE_PATH)
@@ -68,3 +68,27 @@ class ArtistRequest(db.Model):
 
     def __repr__(self) -> str:  # pragma: no cover - representation helper
         return f"<ArtistRequest id={self.id} artist='{self.artist_name}' status={self.status}>"
+
+
+class ArtistAddJob(db.Model):
+    """Persisted Lidarr add operation processed by the paced add queue."""
+
+    __tablename__ = "artist_add_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+    artist_name = db.Column(db.String(255), nullable=False, index=True)
+    requested_by_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    session_id = db.Column(db.String(128), nullable=True)
+    status = db.Column(db.String(20), default="queued", nullable=False, index=True)  # queued, resolving, adding, added, failed
+    result = db.Column(db.String(40), nullable=True)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    requested_by = db.relationship("User", foreign_keys=[requested_by_id])
+
+    def __repr__(self) -> str:  # pragma: no cover - representation helper
+        return f"<ArtistAddJob id={self.id} artist='{self.artist_name}' status={self.status}>"
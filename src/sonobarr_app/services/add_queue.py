@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ..extensions import db
+from ..models import ArtistAddJob
+
+ADD_JOB_QUEUED = "queued"
+ADD_JOB_RESOLVING = "resolving"
+ADD_JOB_ADDING = "adding"
+ADD_JOB_ADDED = "added"
+ADD_JOB_FAILED = "failed"
+ACTIVE_ADD_JOB_STATES = (ADD_JOB_QUEUED, ADD_JOB_RESOLVING, ADD_JOB_ADDING)
+
+# Card labels streamed through ``refresh_artist`` while a job is in flight.
+ADD_JOB_STATUS_LABELS = {
+    ADD_JOB_QUEUED: "Queued",
+    ADD_JOB_RESOLVING: "Resolving",
+    ADD_JOB_ADDING: "Adding",
+}
+
+DEFAULT_ADD_WAIT_TIMEOUT = 300.0
+FINISHED_JOB_RETENTION = timedelta(days=7)
+
+
+class ArtistAddQueue:
+    """Durable, paced queue that funnels every Lidarr artist addition through a few workers.
+
+    Jobs live in the ``artist_add_jobs`` table so they survive restarts. ``workers`` bounds how many
+    additions run concurrently and ``min_interval`` spaces out the POSTs that reach Lidarr.
+    """
+
+    def __init__(
+        self,
+        data_handler,
+        *,
+        workers: int = 1,
+        min_interval: float = 2.0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.data_handler = data_handler
+        self.workers = max(1, int(workers))
+        self.min_interval = max(0.0, float(min_interval))
+        self.logger = logger or logging.getLogger("sonobarr")
+        self.running = False
+        self._wakeup = threading.Event()
+        self._claim_lock = threading.Lock()
+        self._throttle_lock = threading.Lock()
+        self._next_submit_at = 0.0
+        self._waiters: Dict[int, threading.Event] = {}
+        self._results: Dict[int, str] = {}
+
+    def _app_context(self):
+        return self.data_handler._flask_app.app_context()
+
+    # Lifecycle -------------------------------------------------------
+    def start(self) -> None:
+        """Requeue jobs interrupted by a restart and spawn the worker tasks."""
+        if self.running or self.data_handler._flask_app is None:
+            return
+        with self._app_context():
+            interrupted = ArtistAddJob.query.filter(
+                ArtistAddJob.status.in_((ADD_JOB_RESOLVING, ADD_JOB_ADDING))
+            ).all()
+            for job in interrupted:
+                job.status = ADD_JOB_QUEUED
+            ArtistAddJob.query.filter(
+                ArtistAddJob.finished_at.isnot(None),
+                ArtistAddJob.finished_at < datetime.utcnow() - FINISHED_JOB_RETENTION,
+            ).delete(synchronize_session=False)
+            db.session.commit()
+            if interrupted:
+                self.logger.info("Requeued %d interrupted Lidarr add job(s).", len(interrupted))
+        self.running = True
+        for _ in range(self.workers):
+            self.data_handler.socketio.start_background_task(self._worker_loop)
+        self._wakeup.set()
+
+    # Producer side ---------------------------------------------------
+    def enqueue(
+        self,
+        artist_name: str,
+        *,
+        user_id: Optional[int],
+        sid: Optional[str],
+        track: bool = False,
+    ) -> int:
+        """Persist a queued job, notify the requester and wake an idle worker.
+
+        Pass ``track=True`` when the caller intends to :meth:`wait_for` the result.
+        """
+        return self.enqueue_many([artist_name], user_id=user_id, sid=sid, track=track)[0]
+
+    def enqueue_many(
+        self,
+        artist_names: Sequence[str],
+        *,
+        user_id: Optional[int],
+        sid: Optional[str],
+        track: bool = False,
+    ) -> List[int]:
+        """Persist several queued jobs in one transaction and return their ids in order."""
+        if not artist_names:
+            return []
+        with self._app_context():
+            jobs = [
+                ArtistAddJob(
+                    artist_name=artist_name,
+                    requested_by_id=user_id,
+                    session_id=sid,
+                    status=ADD_JOB_QUEUED,
+                )
+                for artist_name in artist_names
+            ]
+            db.session.add_all(jobs)
+            db.session.flush()
+            job_ids = [job.id for job in jobs]
+            if track:
+                # Waiters exist before the jobs become visible, so a fast worker cannot finish
+                # one before anybody is listening.
+                for job_id in job_ids:
+                    self._waiters[job_id] = threading.Event()
+            # Likewise "Queued" goes out first, so it cannot overwrite a worker's later status.
+            queued_label = ADD_JOB_STATUS_LABELS[ADD_JOB_QUEUED]
+            for artist_name in artist_names:
+                self.data_handler.notify_artist_status(user_id, sid, artist_name, queued_label)
+            try:
+                db.session.commit()
+            except Exception:
+                for job_id in job_ids:
+                    self._waiters.pop(job_id, None)
+                raise
+        self._wakeup.set()
+        return job_ids
+
+    def wait_for(self, job_id: int, timeout: float = DEFAULT_ADD_WAIT_TIMEOUT) -> Optional[str]:
+        """Block until a job finishes and return its final status label (None on timeout).
+
+        Jobs that are not tracked here, e.g. processed before :meth:`wait_for` was called, fall
+        back to the result stored on the job row.
+        """
+        waiter = self._waiters.get(job_id)
+        if waiter is not None:
+            waiter.wait(timeout)
+        self._waiters.pop(job_id, None)
+        result = self._results.pop(job_id, None)
+        return result if result is not None else self._stored_result(job_id)
+
+    def _stored_result(self, job_id: int) -> Optional[str]:
+        with self._app_context():
+            job = db.session.get(ArtistAddJob, job_id)
+            if job is None or job.finished_at is None:
+                return None
+            return job.result
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs per active state, for status reporting."""
+        with self._app_context():
+            rows = (
+                db.session.query(ArtistAddJob.status, db.func.count(ArtistAddJob.id))
+                .filter(ArtistAddJob.status.in_(ACTIVE_ADD_JOB_STATES))
+                .group_by(ArtistAddJob.status)
+                .all()
+            )
+        counts = {state: 0 for state in ACTIVE_ADD_JOB_STATES}
+        counts.update({state: count for state, count in rows})
+        return counts
+
+    # Worker side -----------------------------------------------------
+    def _worker_loop(self) -> None:
+        while True:
+            try:
+                processed = self.run_pending(limit=1)
+            except Exception:  # pragma: no cover - defensive worker guard
+                self.logger.exception("Lidarr add worker crashed while processing a job")
+                processed = 0
+            if not processed:
+                self._wakeup.wait(5.0)
+                self._wakeup.clear()
+
+    def run_pending(self, limit: Optional[int] = None) -> int:
+        """Process queued jobs in the calling thread; returns how many were handled."""
+        processed = 0
+        while limit is None or processed < limit:
+            claimed = self._claim_next_job()
+            if claimed is None:
+                break
+            self._process(*claimed)
+            processed += 1
+        return processed
+
+    def _claim_next_job(self) -> Optional[tuple[int, str, Optional[int], Optional[str]]]:
+        with self._claim_lock, self._app_context():
+            job = (
+                ArtistAddJob.query.filter_by(status=ADD_JOB_QUEUED)
+                .order_by(ArtistAddJob.id.asc())
+                .first()
+            )
+            if job is None:
+                return None
+            claimed = (
+                ArtistAddJob.query.filter_by(id=job.id, status=ADD_JOB_QUEUED)
+                .update(
+                    {"status": ADD_JOB_RESOLVING, "attempts": ArtistAddJob.attempts + 1},
+                    synchronize_session=False,
+                )
+            )
+            db.session.commit()
+            if not claimed:  # pragma: no cover - claimed by another process
+                return None
+            return job.id, job.artist_name, job.requested_by_id, job.session_id
+
+    def _update_job(self, job_id: int, **fields: Any) -> None:
+        with self._app_context():
+            ArtistAddJob.query.filter_by(id=job_id).update(fields, synchronize_session=False)
+            db.session.commit()
+
+    def _throttle(self) -> None:
+        """Space Lidarr submissions at least ``min_interval`` seconds apart across workers."""
+        with self._throttle_lock:
+            now = time.monotonic()
+            delay = self._next_submit_at - now
+            self._next_submit_at = max(now, self._next_submit_at) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def _stage_callback(
+        self,
+        job_id: int,
+        artist_name: str,
+        user_id: Optional[int],
+        sid: Optional[str],
+    ) -> Callable[[str], None]:
+        def on_stage(stage: str) -> None:
+            if stage == ADD_JOB_ADDING:
+                self._throttle()
+            self._update_job(job_id, status=stage)
+            self.data_handler.notify_artist_status(user_id, sid, artist_name, ADD_JOB_STATUS_LABELS[stage])
+
+        return on_stage
+
+    def _process(self, job_id: int, artist_name: str, user_id: Optional[int], sid: Optional[str]) -> None:
+        on_stage = self._stage_callback(job_id, artist_name, user_id, sid)
+        result = self.data_handler.run_add_job(artist_name, user_id, sid, on_stage=on_stage)
+        final_state = ADD_JOB_ADDED if result == "Added" else ADD_JOB_FAILED
+        self._update_job(job_id, status=final_state, result=result, finished_at=datetime.utcnow())
+        self.logger.info("Lidarr add job %s for '%s' finished: %s", job_id, artist_name, result)
+        waiter = self._waiters.get(job_id)
+        if waiter is not None:
+            self._results[job_id] = result
+            waiter.set()
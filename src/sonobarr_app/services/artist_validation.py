@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from unidecode import unidecode
+
+from .cancellation import CancellationToken
+from .parallel import imap_unordered
+
+DEFAULT_VALIDATION_TTL_SECONDS = 7 * 86400
+DEFAULT_VALIDATION_MAX_ENTRIES = 5000
+
+
+class ArtistNameValidator:
+    """Cheap existence check for suggested artist names, cached per normalized name.
+
+    ``lookup(name)`` answers True (the artist exists), False (the provider does not know it) or
+    None (could not tell, e.g. a network error). Undetermined names are let through uncached so a
+    flaky provider never hides real artists; ``known(name)`` short-circuits names already trusted
+    locally, such as the Lidarr library.
+    """
+
+    def __init__(
+        self,
+        lookup: Callable[[str], Optional[bool]],
+        *,
+        known: Optional[Callable[[str], bool]] = None,
+        workers: int = 4,
+        ttl_seconds: float = DEFAULT_VALIDATION_TTL_SECONDS,
+        max_entries: int = DEFAULT_VALIDATION_MAX_ENTRIES,
+    ) -> None:
+        self.lookup = lookup
+        self.known = known
+        self.workers = max(1, int(workers))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._stats = {"hits": 0, "lookups": 0, "rejected": 0}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return " ".join(unidecode(name or "").lower().split())
+
+    def cached(self, name: str) -> Optional[bool]:
+        key = self.normalize(name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def check(self, name: str) -> bool:
+        """Return whether ``name`` should be hydrated, consulting the cache before the provider."""
+        if self.known is not None and self.known(name):
+            return True
+        cached = self.cached(name)
+        if cached is not None:
+            verdict = cached
+        else:
+            with self._lock:
+                self._stats["lookups"] += 1
+            result = self.lookup(name)
+            if result is None:
+                return True
+            verdict = bool(result)
+            self._store(name, verdict)
+        if not verdict:
+            with self._lock:
+                self._stats["rejected"] += 1
+        return verdict
+
+    def iter_valid(
+        self,
+        names: Iterable[str],
+        *,
+        unknown: Optional[List[str]] = None,
+        token: Optional[CancellationToken] = None,
+    ) -> Iterator[str]:
+        """Yield names that pass :meth:`check` as their lookups finish; rejected names go to ``unknown``."""
+        for name, valid in imap_unordered(self.check, names, workers=self.workers, token=token):
+            if valid:
+                yield name
+            elif unknown is not None:
+                unknown.append(name)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._results), **self._stats}
+
+    def _store(self, name: str, verdict: bool) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._results[self.normalize(name)] = (expires_at, verdict)
+            self._results.move_to_end(self.normalize(name))
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, AsyncIterable, Awaitable, Callable, Deque, Iterator, Optional, Tuple
+
+from .cancellation import CancellationToken, CancelledError
+
+_END = object()
+
+
+def _native_primitives() -> Tuple[Callable[..., Any], Callable[[], Any], Callable[[], Any]]:
+    """Return ``start_new_thread``, the selector class and ``SimpleQueue``, unpatched under gevent.
+
+    The event loop must run on a real OS thread with a real selector; callers waiting for results
+    keep using the (possibly cooperative) ``time.sleep`` so they yield to other greenlets.
+    """
+    import _thread
+    import queue
+    import selectors
+
+    start_new_thread: Callable[..., Any] = _thread.start_new_thread
+    selector_cls: Callable[[], Any] = selectors.DefaultSelector
+    queue_cls: Callable[[], Any] = queue.SimpleQueue
+    try:
+        from gevent import monkey
+    except ImportError:  # pragma: no cover - gevent is a runtime dependency
+        return start_new_thread, selector_cls, queue_cls
+    if monkey.is_module_patched("threading"):
+        start_new_thread = monkey.get_original("_thread", "start_new_thread")
+    if monkey.is_module_patched("selectors"):
+        selector_cls = monkey.get_original("selectors", "DefaultSelector")
+    if monkey.is_module_patched("queue"):
+        queue_cls = monkey.get_original("queue", "SimpleQueue")
+    return start_new_thread, selector_cls, queue_cls
+
+
+class _NativeThreadExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Default executor for the loop (``getaddrinfo`` and friends) running on real OS threads.
+
+    The stdlib pool starts its workers with ``threading``, which gevent turns into greenlets of the
+    loop thread's hub; that hub never runs, so DNS lookups would never finish and interpreter exit
+    would wait on them forever. Only the type is inherited (asyncio requires it): these workers
+    take jobs from an unpatched queue and are not joined at exit.
+    """
+
+    def __init__(
+        self,
+        start_new_thread: Callable[..., Any],
+        queue_cls: Callable[[], Any],
+        *,
+        max_workers: int = 4,
+    ) -> None:
+        super().__init__(max_workers=max_workers)
+        self._start_new_thread = start_new_thread
+        self._queue = queue_cls()
+        self._started = False
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        if not self._started:
+            # Only the loop thread submits here, so no lock is needed.
+            self._started = True
+            for _ in range(self._max_workers):
+                self._start_new_thread(self._work, ())
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if self._shutdown:
+            return
+        self._shutdown = True
+        if self._started:
+            for _ in range(self._max_workers):
+                self._queue.put(None)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # handed to the awaiting coroutine
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+class AsyncLoopRunner:
+    """One asyncio event loop on a dedicated OS thread shared by every async provider call.
+
+    Coroutines are submitted from any worker (thread or greenlet) and awaited by polling, which
+    keeps gevent greenlets cooperative and needs no cross-thread wakeups. Any number of requests
+    can be in flight on the loop without holding a thread each; cancelling the caller's token
+    cancels the coroutine on the loop, which closes its HTTP request.
+    """
+
+    def __init__(self, *, poll_interval: float = 0.02, logger: Optional[logging.Logger] = None) -> None:
+        self.poll_interval = max(0.001, float(poll_interval))
+        self.logger = logger or logging.getLogger("sonobarr")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._start_new_thread, self._selector_cls, self._queue_cls = _native_primitives()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.SelectorEventLoop(self._selector_cls())
+            loop.set_default_executor(_NativeThreadExecutor(self._start_new_thread, self._queue_cls))
+            self._start_new_thread(self._serve, (loop,))
+            self._loop = loop
+        while not loop.is_running():
+            time.sleep(0.001)
+        return loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Awaitable[Any], *, token: Optional[CancellationToken] = None) -> Any:
+        """Run ``coro`` on the loop and wait for its result; the token cancels it on the loop."""
+        if token is not None and token.cancelled:
+            coro.close()
+            raise CancelledError()
+        future = self.submit(coro)
+        try:
+            while not future.done():
+                if token is not None and token.cancelled:
+                    raise CancelledError()
+                time.sleep(self.poll_interval)
+            if future.cancelled():
+                raise CancelledError()
+            return future.result()
+        finally:
+            if not future.done():
+                future.cancel()
+
+    def iterate(self, aiterable: AsyncIterable[Any], *, token: Optional[CancellationToken] = None) -> Iterator[Any]:
+        """Yield items of an async iterable consumed on the loop, as they arrive."""
+        items: Deque[Tuple[Any, Optional[BaseException]]] = collections.deque()
+
+        async def _pump() -> None:
+            try:
+                async for item in aiterable:
+                    items.append((item, None))
+            except asyncio.CancelledError:
+                raise
+            except BaseException as exc:  # propagated to the consuming caller
+                items.append((_END, exc))
+                return
+            items.append((_END, None))
+
+        if token is not None:
+            token.raise_if_cancelled()
+        future = self.submit(_pump())
+        try:
+            while True:
+                if token is not None and token.cancelled:
+                    raise CancelledError()
+                if not items:
+                    if future.done() and not items:
+                        if future.cancelled():
+                            raise CancelledError()
+                        return
+                    time.sleep(self.poll_interval)
+                    continue
+                item, error = items.popleft()
+                if error is not None:
+                    raise error
+                if item is _END:
+                    return
+                yield item
+        finally:
+            if not future.done():
+                future.cancel()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+# Upper bound on blocking calls running (or abandoned and still finishing) at once.
+MAX_CALL_WORKERS = 32
+
+
+class CancelledError(BaseException):
+    """Raised when work is abandoned because its cancellation token fired.
+
+    Like :class:`asyncio.CancelledError` it derives from ``BaseException`` so the broad
+    ``except Exception`` guards around provider calls do not swallow it.
+    """
+
+
+class _Outcome:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_STREAM_END = object()
+
+_executor_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_worker_state = threading.local()
+
+
+def _mark_call_worker() -> None:
+    _worker_state.active = True
+
+
+def _call_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_CALL_WORKERS,
+                thread_name_prefix="cancellable-call",
+                initializer=_mark_call_worker,
+            )
+        return _executor
+
+
+class CancellationToken:
+    """Cooperative cancellation flag carried through one discovery run.
+
+    Loops poll :attr:`cancelled` between steps; blocking provider calls go through :meth:`run`,
+    which stops waiting as soon as the token is cancelled instead of waiting for the call to time
+    out. The call itself is not interrupted: it finishes on a shared pool of
+    :data:`MAX_CALL_WORKERS` threads, bounded by the provider's own request timeout, and its
+    result is discarded.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise CancelledError()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Invoke ``callback`` on cancellation (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call on the shared pool and wait for it or for cancellation, whichever is first.
+
+        Calls made from inside a pooled call run inline, so nesting cannot exhaust the pool.
+        """
+        self.raise_if_cancelled()
+        if getattr(_worker_state, "active", False):
+            return func(*args, **kwargs)
+        outcome = _Outcome()
+
+        def _target() -> None:
+            try:
+                if self._event.is_set():
+                    return
+                outcome.result = func(*args, **kwargs)
+            except BaseException as exc:  # propagated to the waiting caller
+                outcome.error = exc
+            finally:
+                outcome.done.set()
+
+        self.add_callback(outcome.done.set)
+        try:
+            _call_executor().submit(_target)
+            outcome.done.wait()
+        finally:
+            self.remove_callback(outcome.done.set)
+
+        self.raise_if_cancelled()
+        if outcome.error is not None:
+            raise outcome.error
+        return outcome.result
+
+    def iterate(self, func: Callable[..., Iterable[Any]], *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """Consume ``func(*args)`` on a worker and yield its items as they arrive.
+
+        Raises :class:`CancelledError` as soon as the token is cancelled; the worker stops pulling
+        from the iterable at its next item.
+        """
+        self.raise_if_cancelled()
+        items: "queue.Queue[Any]" = queue.Queue()
+
+        def _target() -> None:
+            try:
+                for item in func(*args, **kwargs):
+                    if self._event.is_set():
+                        return
+                    items.put((item, None))
+            except BaseException as exc:  # propagated to the consuming caller
+                items.put((_STREAM_END, exc))
+            finally:
+                items.put((_STREAM_END, None))
+
+        def _wake() -> None:
+            items.put((_STREAM_END, None))
+
+        self.add_callback(_wake)
+        try:
+            threading.Thread(target=_target, name="cancellable-stream", daemon=True).start()
+            while True:
+                item, error = items.get()
+                self.raise_if_cancelled()
+                if error is not None:
+                    raise error
+                if item is _STREAM_END:
+                    return
+                yield item
+        finally:
+            self.remove_callback(_wake)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+CARD_EVENT = "more_artists_loaded"
+DEFAULT_COALESCE_WINDOW = 0.05
+DEFAULT_CARD_CHUNK_SIZE = 25
+DEFAULT_ACK_TIMEOUT = 10.0
+
+logger = logging.getLogger("sonobarr")
+
+
+def emit_card_chunks(socketio, sid: str, cards: Sequence[Dict[str, Any]], chunk_size: int) -> None:
+    """Emit a large card list (e.g. a reconnect replay) as bounded ``more_artists_loaded`` frames."""
+    chunk_size = max(1, int(chunk_size))
+    for start in range(0, len(cards), chunk_size):
+        socketio.emit(CARD_EVENT, list(cards[start:start + chunk_size]), room=sid)
+
+
+class AckWindow:
+    """Count of unacknowledged card frames on one socket, shared by every emitter streaming to it.
+
+    Kept on the socket's session so the limit holds across batches: frames a previous batch left
+    unacknowledged still count against the next one.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self.unacked = 0
+
+    def sent(self) -> None:
+        with self._cond:
+            self.unacked += 1
+
+    def acked(self, *_args: Any) -> None:
+        with self._cond:
+            self.unacked = max(0, self.unacked - 1)
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    def wait_below(self, limit: int, timeout: float, cancelled: Callable[[], bool]) -> Optional[bool]:
+        """Block while ``limit`` frames are unacknowledged.
+
+        Returns None when no wait was needed, True once the window opened (or ``cancelled``
+        returned True) and False when ``timeout`` passed; outstanding frames are then forgotten.
+        """
+        with self._cond:
+            if self.unacked < limit:
+                return None
+            deadline = time.monotonic() + timeout
+            while self.unacked >= limit and not cancelled():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.unacked = 0
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+
+class CardEmitter:
+    """Coalesce cards produced close together into a single ``more_artists_loaded`` frame.
+
+    A card that arrives at least ``window`` seconds after the previous frame is sent immediately,
+    so the first card is never delayed. Cards arriving inside the window are buffered and sent by
+    a deferred flush, by the next card that closes the window, or once ``chunk_size`` is reached.
+    Callers must :meth:`flush` before emitting anything that the client orders after the cards.
+
+    With ``ack_window`` set, frames are emitted with an acknowledgement callback and at most that
+    many may be unacknowledged: producers block in :meth:`add` until the client catches up (or
+    ``ack_timeout`` passes), which pauses hydration for slow clients instead of buffering frames.
+    Pass the socket's :class:`AckWindow` as ``acks`` so consecutive emitters share one window.
+    Acks require a single-socket target, so shared rooms must leave the window disabled.
+    """
+
+    def __init__(
+        self,
+        socketio,
+        sid: str,
+        *,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        chunk_size: int = DEFAULT_CARD_CHUNK_SIZE,
+        ack_window: int = 0,
+        ack_timeout: float = DEFAULT_ACK_TIMEOUT,
+        acks: Optional[AckWindow] = None,
+        cancel_token=None,
+    ) -> None:
+        self.socketio = socketio
+        self.sid = sid
+        self.window = max(0.0, float(window))
+        self.chunk_size = max(1, int(chunk_size))
+        self.ack_window = max(0, int(ack_window))
+        self.ack_timeout = max(0.0, float(ack_timeout))
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._last_emit = float("-inf")
+        self._flush_scheduled = False
+        self._acks = acks if acks is not None else AckWindow()
+        self._cancel_token = cancel_token
+        self.frames_sent = 0
+        self.window_stalls = 0
+
+    @property
+    def unacked(self) -> int:
+        return self._acks.unacked
+
+    def add(self, card: Dict[str, Any]) -> None:
+        self._wait_for_window()
+        schedule = False
+        # Emitting under the lock keeps frames in production order across the deferred flush.
+        with self._lock:
+            self._buffer.append(card)
+            window_elapsed = time.monotonic() - self._last_emit >= self.window
+            if window_elapsed or len(self._buffer) >= self.chunk_size:
+                self._flush_locked()
+            elif not self._flush_scheduled:
+                self._flush_scheduled = schedule = True
+        if schedule:
+            self.socketio.start_background_task(self._deferred_flush)
+
+    def flush(self) -> None:
+        self._wait_for_window()
+        with self._lock:
+            self._flush_locked()
+
+    def _deferred_flush(self) -> None:
+        self.socketio.sleep(self.window)
+        self._wait_for_window()
+        with self._lock:
+            self._flush_scheduled = False
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        self._last_emit = time.monotonic()
+        self.frames_sent += 1
+        if not self.ack_window:
+            self.socketio.emit(CARD_EVENT, batch, room=self.sid)
+            return
+        self._acks.sent()
+        self.socketio.emit(CARD_EVENT, batch, room=self.sid, callback=self._acks.acked)
+
+    def _cancelled(self) -> bool:
+        return self._cancel_token is not None and self._cancel_token.cancelled
+
+    def _wait_for_window(self) -> None:
+        """Block while ``ack_window`` frames are unacknowledged; give up after ``ack_timeout``."""
+        if not self.ack_window or self._acks.unacked < self.ack_window:
+            return
+        token = self._cancel_token
+        if token is not None:
+            token.add_callback(self._acks.wake)
+        try:
+            opened = self._acks.wait_below(self.ack_window, self.ack_timeout, self._cancelled)
+        finally:
+            if token is not None:
+                token.remove_callback(self._acks.wake)
+        if opened is None:
+            return
+        self.window_stalls += 1
+        if not opened:
+            # Outstanding frames are treated as lost rather than stalling the stream forever.
+            logger.warning(
+                "No card acks from %s for %.1fs; resuming without the outstanding acknowledgements",
+                self.sid,
+                self.ack_timeout,
+            )
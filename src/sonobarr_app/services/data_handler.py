@@ -6,13 +6,14 @@ import os
 import random
 import secrets
 import string
+import sys
 import tempfile
 import threading
 import time
 import urllib.parse
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import musicbrainzngs
 import pylast
@@ -23,8 +24,42 @@ from unidecode import unidecode
 from ..config import get_env_value
 from ..extensions import db
 from ..models import User, ArtistRequest
-from .openai_client import DEFAULT_MAX_SEED_ARTISTS, OpenAIRecommender
+from .add_queue import (
+    ADD_JOB_ADDING,
+    ADD_JOB_RESOLVING,
+    DEFAULT_ADD_WAIT_TIMEOUT,
+    ArtistAddQueue,
+)
+from .openai_client import (
+    DEFAULT_MAX_SEED_ARTISTS,
+    HedgedRecommender,
+    OpenAIRecommender,
+    build_replacement_prompt,
+    parse_model_endpoints,
+)
 from .integrations.lastfm_user import LastFmUserService
+from .artist_validation import ArtistNameValidator
+from .async_loop import AsyncLoopRunner
+from .cancellation import CancellationToken, CancelledError
+from .card_stream import AckWindow, CardEmitter, emit_card_chunks
+from .discovery_records import ArtistCard, SimilarCandidate, card_payload, format_count
+from .library_index import LibraryIndex
+from .library_summary import DEFAULT_LIBRARY_TOKEN_BUDGET, build_library_summary
+from .parallel import imap_unordered
+from .personal_seed_cache import PersonalSeedCache
+from .seed_cache import SeedCache
+from .session_store import SessionStore
+from .settings_snapshot import (
+    LISTENING_SETTINGS,
+    OPENAI_SETTINGS,
+    SettingsField,
+    SettingsSnapshot,
+)
+from .shared_discovery import SharedDiscovery, discovery_key
+from .similar_cache import SimilarArtistCache
+from .single_flight import SingleFlight
+from .tag_index import DEFAULT_TAG_INDEX_MAX_ARTISTS, TagIndex
+from .task_scheduler import PRIORITY_MAINTENANCE, PRIORITY_PREFETCH, SYSTEM_OWNER, TaskScheduler
 from .integrations.listenbrainz_user import (
     ListenBrainzIntegrationError,
     ListenBrainzUserService,
@@ -47,6 +82,10 @@ LIDARR_MONITOR_NEW_ITEM_TYPES = {
     "new",
 }
 FAILED_TO_ADD_STATUS = "Failed to Add"
+MAX_BULK_ARTISTS = 100
+PERSONAL_SEED_RECHECK_SECONDS = 3600
+# Sessions created server-side (e.g. admin approvals) rather than by a socket connection.
+SERVICE_SESSION_PREFIX = "admin_"
 
 
 @dataclass
@@ -57,43 +96,144 @@ class SessionState:
     user_id: Optional[int]
     is_admin: bool = False
     auto_approve_artist_requests: bool = False
-    recommended_artists: List[dict] = field(default_factory=list)
+    recommended_artists: List[ArtistCard] = field(default_factory=list)
     lidarr_items: List[dict] = field(default_factory=list)
     cleaned_lidarr_items: List[str] = field(default_factory=list)
     artists_to_use_in_search: List[str] = field(default_factory=list)
-    similar_artist_candidates: List[dict] = field(default_factory=list)
+    similar_artist_candidates: List[SimilarCandidate] = field(default_factory=list)
     similar_artist_batch_pointer: int = 0
     initial_batch_sent: bool = False
     ai_seed_artists: List[str] = field(default_factory=list)
     stop_event: threading.Event = field(default_factory=threading.Event)
     search_lock: threading.Lock = field(default_factory=threading.Lock)
+    cancel_token: CancellationToken = field(default_factory=CancellationToken)
     running: bool = False
+    sidebar_version: int = 0
+    sidebar_snapshot: Optional[Dict[str, bool]] = None
+    resume_token: str = field(default_factory=lambda: secrets.token_urlsafe(16))
+    detached_at: Optional[float] = None
+    synthetic: bool = False
+    last_activity: float = field(default_factory=time.monotonic)
+    cards_trimmed: int = 0
+    trimmed_names: set[str] = field(default_factory=set)
+    shared_discovery: Optional[str] = None
+    sidebar_index: Optional[Dict[str, dict]] = field(default=None, repr=False, compare=False)
+    card_acks: AckWindow = field(default_factory=AckWindow, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.stop_event.set()
 
-    def prepare_for_search(self) -> None:
+    def set_sidebar_items(self, items: List[dict], cleaned: List[str]) -> None:
+        """Replace the sidebar and its normalized names, rebuilding the name index."""
+        self.lidarr_items = items
+        self.cleaned_lidarr_items = cleaned
+        self.sidebar_index = {LibraryIndex.normalize(item["name"]): item for item in items}
+
+    def sidebar_items_by_key(self) -> Dict[str, dict]:
+        """Sidebar items keyed by :meth:`LibraryIndex.normalize`, shared with :attr:`lidarr_items`.
+
+        The index is kept in step by :meth:`set_sidebar_items`, :meth:`add_sidebar_item` and
+        :meth:`remove_sidebar_item`; it is only built here for sessions restored from a record.
+        """
+        if self.sidebar_index is None:
+            self.sidebar_index = {LibraryIndex.normalize(item["name"]): item for item in self.lidarr_items}
+        return self.sidebar_index
+
+    def add_sidebar_item(self, name: str) -> Optional[dict]:
+        """Append ``name`` to the sidebar unless it is already listed; returns the new item."""
+        index = self.sidebar_items_by_key()
+        key = LibraryIndex.normalize(name)
+        if not key or key in index:
+            return None
+        item = {"name": name, "checked": False}
+        self.lidarr_items.append(item)
+        self.cleaned_lidarr_items.append(key)
+        index[key] = item
+        return item
+
+    def remove_sidebar_item(self, name: str) -> Optional[dict]:
+        """Drop ``name`` from the sidebar; returns the removed item, or None if it was not listed."""
+        key = LibraryIndex.normalize(name)
+        item = self.sidebar_items_by_key().pop(key, None)
+        if item is None:
+            return None
+        self.lidarr_items.remove(item)
+        if key in self.cleaned_lidarr_items:
+            self.cleaned_lidarr_items.remove(key)
+        return item
+
+    def prepare_for_search(self, token: Optional[CancellationToken] = None) -> None:
+        """Reset discovery state; ``token`` continues a run already begun with :meth:`begin_run`."""
         self.recommended_artists.clear()
+        self.trimmed_names.clear()
         self.artists_to_use_in_search.clear()
         self.similar_artist_candidates.clear()
         self.similar_artist_batch_pointer = 0
         self.initial_batch_sent = False
         self.ai_seed_artists.clear()
+        if token is None:
+            self.begin_run()
         self.stop_event.clear()
         self.running = True
 
+    def begin_run(self) -> CancellationToken:
+        """Cancel any run still in flight and hand out a fresh token for the next one."""
+        self.cancel_token.cancel()
+        self.cancel_token = CancellationToken()
+        return self.cancel_token
+
     def mark_stopped(self) -> None:
         self.stop_event.set()
+        self.cancel_token.cancel()
         self.running = False
 
+    def touch(self) -> None:
+        self.last_activity = time.monotonic()
+
+    def recommended_names(self) -> set[str]:
+        """Normalized names of every card shown in this run, including ones trimmed from memory."""
+        return {unidecode(card["Name"]).lower() for card in self.recommended_artists} | self.trimmed_names
+
 
 class DataHandler:
     _version_logged = False
 
+    # Settings live in one immutable snapshot; these attributes read from it and assignments publish a new one.
+    lidarr_address = SettingsField()
+    lidarr_api_key = SettingsField()
+    root_folder_path = SettingsField()
+    fallback_to_top_result = SettingsField()
+    lidarr_api_timeout = SettingsField()
+    quality_profile_id = SettingsField()
+    metadata_profile_id = SettingsField()
+    search_for_missing_albums = SettingsField()
+    dry_run_adding_to_lidarr = SettingsField()
+    lidarr_monitor_option = SettingsField()
+    lidarr_monitored = SettingsField()
+    lidarr_albums_to_monitor = SettingsField()
+    lidarr_monitor_new_items = SettingsField()
+    app_name = SettingsField()
+    app_rev = SettingsField()
+    app_url = SettingsField()
+    last_fm_api_key = SettingsField()
+    last_fm_api_secret = SettingsField()
+    auto_start = SettingsField()
+    auto_start_delay = SettingsField()
+    youtube_api_key = SettingsField()
+    similar_artist_batch_size = SettingsField()
+    openai_api_key = SettingsField()
+    openai_model = SettingsField()
+    openai_api_base = SettingsField()
+    openai_extra_headers = SettingsField()
+    openai_max_seed_artists = SettingsField()
+    api_key = SettingsField()
+
     def __init__(self, socketio, logger: Optional[logging.Logger], app_config: Dict[str, Any]) -> None:
         self.socketio = socketio
         self.logger = logger or logging.getLogger("sonobarr")
         self._flask_app = None  # bound in app factory to allow background tasks to use app context
+        self.settings = SettingsSnapshot()
+        self._settings_lock = threading.Lock()
         self.musicbrainzngs_logger = logging.getLogger("musicbrainzngs")
         self.musicbrainzngs_logger.setLevel(logging.WARNING)
         self.pylast_logger = logging.getLogger("pylast")
@@ -105,17 +245,82 @@ class DataHandler:
             self.logger.info("%s initialised (version=%s)", app_name_text, release_version)
             DataHandler._version_logged = True
 
-        self.sessions: Dict[str, SessionState] = {}
+        self.sessions = SessionStore()
         self.sessions_lock = threading.Lock()
-        self.cache_lock = threading.Lock()
-        self.cached_lidarr_names: List[str] = []
-        self.cached_cleaned_lidarr_names: List[str] = []
+        # Disconnected sessions kept for a grace period so a reconnecting client can resume them.
+        self.detached_sessions: Dict[str, SessionState] = {}
+        self.session_resume_grace = float(app_config.get("SESSION_RESUME_GRACE_SECONDS", 300) or 0)
+        self.session_idle_ttl = float(app_config.get("SESSION_IDLE_TTL_SECONDS", 43200) or 0)
+        self.service_session_ttl = float(app_config.get("SERVICE_SESSION_TTL_SECONDS", 600) or 0)
+        self.session_max_cards = max(1, int(app_config.get("SESSION_MAX_CARDS", 300) or 300))
+        self.session_max_candidates = max(1, int(app_config.get("SESSION_MAX_CANDIDATES", 500) or 500))
+        self.sessions_reaped = 0
+        self.card_coalesce_window = max(0, int(app_config.get("CARD_COALESCE_WINDOW_MS", 50) or 0)) / 1000.0
+        self.card_chunk_size = max(1, int(app_config.get("CARD_CHUNK_SIZE", 25) or 25))
+        self.card_ack_window = max(0, int(app_config.get("CARD_ACK_WINDOW", 0) or 0))
+        self.card_ack_timeout = float(app_config.get("CARD_ACK_TIMEOUT_SECONDS", 10) or 10)
 
         config_dir = Path(app_config.get("CONFIG_DIR")) if app_config.get("CONFIG_DIR") else None
         if config_dir is None:
             config_dir = Path.cwd() / "config"
         config_dir.mkdir(parents=True, exist_ok=True)
         self.config_folder = config_dir
+        self.library_index = LibraryIndex(self.config_folder / "lidarr_library.json", self.logger)
+        self.library_index.load()
+        self._add_flights = SingleFlight()
+        self.add_queue = ArtistAddQueue(
+            self,
+            workers=app_config.get("LIDARR_ADD_WORKERS", 1),
+            min_interval=app_config.get("LIDARR_ADD_INTERVAL_SECONDS", 2),
+            logger=self.logger,
+        )
+        self.ai_seed_cache = SeedCache(
+            ttl_seconds=app_config.get("AI_SEED_CACHE_TTL_SECONDS", 86400),
+            max_entries=app_config.get("AI_SEED_CACHE_MAX_ENTRIES", 256),
+        )
+        self._ai_seed_flights = SingleFlight()
+        self.llm_stream_seeds = bool(app_config.get("LLM_STREAM_SEEDS", True))
+        self.llm_hedge_models = parse_model_endpoints(app_config.get("LLM_HEDGE_MODELS", ""))
+        self.llm_hedge_delay = int(app_config.get("LLM_HEDGE_DELAY_MS", 5000) or 0) / 1000.0
+        self.llm_loop: Optional[AsyncLoopRunner] = None
+        if app_config.get("LLM_ASYNC_CLIENT", True):
+            self.llm_loop = AsyncLoopRunner(logger=self.logger)
+        self.llm_library_token_budget = int(
+            app_config.get("LLM_LIBRARY_TOKEN_BUDGET", DEFAULT_LIBRARY_TOKEN_BUDGET) or 0
+        )
+        self._library_summary: Tuple[str, int] = ("", -1)
+        self.tag_index = TagIndex(
+            max_artists=app_config.get("TAG_INDEX_MAX_ARTISTS", DEFAULT_TAG_INDEX_MAX_ARTISTS)
+        )
+        self.ai_tag_index_first = bool(app_config.get("AI_TAG_INDEX_FIRST", True))
+        self.similar_artist_cache = SimilarArtistCache(
+            ttl_seconds=app_config.get("SIMILAR_ARTIST_CACHE_TTL_SECONDS", 86400),
+            max_entries=app_config.get("SIMILAR_ARTIST_CACHE_MAX_ENTRIES", 2000),
+        )
+        self.personal_seed_cache = PersonalSeedCache(
+            ttl_seconds=app_config.get("PERSONAL_SEED_CACHE_TTL_SECONDS", 86400),
+            max_stale_seconds=app_config.get("PERSONAL_SEED_CACHE_MAX_STALE_SECONDS", 7 * 86400),
+        )
+        self.lastfm_similar_concurrency = max(1, int(app_config.get("LASTFM_SIMILAR_CONCURRENCY", 8) or 1))
+        self.seed_hydration_concurrency = max(1, int(app_config.get("SEED_HYDRATION_CONCURRENCY", 4) or 1))
+        self.artist_validator: Optional[ArtistNameValidator] = None
+        if app_config.get("LLM_VALIDATE_SEEDS", True):
+            self.artist_validator = ArtistNameValidator(
+                self._artist_exists,
+                known=self.library_index.__contains__,
+                workers=self.seed_hydration_concurrency,
+            )
+        self.share_discovery = bool(app_config.get("SHARE_DISCOVERY_ACROSS_TABS", False))
+        self.shared_discoveries: Dict[Tuple[int, str], SharedDiscovery] = {}
+        self.shared_discoveries_lock = threading.Lock()
+        self.task_scheduler = TaskScheduler(
+            socketio,
+            max_concurrent=app_config.get("TASK_MAX_CONCURRENT", 16),
+            per_owner_limit=app_config.get("TASK_PER_USER_LIMIT", 2),
+            max_queued_per_owner=app_config.get("TASK_MAX_QUEUED_PER_USER", 20),
+            debounce_seconds=int(app_config.get("TASK_DEBOUNCE_MS", 250) or 0) / 1000.0,
+            logger=self.logger,
+        )
         settings_path = app_config.get("SETTINGS_FILE")
         self.settings_config_file = Path(settings_path) if settings_path else self.config_folder / "settings_config.json"
         self.similar_artist_batch_size = 10
@@ -129,7 +334,7 @@ class DataHandler:
         self.lidarr_monitored = True
         self.lidarr_albums_to_monitor: List[str] = []
         self.lidarr_monitor_new_items = ""
-        self.openai_recommender: Optional[OpenAIRecommender] = None
+        self.openai_recommender: Optional[OpenAIRecommender | HedgedRecommender] = None
         self.last_fm_user_service: Optional[LastFmUserService] = None
         self.listenbrainz_user_service = ListenBrainzUserService()
 
@@ -222,7 +427,7 @@ class DataHandler:
             return ""
         return str(value).strip()
 
-    def _apply_string_settings(self, data: dict) -> None:
+    def _apply_string_settings(self, data: dict, changes: Dict[str, Any]) -> None:
         string_fields = {
             "lidarr_address": "lidarr_address",
             "lidarr_api_key": "lidarr_api_key",
@@ -238,9 +443,9 @@ class DataHandler:
         }
         for payload_key, attr in string_fields.items():
             if payload_key in data:
-                setattr(self, attr, self._clean_str_value(data.get(payload_key)))
+                changes[attr] = self._clean_str_value(data.get(payload_key))
 
-    def _apply_int_settings(self, data: dict) -> None:
+    def _apply_int_settings(self, data: dict, changes: Dict[str, Any]) -> None:
         int_fields = {
             "quality_profile_id": ("quality_profile_id", 1),
             "metadata_profile_id": ("metadata_profile_id", 1),
@@ -251,9 +456,9 @@ class DataHandler:
             if payload_key in data:
                 parsed_int = self._coerce_int(data.get(payload_key), minimum=minimum)
                 if parsed_int is not None:
-                    setattr(self, attr, parsed_int)
+                    changes[attr] = parsed_int
 
-    def _apply_float_settings(self, data: dict) -> None:
+    def _apply_float_settings(self, data: dict, changes: Dict[str, Any]) -> None:
         float_fields = {
             "lidarr_api_timeout": ("lidarr_api_timeout", 1.0),
             "auto_start_delay": ("auto_start_delay", 0.0),
@@ -262,9 +467,9 @@ class DataHandler:
             if payload_key in data:
                 parsed_float = self._coerce_float(data.get(payload_key), minimum=minimum)
                 if parsed_float is not None:
-                    setattr(self, attr, parsed_float)
+                    changes[attr] = parsed_float
 
-    def _apply_bool_settings(self, data: dict) -> None:
+    def _apply_bool_settings(self, data: dict, changes: Dict[str, Any]) -> None:
         bool_fields = {
             "fallback_to_top_result": "fallback_to_top_result",
             "search_for_missing_albums": "search_for_missing_albums",
@@ -276,7 +481,57 @@ class DataHandler:
             if payload_key in data:
                 coerced_bool = self._coerce_bool(data.get(payload_key))
                 if coerced_bool is not None:
-                    setattr(self, attr, coerced_bool)
+                    changes[attr] = coerced_bool
+
+    def _stage_settings(self, data: dict, current: SettingsSnapshot) -> Dict[str, Any]:
+        """Parse a settings payload into snapshot changes, clamped against ``current``."""
+        changes: Dict[str, Any] = {}
+        self._apply_string_settings(data, changes)
+        self._apply_int_settings(data, changes)
+        self._apply_float_settings(data, changes)
+        self._apply_bool_settings(data, changes)
+
+        def staged(name: str) -> Any:
+            return changes[name] if name in changes else getattr(current, name)
+
+        changes["openai_extra_headers"] = self._normalize_openai_headers_field(staged("openai_extra_headers"))
+
+        if "lidarr_monitor_option" in data:
+            changes["lidarr_monitor_option"] = self._normalize_monitor_option(data.get("lidarr_monitor_option"))
+
+        if "lidarr_monitor_new_items" in data:
+            changes["lidarr_monitor_new_items"] = self._normalize_monitor_new_items(
+                data.get("lidarr_monitor_new_items")
+            )
+
+        if "lidarr_albums_to_monitor" in data:
+            changes["lidarr_albums_to_monitor"] = self._parse_albums_to_monitor(
+                data.get("lidarr_albums_to_monitor")
+            )
+
+        if staged("similar_artist_batch_size") <= 0:
+            changes["similar_artist_batch_size"] = 1
+        if staged("openai_max_seed_artists") <= 0:
+            changes["openai_max_seed_artists"] = DEFAULT_MAX_SEED_ARTISTS
+        if staged("auto_start_delay") < 0:
+            changes["auto_start_delay"] = 0
+        return changes
+
+    def _publish_settings(
+        self,
+        changes: Dict[str, Any] | Callable[[SettingsSnapshot], Dict[str, Any]],
+    ) -> Tuple[SettingsSnapshot, SettingsSnapshot]:
+        """Atomically swap in a snapshot with ``changes``; returns ``(previous, current)``.
+
+        ``changes`` may also be a function of the current snapshot. It is called under the lock, so
+        values derived from the snapshot cannot be overwritten by a concurrent update.
+        """
+        with self._settings_lock:
+            previous = self.settings
+            if callable(changes):
+                changes = changes(previous)
+            self.settings = previous.with_changes(changes)
+            return previous, self.settings
 
     # Session helpers -------------------------------------------------
     def ensure_session(
@@ -289,39 +544,218 @@ class DataHandler:
         """Return existing socket session or create one with current user flags."""
 
         with self.sessions_lock:
-            session = self.sessions.get(sid)
+            session = self.sessions.get_local(sid)
             if session is None:
                 session = SessionState(
                     sid=sid,
                     user_id=user_id,
                     is_admin=is_admin,
                     auto_approve_artist_requests=auto_approve_artist_requests,
+                    synthetic=sid.startswith(SERVICE_SESSION_PREFIX),
                 )
-                self.sessions[sid] = session
+                self.sessions.add(session)
             elif user_id is not None:
                 session.user_id = user_id
                 session.is_admin = is_admin
                 session.auto_approve_artist_requests = auto_approve_artist_requests
+            session.touch()
             return session
 
     def get_session_if_exists(self, sid: str) -> Optional[SessionState]:
-        with self.sessions_lock:
-            return self.sessions.get(sid)
+        return self.sessions.get_local(sid)
 
     def remove_session(self, sid: str) -> None:
+        """Drop a socket session, parking it for resumption when a grace period is configured."""
         with self.sessions_lock:
-            session = self.sessions.pop(sid, None)
+            session = self.sessions.pop(sid)
+            if session and session.user_id and self.session_resume_grace > 0:
+                session.detached_at = time.monotonic()
+                self.detached_sessions[session.resume_token] = session
+            self._prune_detached_sessions_locked()
         if session:
+            self._leave_shared_discovery(session)
             session.mark_stopped()
 
+    # Session housekeeping ------------------------------------------
+    def reap_sessions(self) -> int:
+        """Drop idle and service sessions past their TTL and trim oversized ones; returns reaped count.
+
+        Idle sessions whose socket is still connected are only trimmed, never dropped, so an open
+        tab keeps working however long it sits unused.
+        """
+        now = time.monotonic()
+        expired: List[str] = []
+        for session in self.sessions.local_values():
+            ttl = self.service_session_ttl if session.synthetic else self.session_idle_ttl
+            if (
+                ttl > 0
+                and not session.running
+                and now - session.last_activity > ttl
+                and (session.synthetic or not self._socket_connected(session.sid))
+            ):
+                expired.append(session.sid)
+            else:
+                self._enforce_session_caps(session)
+        with self.sessions_lock:
+            reaped = [session for session in (self.sessions.pop(sid) for sid in expired) if session]
+            before = len(self.detached_sessions)
+            self._prune_detached_sessions_locked()
+            pruned = before - len(self.detached_sessions)
+            detached = list(self.detached_sessions.values())
+        for session in detached:
+            self._enforce_session_caps(session)
+        for session in reaped:
+            session.mark_stopped()
+        total = len(reaped) + pruned
+        self.sessions_reaped += total
+        if total:
+            self.logger.info("Reaped %d idle session(s) and %d detached session(s).", len(reaped), pruned)
+        return total
+
+    def _socket_connected(self, sid: str) -> bool:
+        """Whether the Socket.IO server still holds ``sid``; False when that cannot be told."""
+        manager = getattr(getattr(self.socketio, "server", None), "manager", None)
+        if manager is None:
+            return False
+        try:
+            return bool(manager.is_connected(sid, "/"))
+        except Exception:  # pragma: no cover - defensive
+            return False
+
+    def _enforce_session_caps(self, session: SessionState) -> None:
+        """Release consumed candidates and the oldest cards; skipped while a batch is streaming."""
+        if not session.search_lock.acquire(blocking=False):
+            return
+        try:
+            consumed = session.similar_artist_batch_pointer
+            if consumed:
+                del session.similar_artist_candidates[:consumed]
+                session.similar_artist_batch_pointer = 0
+            del session.similar_artist_candidates[self.session_max_candidates:]
+            overflow = len(session.recommended_artists) - self.session_max_cards
+            if overflow > 0:
+                # The client still shows trimmed cards, so keep their names for dedupe and status updates.
+                session.trimmed_names.update(
+                    unidecode(card["Name"]).lower() for card in session.recommended_artists[:overflow]
+                )
+                del session.recommended_artists[:overflow]
+                session.cards_trimmed += overflow
+        finally:
+            session.search_lock.release()
+
+    @staticmethod
+    def _estimate_session_bytes(session: SessionState) -> int:
+        def _item_size(item: Any) -> int:
+            if isinstance(item, dict):
+                values: Iterable[Any] = item.values()
+            else:
+                values = (getattr(item, slot, None) for slot in getattr(item, "__slots__", ()))
+            return sys.getsizeof(item) + sum(sys.getsizeof(value) for value in values)
+
+        size = sys.getsizeof(session)
+        for items in (session.recommended_artists, session.lidarr_items, session.similar_artist_candidates):
+            size += sys.getsizeof(items) + sum(_item_size(item) for item in items)
+        size += sum(sys.getsizeof(name) for name in session.cleaned_lidarr_items)
+        return size
+
+    def session_metrics(self) -> Dict[str, int]:
+        """Session counts and a rough memory estimate for capacity planning."""
+        local = self.sessions.local_values()
+        with self.sessions_lock:
+            detached = list(self.detached_sessions.values())
+        return {
+            "active": sum(1 for session in local if not session.synthetic),
+            "service": sum(1 for session in local if session.synthetic),
+            "detached": len(detached),
+            "running": sum(1 for session in local if session.running),
+            "reaped_total": self.sessions_reaped,
+            "cards": sum(len(session.recommended_artists) for session in local + detached),
+            "candidates": sum(len(session.similar_artist_candidates) for session in local + detached),
+            "estimated_bytes": sum(self._estimate_session_bytes(session) for session in local + detached),
+        }
+
+    def run_session_reaper_loop(self, interval_seconds: float) -> None:
+        while True:
+            self.socketio.sleep(interval_seconds)
+            try:
+                self.reap_sessions()
+            except Exception:  # pragma: no cover - defensive background guard
+                self.logger.exception("Session reaper failed")
+
+    def _prune_detached_sessions_locked(self) -> None:
+        cutoff = time.monotonic() - self.session_resume_grace
+        for token, session in list(self.detached_sessions.items()):
+            if session.detached_at is None or session.detached_at < cutoff:
+                del self.detached_sessions[token]
+
+    def _resume_session(
+        self,
+        sid: str,
+        user_id: Optional[int],
+        resume_token: Optional[str],
+    ) -> Optional[SessionState]:
+        """Re-attach a detached session by resume token, or the user's most recent one."""
+        if not user_id:
+            return None
+        with self.sessions_lock:
+            self._prune_detached_sessions_locked()
+            if resume_token:
+                session = self.detached_sessions.get(resume_token)
+                if session is None or session.user_id != user_id:
+                    return None
+            else:
+                candidates = [item for item in self.detached_sessions.values() if item.user_id == user_id]
+                if not candidates:
+                    return None
+                session = max(candidates, key=lambda item: item.detached_at or 0.0)
+            del self.detached_sessions[session.resume_token]
+            session.sid = sid
+            session.detached_at = None
+            # Acks for frames sent to the old socket will never arrive.
+            session.card_acks = AckWindow()
+            self.sessions.add(session)
+        self.logger.info("Resumed discovery session for user %s on socket %s.", user_id, sid)
+        return session
+
     # Cache helpers ---------------------------------------------------
+    @property
+    def cached_lidarr_names(self) -> List[str]:
+        """Display names of the cached Lidarr library, in index order."""
+        return self.library_index.names()
+
+    @cached_lidarr_names.setter
+    def cached_lidarr_names(self, names: Sequence[str]) -> None:
+        self.library_index.replace(names)
+
+    @property
+    def cached_cleaned_lidarr_names(self) -> List[str]:
+        """Normalized names of the cached Lidarr library, in index order."""
+        return self.library_index.cleaned_names()
+
+    @cached_cleaned_lidarr_names.setter
+    def cached_cleaned_lidarr_names(self, names: Sequence[str]) -> None:
+        self.library_index.replace_cleaned(names)
+
+    def library_summary(self) -> str:
+        """Token-bounded library description for AI prompts, rebuilt only when the library changes."""
+        if self.llm_library_token_budget <= 0:
+            return ""
+        version = self.library_index.version
+        summary, summary_version = self._library_summary
+        if summary_version != version:
+            summary = build_library_summary(
+                self.library_index.names(),
+                self.library_index.genres(),
+                token_budget=self.llm_library_token_budget,
+            )
+            self._library_summary = (summary, version)
+        return summary
+
     def _copy_cached_lidarr_items(self, checked: bool = False) -> List[dict]:
-        with self.cache_lock:
-            return [{"name": name, "checked": checked} for name in self.cached_lidarr_names]
+        return [{"name": name, "checked": checked} for name in self.library_index.names()]
 
     def _copy_cached_cleaned_names(self) -> List[str]:
-        with self.cache_lock:
-            return list(self.cached_cleaned_lidarr_names)
+        return self.library_index.cleaned_names()
 
     # Personal discovery helpers -----------------------------------
     def _resolve_user(self, user_id: Optional[int]) -> Optional[User]:
@@ -397,21 +831,31 @@ class DataHandler:
         self.socketio.emit("personal_sources_state", state, room=sid)
 
     def broadcast_personal_sources_state(self) -> None:
-        with self.sessions_lock:
-            session_ids = [session.sid for session in self.sessions.values()]
+        session_ids = [session.sid for session in self.sessions.local_values()]
         for session_id in session_ids:
             self.emit_personal_sources_state(session_id)
 
     def refresh_personal_sources_for_user(self, user_id: int) -> None:
-        with self.sessions_lock:
-            session_ids = [session.sid for session in self.sessions.values() if session.user_id == user_id]
+        session_ids = [session.sid for session in self.sessions.local_values() if session.user_id == user_id]
         for session_id in session_ids:
             self.emit_personal_sources_state(session_id)
 
-    def _emit_personal_error(self, sid: str, source: str, message: str, *, title: Optional[str] = None) -> None:
+    def _emit_personal_error(
+        self,
+        sid: str,
+        source: str,
+        message: str,
+        *,
+        title: Optional[str] = None,
+        session: Optional[SessionState] = None,
+    ) -> None:
+        """Report a personal discovery failure; with ``session``, to every tab of its shared run."""
+        room = self._discovery_target(session, sid) if session is not None else sid
         payload = {"source": source, "message": message}
-        self.socketio.emit("user_recs_error", payload, room=sid)
-        self._emit_toast(sid, title or "Personal discovery", message)
+        self.socketio.emit("user_recs_error", payload, room=room)
+        self._emit_toast(room, title or "Personal discovery", message)
+        if session is not None:
+            self._end_shared_discovery(session)
 
     def _emit_toast(self, sid: str, title: str, message: str) -> None:
         """Emit a unified toast payload to a socket room."""
@@ -472,8 +916,12 @@ class DataHandler:
         for item in session.recommended_artists:
             if item["Name"] == artist_name:
                 item["Status"] = status
-                self.socketio.emit("refresh_artist", item, room=sid)
+                self.socketio.emit("refresh_artist", card_payload(item), room=sid)
                 break
+        else:
+            if unidecode(artist_name).lower() in session.trimmed_names:
+                # Trimmed from memory but still on the page; the client matches cards by name.
+                self.socketio.emit("refresh_artist", {"Name": artist_name, "Status": status}, room=sid)
 
     # Socket helpers --------------------------------------------------
     def connection(
@@ -482,9 +930,17 @@ class DataHandler:
         user_id: Optional[int],
         is_admin: bool = False,
         auto_approve_artist_requests: bool = False,
+        *,
+        resume_token: Optional[str] = None,
+        known_cards: int = 0,
     ) -> None:
-        """Initialize socket session state and emit current user capability flags."""
+        """Initialize (or resume) socket session state and emit current user capability flags.
+
+        ``known_cards`` is how many artist cards the reconnecting client still shows; a resumed
+        session only replays the cards after those.
+        """
 
+        resumed = self._resume_session(sid, user_id, resume_token)
         session = self.ensure_session(sid, user_id, is_admin, auto_approve_artist_requests)
         self._sync_session_permissions(session)
         # Send user info to frontend
@@ -499,15 +955,24 @@ class DataHandler:
             },
             room=sid,
         )
-        if session.recommended_artists:
-            self.socketio.emit("more_artists_loaded", session.recommended_artists, room=sid)
+        self.socketio.emit(
+            "session_token",
+            {"token": session.resume_token, "resumed": resumed is not None},
+            room=sid,
+        )
+        if resumed is None:
+            if known_cards:
+                self.socketio.emit("clear", room=sid)
+            replay = session.recommended_artists
+        else:
+            replay = session.recommended_artists[max(0, known_cards - session.cards_trimmed):]
+        if replay:
+            emit_card_chunks(self.socketio, sid, [card_payload(card) for card in replay], self.card_chunk_size)
+        if resumed is not None and session.initial_batch_sent:
+            has_more = session.similar_artist_batch_pointer < len(session.similar_artist_candidates)
+            self.socketio.emit("initial_load_complete", {"hasMore": has_more}, room=sid)
         if session.lidarr_items:
-            payload = {
-                "Status": "Success",
-                "Data": session.lidarr_items,
-                "Running": session.running,
-            }
-            self.socketio.emit("lidarr_sidebar_update", payload, room=sid)
+            self._emit_sidebar_success(sid, session, snapshot=True)
         self.emit_personal_sources_state(sid)
 
     def side_bar_opened(self, sid: str) -> None:
@@ -515,44 +980,149 @@ class DataHandler:
         if not session.lidarr_items:
             items = self._copy_cached_lidarr_items()
             if items:
-                session.lidarr_items = items
-                session.cleaned_lidarr_items = self._copy_cached_cleaned_names()
+                session.set_sidebar_items(items, self._copy_cached_cleaned_names())
         if session.lidarr_items:
-            payload = {
-                "Status": "Success",
-                "Data": session.lidarr_items,
-                "Running": session.running,
-            }
-            self.socketio.emit("lidarr_sidebar_update", payload, room=sid)
+            self._emit_sidebar_success(sid, session)
         self.emit_personal_sources_state(sid)
 
+    def resync_sidebar(self, sid: str) -> None:
+        """Resend the full sidebar snapshot after the client lost track of the version."""
+        session = self.ensure_session(sid)
+        if not session.lidarr_items:
+            session.set_sidebar_items(self._copy_cached_lidarr_items(), self._copy_cached_cleaned_names())
+        self._emit_sidebar_success(sid, session, snapshot=True)
+
+    # Library index -------------------------------------------------
+    def _active_sessions(self) -> List[SessionState]:
+        return self.sessions.local_values()
+
+    def _propagate_library_change(self, *, added: Optional[str] = None, removed: Optional[str] = None) -> None:
+        """Apply one library change to every session sidebar and push the resulting delta."""
+        for session in self._active_sessions():
+            if not session.lidarr_items:
+                continue
+            changes: Dict[str, Any] = {}
+            if added:
+                item = session.add_sidebar_item(added)
+                if item is not None:
+                    changes["Added"] = [dict(item)]
+            if removed:
+                item = session.remove_sidebar_item(removed)
+                if item is not None:
+                    changes["Removed"] = [item["name"]]
+            if changes and session.sidebar_snapshot is not None:
+                self._emit_sidebar_success(session.sid, session, changes=changes)
+
+    @staticmethod
+    def _webhook_artist_name(payload: Dict[str, Any]) -> str:
+        artist = payload.get("artist") or {}
+        if not isinstance(artist, dict):
+            return ""
+        return str(artist.get("name") or artist.get("artistName") or "").strip()
+
+    def apply_lidarr_webhook(self, payload: Dict[str, Any]) -> str:
+        """Apply a Lidarr ArtistAdd/ArtistDelete webhook to the library index.
+
+        Returns the outcome (``added``, ``removed``, ``unchanged``, ``test`` or ``ignored``).
+        """
+        event_type = str(payload.get("eventType") or "").strip()
+        if event_type == "Test":
+            return "test"
+        if event_type not in {"ArtistAdd", "ArtistDelete"}:
+            return "ignored"
+        artist_name = LibraryIndex.display_name(self._webhook_artist_name(payload))
+        if not artist_name:
+            return "ignored"
+
+        if event_type == "ArtistAdd":
+            if not self.library_index.add(artist_name):
+                return "unchanged"
+            self.logger.info("Lidarr webhook: artist '%s' added to library index.", artist_name)
+            self._propagate_library_change(added=artist_name)
+            return "added"
+
+        removed_name = self.library_index.remove(artist_name)
+        if removed_name is None:
+            return "unchanged"
+        self.logger.info("Lidarr webhook: artist '%s' removed from library index.", removed_name)
+        self._propagate_library_change(removed=removed_name)
+        return "removed"
+
+    def _fetch_lidarr_artist_names(
+        self,
+        settings: Optional[SettingsSnapshot] = None,
+    ) -> Tuple[Optional[List[str]], Dict[str, List[str]], requests.Response]:
+        """Fetch every artist from Lidarr with its genres; names are None when Lidarr answered with an error."""
+        settings = settings or self.settings
+        endpoint = f"{settings.lidarr_address}/api/v1/artist"
+        headers = {"X-Api-Key": settings.lidarr_api_key}
+        response = requests.get(endpoint, headers=headers, timeout=settings.lidarr_api_timeout)
+        if response.status_code != 200:
+            return None, {}, response
+        names: List[str] = []
+        genres: Dict[str, List[str]] = {}
+        for artist in response.json():
+            name = unidecode(artist["artistName"], replace_str=" ")
+            names.append(name)
+            if artist.get("genres"):
+                genres[name] = list(artist["genres"])
+        names.sort(key=lambda value: value.lower())
+        return names, genres, response
+
+    def sync_library_from_lidarr(self) -> bool:
+        """Run a full library sync and reconcile every open sidebar with the result."""
+        settings = self.settings
+        if not settings.lidarr_address:
+            return False
+        try:
+            names, genres, response = self._fetch_lidarr_artist_names(settings)
+        except Exception as exc:  # pragma: no cover - network errors
+            self.logger.error("Periodic Lidarr library sync failed: %s", exc)
+            return False
+        if names is None:
+            self.logger.error("Periodic Lidarr library sync failed with status %s", response.status_code)
+            return False
+        self.library_index.replace(names, genres=genres)
+        self.library_summary()
+        for session in self._active_sessions():
+            if not session.lidarr_items:
+                continue
+            checked = {item["name"] for item in session.lidarr_items if item.get("checked")}
+            session.set_sidebar_items(
+                [{"name": name, "checked": name in checked} for name in self.library_index.names()],
+                self._copy_cached_cleaned_names(),
+            )
+            if session.sidebar_snapshot is not None:
+                self._emit_sidebar_success(session.sid, session)
+        return True
+
+    def run_library_sync_loop(self, interval_seconds: float) -> None:
+        """Background safety net that fully resyncs the library; webhooks handle the common case."""
+        while True:
+            self.socketio.sleep(interval_seconds)
+            self.task_scheduler.submit(
+                self.sync_library_from_lidarr,
+                owner=SYSTEM_OWNER,
+                priority=PRIORITY_MAINTENANCE,
+                key="library_sync",
+            )
+
     # Lidarr interactions ---------------------------------------------
     def get_artists_from_lidarr(self, sid: str, checked: bool = False) -> None:
         session = self.ensure_session(sid)
         try:
-            endpoint = f"{self.lidarr_address}/api/v1/artist"
-            headers = {"X-Api-Key": self.lidarr_api_key}
-            response = requests.get(endpoint, headers=headers, timeout=self.lidarr_api_timeout)
-            if response.status_code == 200:
-                full_list = response.json()
-                names = [unidecode(artist["artistName"], replace_str=" ") for artist in full_list]
-                names.sort(key=lambda value: value.lower())
-
-                with self.cache_lock:
-                    self.cached_lidarr_names = names
-                    self.cached_cleaned_lidarr_names = [name.lower() for name in names]
-
-                session.lidarr_items = [{"name": name, "checked": checked} for name in names]
-                session.cleaned_lidarr_items = self._copy_cached_cleaned_names()
-                status = "Success"
-                data = session.lidarr_items
-            else:
-                status = "Error"
-                data = response.text
+            names, genres, response = self._fetch_lidarr_artist_names()
+            if names is not None:
+                self.library_index.replace(names, genres=genres)
+                self.library_summary()
+
+                session.set_sidebar_items(self._copy_cached_lidarr_items(checked), self._copy_cached_cleaned_names())
+                self._emit_sidebar_success(sid, session, snapshot=True)
+                return
             payload = {
-                "Status": status,
-                "Code": response.status_code if status == "Error" else None,
-                "Data": data,
+                "Status": "Error",
+                "Code": response.status_code,
+                "Data": response.text,
                 "Running": session.running,
             }
         except Exception as exc:  # pragma: no cover - network errors
@@ -571,8 +1141,7 @@ class DataHandler:
         if not session.lidarr_items:
             cached = self._copy_cached_lidarr_items()
             if cached:
-                session.lidarr_items = cached
-                session.cleaned_lidarr_items = self._copy_cached_cleaned_names()
+                session.set_sidebar_items(cached, self._copy_cached_cleaned_names())
             else:
                 self.get_artists_from_lidarr(sid)
                 session = self.ensure_session(sid)
@@ -580,6 +1149,7 @@ class DataHandler:
                     return
 
         selection = set(selected_artists or [])
+        self._leave_shared_discovery(session)
         session.prepare_for_search()
         session.artists_to_use_in_search = []
 
@@ -608,29 +1178,245 @@ class DataHandler:
             )
             return
 
+        leader = self._share_discovery(session, sid, discovery_key("lidarr", session.artists_to_use_in_search))
+        if leader is not None:
+            self._mirror_shared_run(session, sid, leader)
+            return
+
+        token = session.cancel_token
         self.socketio.emit("clear", room=sid)
-        payload = {
-            "Status": "Success",
-            "Data": session.lidarr_items,
-            "Running": session.running,
-        }
-        self.socketio.emit("lidarr_sidebar_update", payload, room=sid)
+        self._emit_sidebar_success(sid, session)
 
-        self.prepare_similar_artist_candidates(session)
+        try:
+            self.prepare_similar_artist_candidates(session, token=token)
+        except CancelledError:
+            return
         with session.search_lock:
-            self.load_similar_artist_batch(session, sid)
+            if token.cancelled:
+                return
+            self.load_similar_artist_batch(session, sid, token=token)
 
-    def _emit_ai_prompt_error(self, sid: str, message: str) -> None:
-        """Emit a standardized AI prompt error payload."""
+    def _emit_ai_prompt_error(self, sid: str, message: str, session: Optional[SessionState] = None) -> None:
+        """Emit a standardized AI prompt error payload; with ``session``, to every tab of its shared run."""
         self.socketio.emit(
             "ai_prompt_error",
             {
                 "message": message,
             },
-            room=sid,
+            room=self._discovery_target(session, sid) if session is not None else sid,
         )
+        if session is not None:
+            self._end_shared_discovery(session)
 
-    def ai_prompt(self, sid: str, prompt: str) -> None:
+    def _generate_ai_seeds(
+        self,
+        recommender: OpenAIRecommender,
+        prompt_text: str,
+        library_artists: List[str],
+        token: CancellationToken,
+        *,
+        refresh: bool = False,
+    ) -> Tuple[Iterable[str], bool]:
+        """Return ``(seeds, cached)`` for a prompt, answering repeats from :attr:`ai_seed_cache`.
+
+        On a cache miss with streaming enabled, ``seeds`` is a lazy iterator that yields each artist
+        as soon as the completion names it. Otherwise it is a list; identical prompts arriving
+        together then share one provider call. ``refresh`` skips the cache lookup but still stores
+        the fresh answer.
+        """
+        cache = self.ai_seed_cache
+        cache_key: Optional[str] = None
+        library_summary = self.library_summary() or None
+        if cache.enabled:
+            cache_key = SeedCache.key(
+                prompt_text,
+                model=getattr(recommender, "model", ""),
+                base_url=getattr(recommender, "base_url", None),
+                max_seed_artists=getattr(recommender, "max_seed_artists", self.openai_max_seed_artists),
+                library_preview=(
+                    library_summary.splitlines()
+                    if library_summary
+                    else OpenAIRecommender.library_preview(library_artists)
+                ),
+            )
+            if not refresh:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached, True
+
+        if self.llm_stream_seeds and callable(getattr(recommender, "stream_seed_artists", None)):
+            stream = self._iter_streamed_ai_seeds(
+                recommender, prompt_text, library_artists, token, cache_key, library_summary
+            )
+            return stream, False
+
+        def _generate(run_token: Optional[CancellationToken] = None) -> List[str]:
+            seeds = self._request_ai_seeds(
+                recommender, prompt_text, library_artists, library_summary, token=run_token
+            )
+            seeds = list(
+                self._validated_ai_seeds(
+                    seeds, recommender, prompt_text, library_artists, library_summary, token=run_token
+                )
+            )
+            if cache_key is not None:
+                cache.put(cache_key, seeds)
+            return seeds
+
+        if cache_key is None:
+            if self._async_llm(recommender):
+                # The request waits on the shared event loop, so no worker thread is needed here.
+                return _generate(token), False
+            return token.run(_generate), False
+
+        seeds, _ = token.run(self._ai_seed_flights.do, cache_key, _generate)
+        return list(seeds or []), False
+
+    def _iter_streamed_ai_seeds(
+        self,
+        recommender: OpenAIRecommender,
+        prompt_text: str,
+        library_artists: List[str],
+        token: CancellationToken,
+        cache_key: Optional[str],
+        library_summary: Optional[str],
+    ) -> Iterable[str]:
+        received: List[str] = []
+        if self._async_llm(recommender, "astream_seed_artists"):
+            streamed = self.llm_loop.iterate(
+                recommender.astream_seed_artists(prompt_text, library_artists, library_summary=library_summary),
+                token=token,
+            )
+        else:
+            stream_func = recommender.stream_seed_artists
+            streamed = token.iterate(stream_func, prompt_text, library_artists, library_summary=library_summary)
+        validated = self._validated_ai_seeds(
+            streamed, recommender, prompt_text, library_artists, library_summary, token=token
+        )
+        for name in validated:
+            received.append(name)
+            yield name
+        if cache_key is not None:
+            self.ai_seed_cache.put(cache_key, received)
+
+    def _async_llm(self, recommender: Any, method: str = "agenerate_seed_artists") -> bool:
+        return self.llm_loop is not None and callable(getattr(recommender, method, None))
+
+    def _request_ai_seeds(
+        self,
+        recommender: OpenAIRecommender,
+        prompt_text: str,
+        library_artists: List[str],
+        library_summary: Optional[str],
+        *,
+        token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """One seed request, awaited on :attr:`llm_loop` when possible; cancelling ``token`` aborts it."""
+        if self._async_llm(recommender):
+            request = recommender.agenerate_seed_artists(
+                prompt_text, library_artists, library_summary=library_summary
+            )
+            return self.llm_loop.run(request, token=token)
+        if token is None:
+            return recommender.generate_seed_artists(prompt_text, library_artists, library_summary=library_summary)
+        return token.run(
+            recommender.generate_seed_artists, prompt_text, library_artists, library_summary=library_summary
+        )
+
+    def _artist_exists(self, artist_name: str) -> Optional[bool]:
+        """One Last.fm getInfo call: True if the artist exists, False if unknown, None if undetermined."""
+        try:
+            self._lastfm_network().get_artist(artist_name).get_listener_count()
+        except pylast.WSError as exc:
+            if str(getattr(exc, "status", "")) == str(pylast.STATUS_INVALID_PARAMS):
+                return False
+            return None
+        except Exception:  # pragma: no cover - network errors
+            return None
+        return True
+
+    def _validated_ai_seeds(
+        self,
+        seeds: Iterable[str],
+        recommender: OpenAIRecommender,
+        prompt_text: str,
+        library_artists: List[str],
+        library_summary: Optional[str],
+        *,
+        token: Optional[CancellationToken] = None,
+    ) -> Iterable[str]:
+        """Drop LLM seeds no catalog knows, then ask the LLM once for replacements of the dropped ones."""
+        validator = self.artist_validator
+        if validator is None or not self.last_fm_api_key:
+            yield from seeds
+            return
+
+        suggested: List[str] = []
+        unknown: List[str] = []
+
+        def _remember(names: Iterable[str]) -> Iterable[str]:
+            for name in names:
+                suggested.append(name)
+                yield name
+
+        yield from validator.iter_valid(_remember(seeds), unknown=unknown, token=token)
+        if not unknown:
+            return
+
+        self.logger.info(
+            "LLM suggested %d unknown artist(s), asking for replacements: %s", len(unknown), ", ".join(unknown)
+        )
+        follow_up = build_replacement_prompt(prompt_text, unknown, suggested)
+        try:
+            replacements = self._request_ai_seeds(
+                recommender, follow_up, library_artists, library_summary, token=token
+            )
+        except CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - network errors
+            self.logger.warning("Replacement request for unknown AI seeds failed: %s", exc)
+            return
+        already = {validator.normalize(name) for name in suggested}
+        fresh = [name for name in replacements or [] if validator.normalize(name) not in already][: len(unknown)]
+        yield from validator.iter_valid(fresh, token=token)
+
+    def _iter_remaining_ai_seeds(
+        self,
+        session: SessionState,
+        sid: str,
+        first_seed: str,
+        seed_stream: Iterator[str],
+        cleaned_library_names: set[str],
+        skipped_existing: List[str],
+    ) -> Iterable[str]:
+        """Yield streamed AI seeds not in the library, then report the final seed list once complete."""
+        yield first_seed
+        try:
+            for seed in seed_stream:
+                if unidecode(seed).lower() in cleaned_library_names:
+                    skipped_existing.append(seed)
+                    continue
+                yield seed
+        except CancelledError:
+            return
+        except Exception as exc:  # pragma: no cover - network errors mid-stream
+            self.logger.warning("AI seed stream ended early: %s", exc)
+
+        self.socketio.emit(
+            "ai_prompt_seeds",
+            {"seeds": list(session.ai_seed_artists)},
+            room=self._discovery_target(session, sid),
+        )
+        if skipped_existing:
+            self.logger.info(
+                "Filtered %d AI seed(s) already present in Lidarr: %s",
+                len(skipped_existing),
+                ", ".join(skipped_existing),
+            )
+            toast_message = self._format_skipped_seed_message(skipped_existing, "AI suggestion")
+            self._emit_toast(sid, "Skipping known artists", toast_message)
+
+    def ai_prompt(self, sid: str, prompt: str, refresh: bool = False) -> None:
         session = self.ensure_session(sid)
         prompt_text = (prompt or "").strip()
         if not prompt_text:
@@ -640,16 +1426,23 @@ class DataHandler:
             )
             return
 
-        if not self.openai_recommender:
+        tag_seeds: List[str] = []
+        if self.ai_tag_index_first and not refresh:
+            tag_seeds = self.tag_index.lookup(
+                prompt_text,
+                limit=self.openai_max_seed_artists,
+                exclude=self.library_index.__contains__,
+            )
+
+        if not self.openai_recommender and not tag_seeds:
             self._emit_ai_prompt_error(
                 sid,
                 "AI assistant isn't configured yet. Add an LLM API key or base URL in settings.",
             )
             return
 
-        with self.cache_lock:
-            library_artists = list(self.cached_lidarr_names)
-            cleaned_library_names = set(self.cached_cleaned_lidarr_names)
+        library_artists = self.library_index.names()
+        cleaned_library_names = set(self.library_index.cleaned_names())
 
         prompt_preview = prompt_text if len(prompt_text) <= 120 else f"{prompt_text[:117]}..."
         model_name = getattr(self.openai_recommender, "model", "unknown")
@@ -662,9 +1455,46 @@ class DataHandler:
             prompt_preview,
         )
 
+        leader = self._share_discovery(session, sid, discovery_key("ai", [prompt_text]))
+        if leader is not None:
+            self.logger.info("AI prompt joined the run already streaming in another tab")
+            if leader.running:
+                # Before that the leader is still waiting on the LLM; its ack reaches this tab through the run room.
+                self.socketio.emit("ai_prompt_ack", {"seeds": list(leader.ai_seed_artists)}, room=sid)
+            self._mirror_shared_run(session, sid, leader)
+            return
+
         start_time = time.perf_counter()
+        token = session.begin_run()
+        if tag_seeds:
+            self.logger.info(
+                "AI prompt answered from the local tag index with %d seed artists: %s",
+                len(tag_seeds),
+                ", ".join(tag_seeds),
+            )
+            self._start_ai_discovery(session, sid, token, tag_seeds, tag_seeds)
+            return
+
+        seed_stream: Optional[Iterator[str]] = None
         try:
-            seeds = self.openai_recommender.generate_seed_artists(prompt_text, library_artists)
+            seeds, cached = self._generate_ai_seeds(
+                self.openai_recommender,
+                prompt_text,
+                library_artists,
+                token,
+                refresh=refresh,
+            )
+            if not isinstance(seeds, list):
+                # Streaming: wait only for the first seed not already in the library.
+                seed_stream = iter(seeds)
+                seeds = []
+                for seed in seed_stream:
+                    seeds.append(seed)
+                    if unidecode(seed).lower() not in cleaned_library_names:
+                        break
+        except CancelledError:
+            self.logger.info("AI prompt cancelled after %.2fs", time.perf_counter() - start_time)
+            return
         except Exception as exc:  # pragma: no cover - network errors
             elapsed = time.perf_counter() - start_time
             self.logger.error("AI prompt failed after %.2fs: %s", elapsed, exc)
@@ -673,6 +1503,7 @@ class DataHandler:
             self._emit_ai_prompt_error(
                 sid,
                 timeout_message if "timed out" in str(exc).lower() else generic_message,
+                session,
             )
             return
 
@@ -682,6 +1513,7 @@ class DataHandler:
             self._emit_ai_prompt_error(
                 sid,
                 "The AI couldn't suggest any artists from that request. Try adding genre or artist hints.",
+                session,
             )
             return
 
@@ -697,36 +1529,61 @@ class DataHandler:
             self._emit_ai_prompt_error(
                 sid,
                 "All suggested artists are already in your Lidarr library. Try a different prompt.",
+                session,
             )
             return
 
-        if skipped_existing:
+        elapsed = time.perf_counter() - start_time
+        if seed_stream is not None:
+            self.logger.info("AI prompt streamed its first seed artist in %.2fs", elapsed)
+            stream_seeds: Iterable[str] = self._iter_remaining_ai_seeds(
+                session,
+                sid,
+                filtered_seeds[0],
+                seed_stream,
+                cleaned_library_names,
+                skipped_existing,
+            )
+        else:
+            if skipped_existing:
+                self.logger.info(
+                    "Filtered %d AI seed(s) already present in Lidarr: %s",
+                    len(skipped_existing),
+                    ", ".join(skipped_existing),
+                )
+                toast_message = self._format_skipped_seed_message(skipped_existing, "AI suggestion")
+                self._emit_toast(sid, "Skipping known artists", toast_message)
             self.logger.info(
-                "Filtered %d AI seed(s) already present in Lidarr: %s",
-                len(skipped_existing),
-                ", ".join(skipped_existing),
+                "AI prompt succeeded in %.2fs with %d seed artists%s",
+                elapsed,
+                len(filtered_seeds),
+                " (cached)" if cached else "",
             )
-            toast_message = self._format_skipped_seed_message(skipped_existing, "AI suggestion")
-            self._emit_toast(sid, "Skipping known artists", toast_message)
+            stream_seeds = filtered_seeds
 
-        elapsed = time.perf_counter() - start_time
-        self.logger.info("AI prompt succeeded in %.2fs with %d seed artists", elapsed, len(filtered_seeds))
+        self._start_ai_discovery(session, sid, token, stream_seeds, filtered_seeds)
 
-        session.prepare_for_search()
-        success = self._stream_seed_artists(
+    def _start_ai_discovery(
+        self,
+        session: SessionState,
+        sid: str,
+        token: CancellationToken,
+        stream_seeds: Iterable[str],
+        ack_seeds: List[str],
+    ) -> None:
+        session.prepare_for_search(token)
+        self._stream_seed_artists(
             session,
             sid,
-            filtered_seeds,
+            stream_seeds,
             ack_event="ai_prompt_ack",
-            ack_payload={"seeds": filtered_seeds},
+            ack_payload={"seeds": ack_seeds},
             error_event="ai_prompt_error",
             error_message="We couldn't load those artists from our data sources. Try refining your request.",
             missing_title="Missing artist data",
             missing_message="Some AI picks couldn't be fully loaded.",
             source_log_label="AI",
         )
-        if not success:
-            return
 
     def _fetch_lastfm_personal_artists(self, username: str) -> List[str]:
         if not self.last_fm_user_service:
@@ -737,11 +1594,20 @@ class DataHandler:
         return [artist.name for artist in recommendations if getattr(artist, "name", None)]
 
     def _fetch_listenbrainz_personal_artists(self, username: str) -> List[str]:
+        return self._load_listenbrainz_personal_seeds(username)[0]
+
+    def _load_listenbrainz_personal_seeds(self, username: str) -> Tuple[List[str], Optional[float]]:
+        """Weekly exploration artists, cached until the next weekly playlist is due."""
         if not self.listenbrainz_user_service:
-            return []
+            return [], None
         playlist_artists = self.listenbrainz_user_service.get_weekly_exploration_artists(username)
         names = playlist_artists.artists if playlist_artists else []
-        return [name for name in names if name]
+        expires_at: Optional[float] = None
+        next_refresh_at = getattr(playlist_artists, "next_refresh_at", None)
+        if next_refresh_at is not None:
+            # A playlist past its week is re-checked hourly until the new one is published.
+            expires_at = max(next_refresh_at.timestamp(), time.time() + PERSONAL_SEED_RECHECK_SECONDS)
+        return [name for name in names if name], expires_at
 
     def _personal_source_definitions(self) -> Dict[str, Dict[str, Any]]:
         """Return source-specific metadata and loaders for personal recommendations."""
@@ -770,6 +1636,7 @@ class DataHandler:
                     "Add your ListenBrainz username under Profile → Listening services to use this feature."
                 ),
                 "fetch": self._fetch_listenbrainz_personal_artists,
+                "load": self._load_listenbrainz_personal_seeds,
                 "error_message": "We couldn't reach ListenBrainz right now. Please try again shortly.",
             },
         }
@@ -780,11 +1647,34 @@ class DataHandler:
         source_key: str,
         config: Dict[str, Any],
         username: str,
+        *,
+        token: Optional[CancellationToken] = None,
+        session: Optional[SessionState] = None,
     ) -> Optional[List[str]]:
-        """Fetch raw personal recommendation seeds for the selected integration source."""
+        """Fetch raw personal recommendation seeds for the selected integration source.
+
+        Answers from :attr:`personal_seed_cache` when possible; a stale entry is returned at once and
+        refreshed in the background.
+        """
         source_label = config["label"]
+        cached = self.personal_seed_cache.get(source_key, username)
+        if cached is not None:
+            seeds, stale = cached
+            if stale:
+                self._schedule_personal_seed_refresh(source_key, username)
+            self.logger.info(
+                "Using cached %s seeds for %s%s", source_label, username, " (refreshing)" if stale else ""
+            )
+            return seeds
         try:
-            return config["fetch"](username)
+            if token is not None:
+                seeds, expires_at = token.run(self._load_personal_seeds, config, username)
+            else:
+                seeds, expires_at = self._load_personal_seeds(config, username)
+            self.personal_seed_cache.put(source_key, username, seeds, expires_at=expires_at)
+            return seeds
+        except CancelledError:
+            return None
         except ListenBrainzIntegrationError as exc:  # pragma: no cover - network errors
             self.logger.error("Failed to load ListenBrainz picks for %s: %s", username, exc)
         except Exception as exc:  # pragma: no cover - network errors
@@ -794,9 +1684,46 @@ class DataHandler:
             source_key,
             config["error_message"],
             title=config["title"],
+            session=session,
         )
         return None
 
+    @staticmethod
+    def _load_personal_seeds(config: Dict[str, Any], username: str) -> Tuple[List[str], Optional[float]]:
+        """Return ``(seeds, expires_at)``; sources without their own expiry use the cache default."""
+        load = config.get("load")
+        if load is not None:
+            return load(username)
+        return config["fetch"](username), None
+
+    def _schedule_personal_seed_refresh(self, source_key: str, username: str) -> None:
+        cache = self.personal_seed_cache
+        if not cache.claim_refresh(source_key, username):
+            return
+        submitted = self.task_scheduler.submit(
+            self._refresh_personal_seeds,
+            source_key,
+            username,
+            owner=SYSTEM_OWNER,
+            priority=PRIORITY_PREFETCH,
+            key=f"personal_seeds:{cache.key(source_key, username)}",
+        )
+        if not submitted:
+            cache.release_refresh(source_key, username)
+
+    def _refresh_personal_seeds(self, source_key: str, username: str) -> None:
+        """Background revalidation of a stale personal seed entry; failures keep serving the old seeds."""
+        try:
+            config = self._personal_source_definitions().get(source_key)
+            if not config or not config["service_ready"]:
+                return
+            seeds, expires_at = self._load_personal_seeds(config, username)
+            self.personal_seed_cache.put(source_key, username, seeds, expires_at=expires_at)
+        except Exception as exc:  # pragma: no cover - network errors
+            self.logger.warning("Background refresh of %s seeds for %s failed: %s", source_key, username, exc)
+        finally:
+            self.personal_seed_cache.release_refresh(source_key, username)
+
     def _ensure_cleaned_library_names(self, session: SessionState, sid: str) -> set[str]:
         """Ensure per-session normalized Lidarr names are available for seed filtering."""
         if not session.cleaned_lidarr_items:
@@ -810,17 +1737,62 @@ class DataHandler:
             session.cleaned_lidarr_items = cleaned
         return set(session.cleaned_lidarr_items)
 
-    def _emit_sidebar_success(self, sid: str, session: SessionState) -> None:
-        """Broadcast the latest sidebar payload after recommendation processing."""
-        self.socketio.emit(
-            "lidarr_sidebar_update",
-            {
-                "Status": "Success",
-                "Data": session.lidarr_items,
-                "Running": session.running,
-            },
-            room=sid,
-        )
+    @staticmethod
+    def _build_sidebar_delta(previous: Dict[str, bool], current: Dict[str, bool]) -> Dict[str, List[Any]]:
+        """Diff two sidebar snapshots into added, removed and checked-state changes."""
+        delta: Dict[str, List[Any]] = {
+            "Added": [],
+            "Removed": [],
+            "Checked": [],
+            "Unchecked": [],
+        }
+        for name, checked in current.items():
+            if name not in previous:
+                delta["Added"].append({"name": name, "checked": checked})
+            elif previous[name] != checked:
+                delta["Checked" if checked else "Unchecked"].append(name)
+        delta["Removed"] = [name for name in previous if name not in current]
+        return {key: values for key, values in delta.items() if values}
+
+    def _emit_sidebar_success(
+        self,
+        sid: str,
+        session: SessionState,
+        *,
+        snapshot: bool = False,
+        changes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Emit the sidebar state, sending only changes once the client holds a snapshot.
+
+        ``changes`` is an already known delta (``Added`` items, ``Removed`` names); it is applied
+        to the stored snapshot instead of diffing the whole sidebar.
+        """
+        previous = session.sidebar_snapshot
+        if changes is not None and previous is not None and not snapshot:
+            current = dict(previous)
+            for name in changes.get("Removed", ()):
+                current.pop(name, None)
+            for item in changes.get("Added", ()):
+                current[item["name"]] = bool(item.get("checked"))
+        else:
+            current = {item["name"]: bool(item.get("checked")) for item in session.lidarr_items}
+            changes = None
+        base_version = session.sidebar_version
+        session.sidebar_version += 1
+        payload: Dict[str, Any] = {
+            "Status": "Success",
+            "Version": session.sidebar_version,
+            "Running": session.running,
+        }
+        if snapshot or previous is None:
+            payload["Mode"] = "snapshot"
+            payload["Data"] = session.lidarr_items
+        else:
+            payload["Mode"] = "delta"
+            payload["BaseVersion"] = base_version
+            payload.update(changes if changes is not None else self._build_sidebar_delta(previous, current))
+        session.sidebar_snapshot = current
+        self.socketio.emit("lidarr_sidebar_update", payload, room=sid)
 
     def _emit_all_personal_recommendations_known(
         self,
@@ -840,13 +1812,14 @@ class DataHandler:
                 "seeds": [],
                 "skipped": list(skipped_existing),
             },
-            room=sid,
+            room=self._discovery_target(session, sid),
         )
         self._emit_personal_error(
             sid,
             source_key,
             "All recommended artists are already in your Lidarr library.",
             title=title,
+            session=session,
         )
         session.mark_stopped()
         self._emit_sidebar_success(sid, session)
@@ -898,11 +1871,25 @@ class DataHandler:
         source_label = config["label"]
         username_display = username
 
+        leader = self._share_discovery(session, sid, discovery_key(source_key, [username]))
+        if leader is not None:
+            if leader.running:
+                self.socketio.emit(
+                    "user_recs_ack",
+                    {"source": source_key, "username": username_display, "seeds": list(leader.ai_seed_artists), "skipped": []},
+                    room=sid,
+                )
+            self._mirror_shared_run(session, sid, leader)
+            return
+
+        token = session.begin_run()
         seeds = self._fetch_personal_recommendation_seeds(
             sid,
             source_key,
             config,
             username,
+            token=token,
+            session=session,
         )
         if seeds is None:
             return
@@ -923,6 +1910,7 @@ class DataHandler:
                 source_key,
                 f"{source_label} didn't return any usable artists for your profile.",
                 title=config["title"],
+                session=session,
             )
             return
 
@@ -955,7 +1943,7 @@ class DataHandler:
             )
             self._emit_toast(sid, "Skipping known artists", toast_message)
 
-        session.prepare_for_search()
+        session.prepare_for_search(token)
         success = self._stream_seed_artists(
             session,
             sid,
@@ -983,13 +1971,11 @@ class DataHandler:
 
     def stop(self, sid: str) -> None:
         session = self.ensure_session(sid)
+        leader = self._shared_leader(session)
+        if leader is not None:
+            leader.mark_stopped()
         session.mark_stopped()
-        payload = {
-            "Status": "Success",
-            "Data": session.lidarr_items,
-            "Running": session.running,
-        }
-        self.socketio.emit("lidarr_sidebar_update", payload, room=sid)
+        self._emit_sidebar_success(sid, session)
 
     @staticmethod
     def _parse_similarity_match(raw_match: Any) -> Optional[float]:
@@ -1000,57 +1986,95 @@ class DataHandler:
             return None
 
     @staticmethod
-    def _similar_artist_sort_key(item: Dict[str, Any]) -> Tuple[float, str]:
+    def _similar_artist_sort_key(item: SimilarCandidate) -> Tuple[float, str]:
         """Sort similar candidates by descending match, then normalized artist name."""
-        match_value = item["match"] if item["match"] is not None else -1.0
-        normalized_name = unidecode(item["artist"].item.name).lower()
-        return (-match_value, normalized_name)
+        match_value = item.match if item.match is not None else -1.0
+        return (-match_value, item.key)
 
     def _collect_similar_candidates(
         self,
         session: SessionState,
-    ) -> List[Dict[str, Any]]:
-        """Collect deduplicated similar-artist candidates for the current session seeds."""
-        lfm = pylast.LastFMNetwork(
-            api_key=self.last_fm_api_key,
-            api_secret=self.last_fm_api_secret,
-        )
-        candidates: List[Dict[str, Any]] = []
+        *,
+        token: Optional[CancellationToken] = None,
+    ) -> List[SimilarCandidate]:
+        """Collect deduplicated similar-artist candidates for the current session seeds.
+
+        Last.fm lookups go through ``token`` when given and raise :class:`CancelledError` once it fires.
+        """
+        lfm = self._lastfm_network()
+        candidates: List[SimilarCandidate] = []
         seen_candidates: set[str] = set()
         seed_names = {unidecode(name).lower() for name in session.ai_seed_artists}
         for artist_name in session.artists_to_use_in_search:
-            try:
-                related_artists = lfm.get_artist(artist_name).get_similar()
-            except Exception:
-                continue
-            for related_artist in related_artists:
-                cleaned_artist = unidecode(related_artist.item.name).lower()
-                already_known = cleaned_artist in session.cleaned_lidarr_items
-                already_seen = cleaned_artist in seen_candidates
-                seeded_artist = cleaned_artist in seed_names
+            similar = self.similar_artist_cache.get(artist_name)
+            if similar is None:
+                try:
+                    get_similar = lfm.get_artist(artist_name).get_similar
+                    related_artists = token.run(get_similar) if token is not None else get_similar()
+                except Exception:
+                    continue
+                similar = [
+                    (related.item.name, self._parse_similarity_match(getattr(related, "match", None)))
+                    for related in related_artists
+                ]
+                if similar:
+                    self.similar_artist_cache.put(artist_name, similar)
+            for related_name, match in similar:
+                candidate = SimilarCandidate(related_name, match)
+                already_known = candidate.key in session.cleaned_lidarr_items
+                already_seen = candidate.key in seen_candidates
+                seeded_artist = candidate.key in seed_names
                 if already_known or already_seen or seeded_artist:
                     continue
-                seen_candidates.add(cleaned_artist)
-                candidates.append(
-                    {
-                        "artist": related_artist,
-                        "match": self._parse_similarity_match(getattr(related_artist, "match", None)),
-                    }
-                )
-                if len(candidates) >= 500:
+                seen_candidates.add(candidate.key)
+                candidates.append(candidate)
+                if len(candidates) >= self.session_max_candidates:
                     return candidates
         return candidates
 
-    def prepare_similar_artist_candidates(self, session: SessionState) -> None:
+    def prepare_similar_artist_candidates(
+        self,
+        session: SessionState,
+        *,
+        token: Optional[CancellationToken] = None,
+    ) -> None:
         session.similar_artist_candidates = []
         session.similar_artist_batch_pointer = 0
         session.initial_batch_sent = False
-        session.similar_artist_candidates = self._collect_similar_candidates(session)
-        session.similar_artist_candidates.sort(key=self._similar_artist_sort_key)
+        candidates = self._collect_similar_candidates(session, token=token)
+        candidates.sort(key=self._similar_artist_sort_key)
+        session.similar_artist_candidates = candidates
 
-    def load_similar_artist_batch(self, session: SessionState, sid: str) -> None:
-        if session.stop_event.is_set():
-            session.mark_stopped()
+    def _card_emitter(
+        self,
+        session: SessionState,
+        target: str,
+        sid: str,
+        token: Optional[CancellationToken] = None,
+    ) -> CardEmitter:
+        """Card emitter for a stream; ack-based flow control only applies when ``target`` is the socket."""
+        return CardEmitter(
+            self.socketio,
+            target,
+            window=self.card_coalesce_window,
+            chunk_size=self.card_chunk_size,
+            ack_window=self.card_ack_window if target == sid else 0,
+            ack_timeout=self.card_ack_timeout,
+            acks=session.card_acks,
+            cancel_token=token,
+        )
+
+    def load_similar_artist_batch(
+        self,
+        session: SessionState,
+        sid: str,
+        *,
+        token: Optional[CancellationToken] = None,
+    ) -> None:
+        token = token or session.cancel_token
+        if session.stop_event.is_set() or token.cancelled:
+            if session.cancel_token is token:
+                session.mark_stopped()
             return
 
         batch_size = max(1, int(self.similar_artist_batch_size))
@@ -1058,33 +2082,34 @@ class DataHandler:
         batch_end = batch_start + batch_size
         batch = session.similar_artist_candidates[batch_start:batch_end]
 
+        target = self._discovery_target(session, sid)
         if not batch:
             session.mark_stopped()
-            self.socketio.emit("load_more_complete", {"hasMore": False}, room=sid)
+            self.socketio.emit("load_more_complete", {"hasMore": False}, room=target)
             return
 
-        lfm_network = pylast.LastFMNetwork(
-            api_key=self.last_fm_api_key,
-            api_secret=self.last_fm_api_secret,
-        )
+        lfm_network = self._lastfm_network()
 
-        existing_names = {unidecode(item["Name"]).lower() for item in session.recommended_artists}
+        existing_names = session.recommended_names()
+        emitter = self._card_emitter(session, target, sid, token)
 
         for candidate in batch:
-            if session.stop_event.is_set():
+            if session.stop_event.is_set() or token.cancelled:
                 break
-            related_artist = candidate["artist"]
-            similarity_score = candidate.get("match")
-            artist_name = related_artist.item.name
-            normalized = unidecode(artist_name).lower()
+            similarity_score = candidate.match
+            artist_name = candidate.name
+            normalized = candidate.key
             if normalized in existing_names:
                 continue
             try:
-                artist_payload = self._fetch_artist_payload(
+                artist_payload = token.run(
+                    self._fetch_artist_payload,
                     lfm_network,
                     artist_name,
                     similarity_score=similarity_score,
                 )
+            except CancelledError:
+                break
             except Exception as exc:  # pragma: no cover - network errors
                 self.logger.error("Error building payload for %s: %s", artist_name, exc)
                 continue
@@ -1093,20 +2118,28 @@ class DataHandler:
                 self.logger.error("Artist payload missing for %s", artist_name)
                 continue
 
-            session.recommended_artists.append(artist_payload)
+            self._append_recommended_card(session, artist_payload)
             existing_names.add(normalized)
-            self.socketio.emit("more_artists_loaded", [artist_payload], room=sid)
+            emitter.add(card_payload(artist_payload))
 
+        emitter.flush()
+        if session.cancel_token is not token:
+            # A newer search replaced this run; its state and events belong to that run now.
+            return
         session.similar_artist_batch_pointer += len(batch)
         has_more = session.similar_artist_batch_pointer < len(session.similar_artist_candidates)
         event_name = "initial_load_complete" if not session.initial_batch_sent else "load_more_complete"
-        self.socketio.emit(event_name, {"hasMore": has_more}, room=sid)
+        self.socketio.emit(event_name, {"hasMore": has_more}, room=target)
         session.initial_batch_sent = True
         if not has_more:
             session.mark_stopped()
 
     def find_similar_artists(self, sid: str) -> None:
         session = self.ensure_session(sid)
+        leader = self._shared_leader(session)
+        if leader is not None:
+            # Tabs sharing a run page through the leader's candidates; results reach every tab.
+            session, sid = leader, leader.sid
         if session.stop_event.is_set():
             return
         with session.search_lock:
@@ -1125,55 +2158,199 @@ class DataHandler:
                 )
                 session.mark_stopped()
 
+    # Shared discovery ----------------------------------------------
+    def _enter_room(self, sid: str, room: str) -> None:
+        server = getattr(self.socketio, "server", None)
+        if server is not None:
+            server.enter_room(sid, room, namespace="/")
+
+    def _leave_room(self, sid: str, room: str) -> None:
+        server = getattr(self.socketio, "server", None)
+        if server is not None:
+            server.leave_room(sid, room, namespace="/")
+
+    def _shared_group(self, session: SessionState) -> Optional[SharedDiscovery]:
+        if not session.shared_discovery:
+            return None
+        with self.shared_discoveries_lock:
+            return self.shared_discoveries.get((session.user_id, session.shared_discovery))
+
+    def _shared_leader(self, session: SessionState) -> Optional[SessionState]:
+        """Return the session computing this tab's shared run, when another tab leads it."""
+        group = self._shared_group(session)
+        if group is None or group.leader_sid == session.sid:
+            return None
+        return self.sessions.get_local(group.leader_sid)
+
+    def _discovery_target(self, session: SessionState, sid: str) -> str:
+        """Room that receives a session's discovery stream: the shared run room or the socket itself."""
+        group = self._shared_group(session)
+        return group.room if group is not None else sid
+
+    def _append_recommended_card(self, session: SessionState, card: ArtistCard) -> None:
+        session.recommended_artists.append(card)
+        group = self._shared_group(session)
+        if group is None:
+            return
+        for member_sid in list(group.members):
+            if member_sid == session.sid:
+                continue
+            member = self.sessions.get_local(member_sid)
+            if member is not None:
+                member.recommended_artists.append(card)
+
+    def _share_discovery(self, session: SessionState, sid: str, key: str) -> Optional[SessionState]:
+        """Attach ``session`` to its user's run for ``key``.
+
+        Returns the leader session when another tab already computes that run (the caller then
+        mirrors it instead of starting its own); otherwise registers ``session`` as the leader.
+        """
+        self._leave_shared_discovery(session)
+        if not self.share_discovery or not session.user_id or session.synthetic:
+            return None
+        group_key = (session.user_id, key)
+        with self.shared_discoveries_lock:
+            group = self.shared_discoveries.get(group_key)
+            leader = self.sessions.get_local(group.leader_sid) if group is not None else None
+            if leader is None:
+                group = SharedDiscovery(session.user_id, key, sid)
+                self.shared_discoveries[group_key] = group
+            else:
+                group.members.append(sid)
+        session.shared_discovery = key
+        self._enter_room(sid, group.room)
+        return leader
+
+    def _mirror_shared_run(self, session: SessionState, sid: str, leader: SessionState) -> None:
+        """Serve a joining tab the leader's cards so far; later cards arrive through the run room."""
+        session.recommended_artists = list(leader.recommended_artists)
+        session.artists_to_use_in_search = list(leader.artists_to_use_in_search)
+        session.ai_seed_artists = list(leader.ai_seed_artists)
+        session.initial_batch_sent = leader.initial_batch_sent
+        session.running = leader.running
+        self.socketio.emit("clear", room=sid)
+        emit_card_chunks(
+            self.socketio,
+            sid,
+            [card_payload(card) for card in session.recommended_artists],
+            self.card_chunk_size,
+        )
+        if leader.initial_batch_sent:
+            has_more = leader.similar_artist_batch_pointer < len(leader.similar_artist_candidates)
+            self.socketio.emit("initial_load_complete", {"hasMore": has_more}, room=sid)
+        self._emit_sidebar_success(sid, session)
+
+    def _end_shared_discovery(self, session: SessionState) -> None:
+        """Dissolve a failed shared run so none of its tabs waits on it or joins it again."""
+        key = session.shared_discovery
+        if not key:
+            return
+        with self.shared_discoveries_lock:
+            group = self.shared_discoveries.pop((session.user_id, key), None)
+        session.shared_discovery = None
+        if group is None:
+            return
+        for member_sid in group.members:
+            member = self.sessions.get_local(member_sid)
+            if member is not None and member.shared_discovery == key:
+                member.shared_discovery = None
+            self._leave_room(member_sid, group.room)
+
+    def _leave_shared_discovery(self, session: SessionState) -> None:
+        """Detach a tab from its shared run, handing the run to another tab if it was leading."""
+        key = session.shared_discovery
+        if not key:
+            return
+        session.shared_discovery = None
+        successor: Optional[SessionState] = None
+        with self.shared_discoveries_lock:
+            group = self.shared_discoveries.get((session.user_id, key))
+            if group is None or session.sid not in group.members:
+                return
+            group.members.remove(session.sid)
+            if not group.members:
+                del self.shared_discoveries[(session.user_id, key)]
+            elif group.leader_sid == session.sid:
+                group.leader_sid = group.members[0]
+                successor = self.sessions.get_local(group.leader_sid)
+        self._leave_room(session.sid, group.room)
+        if successor is None:
+            return
+        successor.similar_artist_candidates = list(session.similar_artist_candidates)
+        successor.similar_artist_batch_pointer = session.similar_artist_batch_pointer
+        successor.initial_batch_sent = session.initial_batch_sent
+        if session.running:
+            # The departing tab's in-flight batch is cancelled; settle the remaining tabs' spinners.
+            has_more = successor.similar_artist_batch_pointer < len(successor.similar_artist_candidates)
+            event_name = "initial_load_complete" if not successor.initial_batch_sent else "load_more_complete"
+            self.socketio.emit(event_name, {"hasMore": has_more}, room=group.room)
+            successor.initial_batch_sent = True
+        successor.running = False
+        if session.stop_event.is_set():
+            successor.stop_event.set()
+        else:
+            successor.stop_event.clear()
+
     # Lidarr artist creation ------------------------------------------
-    def _build_lidarr_add_payload(self, artist_name: str, artist_folder: str, mbid: str) -> Dict[str, Any]:
-        """Build Lidarr artist-creation payload from the current runtime settings."""
-        monitored_flag = bool(self.lidarr_monitored)
+    def _build_lidarr_add_payload(
+        self,
+        artist_name: str,
+        artist_folder: str,
+        mbid: str,
+        settings: Optional[SettingsSnapshot] = None,
+    ) -> Dict[str, Any]:
+        """Build Lidarr artist-creation payload from one settings snapshot (the current one by default)."""
+        settings = settings or self.settings
+        monitored_flag = bool(settings.lidarr_monitored)
         add_options: Dict[str, Any] = {
-            "searchForMissingAlbums": bool(self.search_for_missing_albums),
+            "searchForMissingAlbums": bool(settings.search_for_missing_albums),
             "monitored": monitored_flag,
         }
-        if self.lidarr_monitor_option:
-            add_options["monitor"] = self.lidarr_monitor_option
-        if self.lidarr_albums_to_monitor:
-            add_options["albumsToMonitor"] = list(self.lidarr_albums_to_monitor)
+        if settings.lidarr_monitor_option:
+            add_options["monitor"] = settings.lidarr_monitor_option
+        if settings.lidarr_albums_to_monitor:
+            add_options["albumsToMonitor"] = list(settings.lidarr_albums_to_monitor)
         payload: Dict[str, Any] = {
             "ArtistName": artist_name,
-            "qualityProfileId": self.quality_profile_id,
-            "metadataProfileId": self.metadata_profile_id,
-            "path": os.path.join(self.root_folder_path, artist_folder, ""),
-            "rootFolderPath": self.root_folder_path,
+            "qualityProfileId": settings.quality_profile_id,
+            "metadataProfileId": settings.metadata_profile_id,
+            "path": os.path.join(settings.root_folder_path, artist_folder, ""),
+            "rootFolderPath": settings.root_folder_path,
             "foreignArtistId": mbid,
             "monitored": monitored_flag,
             "addOptions": add_options,
         }
-        if self.lidarr_monitor_new_items:
-            payload["monitorNewItems"] = self.lidarr_monitor_new_items
+        if settings.lidarr_monitor_new_items:
+            payload["monitorNewItems"] = settings.lidarr_monitor_new_items
         return payload
 
     def _submit_lidarr_add_request(
         self,
         payload: Dict[str, Any],
+        settings: Optional[SettingsSnapshot] = None,
     ) -> Tuple[Optional[requests.Response], int]:
         """Create an artist in Lidarr and return both response object and status code."""
-        if self.dry_run_adding_to_lidarr:
+        settings = settings or self.settings
+        if settings.dry_run_adding_to_lidarr:
             return None, 201
-        lidarr_url = f"{self.lidarr_address}/api/v1/artist"
-        headers = {"X-Api-Key": self.lidarr_api_key}
+        lidarr_url = f"{settings.lidarr_address}/api/v1/artist"
+        headers = {"X-Api-Key": settings.lidarr_api_key}
         response = requests.post(
             lidarr_url,
             headers=headers,
             json=payload,
-            timeout=self.lidarr_api_timeout,
+            timeout=settings.lidarr_api_timeout,
         )
         return response, response.status_code
 
     def _extract_lidarr_error_message(
         self,
         response: Optional[requests.Response],
+        settings: Optional[SettingsSnapshot] = None,
     ) -> Tuple[str, Optional[Any], str]:
         """Extract error body, payload and message from a failed Lidarr add response."""
-        if self.dry_run_adding_to_lidarr:
+        settings = settings or self.settings
+        if settings.dry_run_adding_to_lidarr:
             response_body = "Dry-run mode: no request sent."
             error_payload = None
         elif response is not None:
@@ -1204,9 +2381,11 @@ class DataHandler:
         artist_folder: str,
         response_status: int,
         response: Optional[requests.Response],
+        settings: Optional[SettingsSnapshot] = None,
     ) -> str:
         """Map Lidarr failure details into the frontend status labels."""
-        response_body, error_payload, error_message = self._extract_lidarr_error_message(response)
+        settings = settings or self.settings
+        response_body, error_payload, error_message = self._extract_lidarr_error_message(response, settings)
         self.logger.error(
             "Failed to add artist '%s' to Lidarr (status=%s). Body: %s",
             artist_name,
@@ -1222,20 +2401,16 @@ class DataHandler:
         if "Invalid Path" in error_message:
             self.logger.info(
                 "Path '%s' reported invalid by Lidarr.",
-                os.path.join(self.root_folder_path, artist_folder, ""),
+                os.path.join(settings.root_folder_path, artist_folder, ""),
             )
             return "Invalid Path"
         return FAILED_TO_ADD_STATUS
 
     def _record_added_artist(self, session: SessionState, artist_name: str) -> None:
         """Persist a successfully added artist in both per-session and cached lists."""
-        session.lidarr_items.append({"name": artist_name, "checked": False})
-        normalized = unidecode(artist_name).lower()
-        session.cleaned_lidarr_items.append(normalized)
-        with self.cache_lock:
-            if artist_name not in self.cached_lidarr_names:
-                self.cached_lidarr_names.append(artist_name)
-                self.cached_cleaned_lidarr_names.append(normalized)
+        self.library_index.add(artist_name)
+        self._propagate_library_change(added=artist_name)
+        session.add_sidebar_item(artist_name)
 
     def _perform_artist_addition(
         self,
@@ -1243,10 +2418,14 @@ class DataHandler:
         sid: str,
         artist_name: str,
         artist_folder: str,
+        on_stage: Optional[Callable[[str], None]] = None,
     ) -> str:
-        """Run the Lidarr add flow and return the final status string."""
-        musicbrainzngs.set_useragent(self.app_name, self.app_rev, self.app_url)
-        mbid = self.get_mbid_from_musicbrainz(artist_name)
+        """Run the Lidarr add flow against one settings snapshot and return the final status string."""
+        settings = self.settings
+        if on_stage is not None:
+            on_stage(ADD_JOB_RESOLVING)
+        musicbrainzngs.set_useragent(settings.app_name, settings.app_rev, settings.app_url)
+        mbid = self.get_mbid_from_musicbrainz(artist_name, settings)
         if not mbid:
             self.logger.warning("No MusicBrainz match found for '%s'; cannot add to Lidarr.", artist_name)
             self._emit_toast(
@@ -1256,17 +2435,26 @@ class DataHandler:
             )
             return FAILED_TO_ADD_STATUS
 
-        payload = self._build_lidarr_add_payload(artist_name, artist_folder, mbid)
-        response, response_status = self._submit_lidarr_add_request(payload)
+        payload = self._build_lidarr_add_payload(artist_name, artist_folder, mbid, settings)
+        if on_stage is not None:
+            on_stage(ADD_JOB_ADDING)
+        # Different spellings can resolve to the same MBID; only one POST per MBID may be in flight.
+        (response, response_status), joined = self._add_flights.do(
+            f"mbid:{mbid}",
+            lambda: self._submit_lidarr_add_request(payload, settings),
+        )
         if response_status == 201:
             self.logger.info("Artist '%s' added successfully to Lidarr.", artist_name)
-            self._record_added_artist(session, artist_name)
+            # Only the spelling that made the POST is indexed; a follower's spelling would be an alias.
+            if not joined:
+                self._record_added_artist(session, artist_name)
             return "Added"
         return self._resolve_lidarr_add_failure_status(
             artist_name,
             artist_folder,
             response_status,
             response,
+            settings,
         )
 
     def _validate_artist_add_permissions(
@@ -1296,18 +2484,189 @@ class DataHandler:
 
         session = self.ensure_session(sid)
         artist_name = urllib.parse.unquote(raw_artist_name)
-        artist_folder = artist_name.replace("/", " ")
-        status = FAILED_TO_ADD_STATUS
 
-        if not self._validate_artist_add_permissions(session, sid, artist_name, status):
+        if not self._validate_artist_add_permissions(session, sid, artist_name, FAILED_TO_ADD_STATUS):
+            return FAILED_TO_ADD_STATUS
+
+        if not self.add_queue.running:
+            return self._execute_artist_addition(session, sid, artist_name)
+
+        job_id = self.add_queue.enqueue(artist_name, user_id=session.user_id, sid=sid, track=True)
+        return self.add_queue.wait_for(job_id, DEFAULT_ADD_WAIT_TIMEOUT) or "Queued"
+
+    def enqueue_artist_addition(self, sid: str, raw_artist_name: str) -> None:
+        """Queue an artist addition without waiting for Lidarr; progress arrives via ``refresh_artist``."""
+
+        if not self.add_queue.running:
+            self.socketio.start_background_task(self.add_artists, sid, raw_artist_name)
+            return
+
+        session = self.ensure_session(sid)
+        artist_name = urllib.parse.unquote(raw_artist_name)
+        if not self._validate_artist_add_permissions(session, sid, artist_name, FAILED_TO_ADD_STATUS):
+            return
+        self.add_queue.enqueue(artist_name, user_id=session.user_id, sid=sid)
+
+    def bulk_add_artists(self, sid: str, raw_artist_names: Sequence[str]) -> None:
+        """Add (or request) a batch of artists after a single permission check.
+
+        Artists already in the library index are marked immediately, for both adds and approval
+        requests; the rest are queued together so the add workers resolve and submit them at the
+        configured pace.
+        """
+
+        session = self.ensure_session(sid)
+        if not session.user_id:
+            self._emit_toast(sid, "Authentication Error", "You must be logged in to add artists.")
+            return
+        artist_names = self._dedupe_names(
+            [urllib.parse.unquote(str(name)) for name in raw_artist_names or []]
+        )[:MAX_BULK_ARTISTS]
+        if not artist_names:
+            return
+
+        pending: List[str] = []
+        known: List[str] = []
+        for artist_name in artist_names:
+            if artist_name in self.library_index:
+                known.append(artist_name)
+                self.notify_artist_status(session.user_id, sid, artist_name, "Already in Lidarr")
+            else:
+                pending.append(artist_name)
+
+        if not self._can_add_without_approval(session):
+            if pending:
+                self._request_artists_bulk(session, sid, pending)
+            return
+
+        if pending:
+            self._emit_toast(
+                sid,
+                "Bulk Add",
+                f"Adding {len(pending)} artist(s) to Lidarr"
+                + (f"; {len(known)} already in your library." if known else "."),
+            )
+        if self.add_queue.running:
+            self.add_queue.enqueue_many(pending, user_id=session.user_id, sid=sid)
+            return
+        for artist_name in pending:
+            self._execute_artist_addition(session, sid, artist_name)
+
+    def _request_artists_bulk(self, session: SessionState, sid: str, artist_names: Sequence[str]) -> None:
+        """Create pending requests for every artist without one, in a single transaction."""
+
+        try:
+            if self._flask_app is not None:
+                with self._flask_app.app_context():
+                    created = self._create_pending_requests(session.user_id, artist_names)
+            else:
+                created = self._create_pending_requests(session.user_id, artist_names)
+        except Exception as exc:
+            self.logger.exception("Unexpected error while requesting %d artists", len(artist_names))
+            self._emit_toast(sid, "Failed to Request Artists", f"Error requesting artists: {exc}")
+            return
+
+        for artist_name in artist_names:
+            self.notify_artist_status(session.user_id, sid, artist_name, "Requested")
+        self._emit_toast(
+            sid,
+            "Requests Submitted",
+            f"Submitted {created} request(s) for approval"
+            + (f"; {len(artist_names) - created} were already pending." if created < len(artist_names) else "."),
+        )
+
+    @staticmethod
+    def _create_pending_requests(user_id: Optional[int], artist_names: Sequence[str]) -> int:
+        existing = {
+            row.artist_name
+            for row in ArtistRequest.query.filter(
+                ArtistRequest.requested_by_id == user_id,
+                ArtistRequest.status == "pending",
+                ArtistRequest.artist_name.in_(list(artist_names)),
+            ).all()
+        }
+        new_requests = [
+            ArtistRequest(artist_name=artist_name, requested_by_id=user_id, status="pending")
+            for artist_name in artist_names
+            if artist_name not in existing
+        ]
+        if new_requests:
+            db.session.add_all(new_requests)
+            db.session.commit()
+        return len(new_requests)
+
+    def run_add_job(
+        self,
+        artist_name: str,
+        user_id: Optional[int],
+        sid: Optional[str],
+        *,
+        on_stage: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Execute one queued addition, even when the requesting socket has since disconnected."""
+
+        session = self.get_session_if_exists(sid) if sid else None
+        if session is None:
+            session = SessionState(sid=sid or "", user_id=user_id)
+        return self._execute_artist_addition(session, session.sid, artist_name, on_stage=on_stage)
+
+    def notify_artist_status(
+        self,
+        user_id: Optional[int],
+        sid: Optional[str],
+        artist_name: str,
+        status: str,
+    ) -> None:
+        """Refresh an artist card on the requesting socket and on the user's other open sessions."""
+
+        targets = [
+            session
+            for session in self._active_sessions()
+            if session.sid == sid or (user_id is not None and session.user_id == user_id)
+        ]
+        for session in targets:
+            self._refresh_recommended_artist_status(session, session.sid, artist_name, status)
+
+    def _execute_artist_addition(
+        self,
+        session: SessionState,
+        sid: str,
+        artist_name: str,
+        *,
+        on_stage: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Add one artist, attaching to an identical in-flight addition instead of repeating it."""
+
+        if artist_name in self.library_index:
+            status = "Already in Lidarr"
+            self.notify_artist_status(session.user_id, sid, artist_name, status)
             return status
 
+        status, joined = self._add_flights.do(
+            f"name:{LibraryIndex.normalize(artist_name)}",
+            lambda: self._run_artist_addition(session, sid, artist_name, on_stage),
+        )
+        if joined:
+            self.logger.info("Joined in-flight Lidarr addition for '%s': %s", artist_name, status)
+            self.notify_artist_status(session.user_id, sid, artist_name, status)
+        return status
+
+    def _run_artist_addition(
+        self,
+        session: SessionState,
+        sid: str,
+        artist_name: str,
+        on_stage: Optional[Callable[[str], None]],
+    ) -> str:
+        artist_folder = artist_name.replace("/", " ")
+        status = FAILED_TO_ADD_STATUS
         try:
             status = self._perform_artist_addition(
                 session,
                 sid,
                 artist_name,
                 artist_folder,
+                on_stage=on_stage,
             )
         except Exception as exc:  # pragma: no cover - network errors
             self.logger.exception("Unexpected error while adding '%s' to Lidarr", artist_name)
@@ -1317,7 +2676,7 @@ class DataHandler:
                 f"Error adding '{artist_name}': {exc}",
             )
         finally:
-            self._refresh_recommended_artist_status(session, sid, artist_name, status)
+            self.notify_artist_status(session.user_id, sid, artist_name, status)
 
         return status
 
@@ -1337,7 +2696,7 @@ class DataHandler:
             return
 
         if self._can_add_without_approval(session):
-            self.add_artists(sid, raw_artist_name)
+            self.enqueue_artist_addition(sid, raw_artist_name)
             return
 
         artist_name = urllib.parse.unquote(raw_artist_name)
@@ -1361,11 +2720,7 @@ class DataHandler:
             )
         finally:
             # Update the artist status in the UI
-            for item in session.recommended_artists:
-                if item["Name"] == artist_name:
-                    item["Status"] = "Requested"
-                    self.socketio.emit("refresh_artist", item, room=sid)
-                    break
+            self._refresh_recommended_artist_status(session, sid, artist_name, "Requested")
 
     def _request_artist_db_operations(self, sid: str, artist_name: str, session) -> None:
         # Check if request already exists
@@ -1410,31 +2765,32 @@ class DataHandler:
     # Settings --------------------------------------------------------
     def load_settings(self, sid: str) -> None:
         try:
+            settings = self.settings
             data = {
-                "lidarr_address": self.lidarr_address,
-                "lidarr_api_key": self.lidarr_api_key,
-                "root_folder_path": self.root_folder_path,
-                "youtube_api_key": self.youtube_api_key,
-                "quality_profile_id": self.quality_profile_id,
-                "metadata_profile_id": self.metadata_profile_id,
-                "lidarr_api_timeout": self.lidarr_api_timeout,
-                "fallback_to_top_result": self.fallback_to_top_result,
-                "search_for_missing_albums": self.search_for_missing_albums,
-                "dry_run_adding_to_lidarr": self.dry_run_adding_to_lidarr,
-                "lidarr_monitor_option": self.lidarr_monitor_option,
-                "lidarr_monitored": self.lidarr_monitored,
-                "lidarr_monitor_new_items": self.lidarr_monitor_new_items,
-                "lidarr_albums_to_monitor": "\n".join(self.lidarr_albums_to_monitor) if self.lidarr_albums_to_monitor else "",
-                "last_fm_api_key": self.last_fm_api_key,
-                "last_fm_api_secret": self.last_fm_api_secret,
-                "auto_start": self.auto_start,
-                "auto_start_delay": self.auto_start_delay,
-                "openai_api_key": self.openai_api_key,
-                "openai_model": self.openai_model,
-                "openai_api_base": self.openai_api_base,
-                "openai_extra_headers": self.openai_extra_headers,
-                "openai_max_seed_artists": self.openai_max_seed_artists,
-                "api_key": self.api_key,
+                "lidarr_address": settings.lidarr_address,
+                "lidarr_api_key": settings.lidarr_api_key,
+                "root_folder_path": settings.root_folder_path,
+                "youtube_api_key": settings.youtube_api_key,
+                "quality_profile_id": settings.quality_profile_id,
+                "metadata_profile_id": settings.metadata_profile_id,
+                "lidarr_api_timeout": settings.lidarr_api_timeout,
+                "fallback_to_top_result": settings.fallback_to_top_result,
+                "search_for_missing_albums": settings.search_for_missing_albums,
+                "dry_run_adding_to_lidarr": settings.dry_run_adding_to_lidarr,
+                "lidarr_monitor_option": settings.lidarr_monitor_option,
+                "lidarr_monitored": settings.lidarr_monitored,
+                "lidarr_monitor_new_items": settings.lidarr_monitor_new_items,
+                "lidarr_albums_to_monitor": "\n".join(settings.lidarr_albums_to_monitor) if settings.lidarr_albums_to_monitor else "",
+                "last_fm_api_key": settings.last_fm_api_key,
+                "last_fm_api_secret": settings.last_fm_api_secret,
+                "auto_start": settings.auto_start,
+                "auto_start_delay": settings.auto_start_delay,
+                "openai_api_key": settings.openai_api_key,
+                "openai_model": settings.openai_model,
+                "openai_api_base": settings.openai_api_base,
+                "openai_extra_headers": settings.openai_extra_headers,
+                "openai_max_seed_artists": settings.openai_max_seed_artists,
+                "api_key": settings.api_key,
             }
             self.socketio.emit("settingsLoaded", data, room=sid)
         except Exception as exc:
@@ -1442,40 +2798,17 @@ class DataHandler:
 
     def update_settings(self, data: dict) -> None:
         try:
-            self._apply_string_settings(data)
-            self._apply_int_settings(data)
-            self._apply_float_settings(data)
-            self._apply_bool_settings(data)
-            self.openai_extra_headers = self._normalize_openai_headers_field(
-                self.openai_extra_headers
-            )
-
-            if "lidarr_monitor_option" in data:
-                self.lidarr_monitor_option = self._normalize_monitor_option(data.get("lidarr_monitor_option"))
-
-            if "lidarr_monitor_new_items" in data:
-                self.lidarr_monitor_new_items = self._normalize_monitor_new_items(
-                    data.get("lidarr_monitor_new_items")
-                )
-
-            if "lidarr_albums_to_monitor" in data:
-                self.lidarr_albums_to_monitor = self._parse_albums_to_monitor(
-                    data.get("lidarr_albums_to_monitor")
-                )
-
-            if self.similar_artist_batch_size <= 0:
-                self.similar_artist_batch_size = 1
-            if self.openai_max_seed_artists <= 0:
-                self.openai_max_seed_artists = DEFAULT_MAX_SEED_ARTISTS
-            if self.auto_start_delay < 0:
-                self.auto_start_delay = 0
+            previous, settings = self._publish_settings(lambda current: self._stage_settings(data, current))
+            changed = settings.changed_fields(previous)
 
             # Update Flask app config with API_KEY
             if self._flask_app:
-                self._flask_app.config['API_KEY'] = self.api_key
+                self._flask_app.config['API_KEY'] = settings.api_key
 
-            self._configure_openai_client()
-            self._configure_listening_services()
+            if changed & OPENAI_SETTINGS:
+                self._configure_openai_client()
+            if changed & LISTENING_SETTINGS:
+                self._configure_listening_services()
             self.save_config_to_file()
             self.broadcast_personal_sources_state()
         except Exception as exc:
@@ -1487,10 +2820,7 @@ class DataHandler:
         try:
             preview_info: dict | str
             biography = None
-            lfm = pylast.LastFMNetwork(
-                api_key=self.last_fm_api_key,
-                api_secret=self.last_fm_api_secret,
-            )
+            lfm = self._lastfm_network()
             search_results = lfm.search_for_artist(artist_name)
             artists = search_results.get_next_page()
             cleaned_artist_name = unidecode(artist_name).lower()
@@ -1522,10 +2852,7 @@ class DataHandler:
 
     def _fetch_lastfm_top_tracks(self, artist_name: str) -> List[Any]:
         """Fetch top Last.fm tracks for an artist, returning an empty list on network errors."""
-        lfm = pylast.LastFMNetwork(
-            api_key=self.last_fm_api_key,
-            api_secret=self.last_fm_api_secret,
-        )
+        lfm = self._lastfm_network()
         try:
             artist = lfm.get_artist(artist_name)
             return artist.get_top_tracks(limit=10)
@@ -1636,13 +2963,17 @@ class DataHandler:
 
     # Utilities -------------------------------------------------------
     @staticmethod
-    def _extract_top_genres(artist_obj: Any) -> str:
-        """Extract up to five title-cased top tag names for a Last.fm artist object."""
+    def _fetch_top_tags(artist_obj: Any) -> List[Tuple[str, Any]]:
+        """Return ``(tag, weight)`` pairs for a Last.fm artist object, strongest first."""
         try:
-            tags = [tag.item.get_name().title() for tag in artist_obj.get_top_tags()[:5]]
+            return [(tag.item.get_name(), getattr(tag, "weight", 0)) for tag in artist_obj.get_top_tags()]
         except Exception:
-            tags = []
-        return ", ".join(tags) or "Unknown Genre"
+            return []
+
+    @staticmethod
+    def _format_top_genres(top_tags: Sequence[Tuple[str, Any]]) -> str:
+        """Up to five title-cased tag names for an artist card."""
+        return ", ".join(name.title() for name, _ in top_tags[:5]) or "Unknown Genre"
 
     @staticmethod
     def _safe_artist_metric(artist_obj: Any, attr: str) -> int:
@@ -1696,71 +3027,108 @@ class DataHandler:
         artist_name: str,
         *,
         similarity_score: Optional[float] = None,
-    ) -> Optional[dict]:
+    ) -> Optional[ArtistCard]:
         try:
             artist_obj = lfm_network.get_artist(artist_name)
         except Exception as exc:  # pragma: no cover - network errors
             self.logger.error("Failed to load artist '%s' from Last.fm: %s", artist_name, exc)
             return None
 
-        genres = self._extract_top_genres(artist_obj)
+        top_tags = self._fetch_top_tags(artist_obj)
+        genres = self._format_top_genres(top_tags)
         listeners = self._safe_artist_metric(artist_obj, "get_listener_count")
         play_count = self._safe_artist_metric(artist_obj, "get_playcount")
         img_link = self._resolve_artist_image(artist_name)
 
-        similarity_label = None
         clamped_similarity = None
         if similarity_score is not None:
             clamped_similarity = max(0.0, min(1.0, similarity_score))
-            similarity_label = f"Similarity: {clamped_similarity * 100:.1f}%"
 
         display_name = self._resolve_display_artist_name(artist_obj, artist_name)
-
-        return {
-            "Name": display_name,
-            "Genre": genres,
-            "Status": "",
-            "Img_Link": img_link or "https://placehold.co/512x512?text=No+Image",
-            "Popularity": f"Play Count: {self.format_numbers(play_count)}",
-            "Followers": f"Listeners: {self.format_numbers(listeners)}",
-            "SimilarityScore": clamped_similarity,
-            "Similarity": similarity_label,
-        }
+        self.tag_index.add(display_name, top_tags)
+        return ArtistCard(
+            display_name,
+            genre=genres,
+            image=img_link,
+            play_count=play_count,
+            listeners=listeners,
+            similarity=clamped_similarity,
+        )
 
     def _iter_artist_payloads_from_names(
         self,
-        names: Sequence[str],
+        names: Iterable[str],
         *,
         missing: Optional[List[str]] = None,
-    ) -> Iterable[dict]:
+        token: Optional[CancellationToken] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterable[ArtistCard]:
+        """Hydrate artist cards for ``names``, yielding each card as soon as it is built.
+
+        Names are deduplicated by normalized form and up to ``concurrency`` (default
+        :attr:`seed_hydration_concurrency`) are fetched at once, so cards arrive in completion order.
+        Names that could not be loaded are appended to ``missing``.
+        """
         if not names:
             return []
 
-        lfm_network = pylast.LastFMNetwork(
-            api_key=self.last_fm_api_key,
-            api_secret=self.last_fm_api_secret,
-        )
+        lfm_network = self._lastfm_network()
+        workers = self.seed_hydration_concurrency if concurrency is None else max(1, int(concurrency))
 
-        seen: set[str] = set()
+        def _unique_names() -> Iterable[str]:
+            seen: set[str] = set()
+            for raw_name in names:
+                if not raw_name:
+                    continue
+                normalized = unidecode(raw_name).lower()
+                if normalized in seen:
+                    continue
+                seen.add(normalized)
+                yield raw_name
+
+        if workers > 1:
+            fetched = imap_unordered(
+                lambda raw_name: self._fetch_artist_payload(lfm_network, raw_name),
+                _unique_names(),
+                workers=workers,
+                token=token,
+            )
+        else:
+            fetched = self._iter_sequential_artist_payloads(lfm_network, _unique_names(), token)
+
+        try:
+            for raw_name, payload in fetched:
+                if payload:
+                    yield payload
+                elif missing is not None:
+                    missing.append(raw_name)
+        except CancelledError:
+            return
 
+    def _iter_sequential_artist_payloads(
+        self,
+        lfm_network: pylast.LastFMNetwork,
+        names: Iterable[str],
+        token: Optional[CancellationToken],
+    ) -> Iterable[Tuple[str, Optional[ArtistCard]]]:
         for raw_name in names:
-            if not raw_name:
-                continue
-            normalized = unidecode(raw_name).lower()
-            if normalized in seen:
-                continue
-            seen.add(normalized)
-            payload = self._fetch_artist_payload(lfm_network, raw_name)
-            if payload:
-                yield payload
-            elif missing is not None:
-                missing.append(raw_name)
+            if token is None:
+                yield raw_name, self._fetch_artist_payload(lfm_network, raw_name)
+            else:
+                yield raw_name, token.run(self._fetch_artist_payload, lfm_network, raw_name)
+
+    @staticmethod
+    def _record_seed_artists(session: SessionState, seeds: Iterable[str]) -> Iterable[str]:
+        for seed in seeds:
+            session.artists_to_use_in_search.append(seed)
+            session.ai_seed_artists.append(seed)
+            yield seed
 
     def _stream_seed_artists(
         self,
         session: SessionState,
         sid: str,
-        seeds: Sequence[str],
+        seeds: Iterable[str],
         *,
         ack_event: str,
         ack_payload: Dict[str, Any],
@@ -1771,51 +3139,55 @@ class DataHandler:
         source_log_label: str,
     ) -> bool:
         if not session.lidarr_items:
-            session.lidarr_items = self._copy_cached_lidarr_items()
-        if not session.cleaned_lidarr_items:
+            session.set_sidebar_items(
+                self._copy_cached_lidarr_items(),
+                session.cleaned_lidarr_items or self._copy_cached_cleaned_names(),
+            )
+        elif not session.cleaned_lidarr_items:
             session.cleaned_lidarr_items = self._copy_cached_cleaned_names()
 
-        session.artists_to_use_in_search = list(seeds)
-        session.ai_seed_artists = list(seeds)
-
-        self.socketio.emit(ack_event, ack_payload, room=sid)
-        self.socketio.emit("clear", room=sid)
-        self.socketio.emit(
-            "lidarr_sidebar_update",
-            {
-                "Status": "Success",
-                "Data": session.lidarr_items,
-                "Running": session.running,
-            },
-            room=sid,
-        )
+        if isinstance(seeds, (list, tuple)):
+            session.artists_to_use_in_search = list(seeds)
+            session.ai_seed_artists = list(seeds)
+        else:
+            # Streamed seeds are recorded as hydration consumes them.
+            session.artists_to_use_in_search = []
+            session.ai_seed_artists = []
+            seeds = self._record_seed_artists(session, seeds)
+
+        # Tabs that joined the shared run before the seeds existed get their ack here.
+        target = self._discovery_target(session, sid)
+        self.socketio.emit(ack_event, ack_payload, room=target)
+        self.socketio.emit("clear", room=target)
+        self._emit_sidebar_success(sid, session)
 
-        existing_names = {unidecode(item["Name"]).lower() for item in session.recommended_artists}
+        token = session.cancel_token
+        existing_names = session.recommended_names()
         missing_names: List[str] = []
         streamed_any = False
+        emitter = self._card_emitter(session, target, sid, token)
 
-        for payload in self._iter_artist_payloads_from_names(seeds, missing=missing_names):
+        for payload in self._iter_artist_payloads_from_names(seeds, missing=missing_names, token=token):
             normalized = unidecode(payload["Name"]).lower()
             if normalized in existing_names:
                 continue
-            session.recommended_artists.append(payload)
+            self._append_recommended_card(session, payload)
             existing_names.add(normalized)
             streamed_any = True
-            self.socketio.emit("more_artists_loaded", [payload], room=sid)
+            emitter.add(card_payload(payload))
+        emitter.flush()
+
+        if token.cancelled:
+            return False
 
         if not streamed_any:
-            self.logger.error("Failed to build artist cards for %s seeds: %s", source_log_label, list(seeds))
-            self.socketio.emit(error_event, {"message": error_message}, room=sid)
-            session.running = False
-            self.socketio.emit(
-                "lidarr_sidebar_update",
-                {
-                    "Status": "Success",
-                    "Data": session.lidarr_items,
-                    "Running": session.running,
-                },
-                room=sid,
+            self.logger.error(
+                "Failed to build artist cards for %s seeds: %s", source_log_label, list(session.ai_seed_artists)
             )
+            self.socketio.emit(error_event, {"message": error_message}, room=target)
+            self._end_shared_discovery(session)
+            session.running = False
+            self._emit_sidebar_success(sid, session)
             return False
 
         if missing_names:
@@ -1833,11 +3205,14 @@ class DataHandler:
                 room=sid,
             )
 
-        self.prepare_similar_artist_candidates(session)
+        try:
+            self.prepare_similar_artist_candidates(session, token=token)
+        except CancelledError:
+            return False
         has_more = bool(session.similar_artist_candidates)
         session.initial_batch_sent = True
         session.running = False
-        self.socketio.emit("initial_load_complete", {"hasMore": has_more}, room=sid)
+        self.socketio.emit("initial_load_complete", {"hasMore": has_more}, room=target)
         return True
 
     def _normalize_openai_headers_field(self, value: Any) -> str:
@@ -1853,8 +3228,8 @@ class DataHandler:
             return ""
         return str(value)
 
-    def _parse_openai_extra_headers(self) -> Dict[str, str]:
-        raw_value = getattr(self, "openai_extra_headers", "")
+    def _parse_openai_extra_headers(self, settings: Optional[SettingsSnapshot] = None) -> Dict[str, str]:
+        raw_value = (settings or self.settings).openai_extra_headers
         if not raw_value:
             return {}
 
@@ -1883,33 +3258,63 @@ class DataHandler:
         return headers
 
     def _configure_openai_client(self) -> None:
-        api_key = (self.openai_api_key or "").strip()
-        base_url = (self.openai_api_base or "").strip()
+        settings = self.settings
+        api_key = (settings.openai_api_key or "").strip()
+        base_url = (settings.openai_api_base or "").strip()
         env_api_key = os.environ.get("OPENAI_API_KEY", "").strip()
         if not any([api_key, base_url, env_api_key]):
             self.openai_recommender = None
             return
 
-        model = (self.openai_model or "").strip() or None
-        max_seeds = self.openai_max_seed_artists
+        model = (settings.openai_model or "").strip() or None
+        max_seeds = settings.openai_max_seed_artists
         try:
             max_seeds_int = int(max_seeds)
         except (TypeError, ValueError):
             max_seeds_int = DEFAULT_MAX_SEED_ARTISTS
         if max_seeds_int <= 0:
             max_seeds_int = DEFAULT_MAX_SEED_ARTISTS
-        self.openai_max_seed_artists = max_seeds_int
+        if max_seeds_int != max_seeds:
+            self.openai_max_seed_artists = max_seeds_int
 
-        headers_override = self._parse_openai_extra_headers()
+        headers_override = self._parse_openai_extra_headers(settings)
+        hedge_models = getattr(self, "llm_hedge_models", [])
 
         try:
-            self.openai_recommender = OpenAIRecommender(
+            primary = OpenAIRecommender(
                 api_key=api_key or None,
                 model=model,
                 base_url=base_url or None,
                 default_headers=headers_override or None,
                 max_seed_artists=max_seeds_int,
+                # A hedge endpoint covers slow answers; retrying the same model would only add latency.
+                retry_on_timeout=not hedge_models,
             )
+            if not hedge_models:
+                self.openai_recommender = primary
+                return
+            recommenders = [primary]
+            for hedge_model, hedge_base_url in hedge_models:
+                # An entry without a URL is another model on the configured endpoint.
+                hedge_base_url = hedge_base_url or base_url
+                same_endpoint = hedge_base_url == base_url
+                recommenders.append(
+                    OpenAIRecommender(
+                        # Credentials only go to the endpoint they were configured for.
+                        api_key=(api_key or None) if same_endpoint else None,
+                        model=hedge_model,
+                        base_url=hedge_base_url or None,
+                        default_headers=(headers_override or None) if same_endpoint else None,
+                        max_seed_artists=max_seeds_int,
+                        retry_on_timeout=False,
+                    )
+                )
+            if getattr(self, "llm_stream_seeds", False):
+                self.logger.info(
+                    "LLM hedging is enabled (%s); AI prompts wait for a full answer instead of streaming seeds.",
+                    ", ".join(model for model, _ in hedge_models),
+                )
+            self.openai_recommender = HedgedRecommender(recommenders, hedge_delay=self.llm_hedge_delay)
         except Exception as exc:  # pragma: no cover - network/config errors
             self.logger.error("Failed to initialize LLM client: %s", exc)
             self.openai_recommender = None
@@ -1918,51 +3323,28 @@ class DataHandler:
         lastfm_key = (getattr(self, "last_fm_api_key", "") or "").strip()
         lastfm_secret = (getattr(self, "last_fm_api_secret", "") or "").strip()
         if lastfm_key and lastfm_secret:
-            self.last_fm_user_service = LastFmUserService(lastfm_key, lastfm_secret)
+            self.last_fm_user_service = LastFmUserService(
+                lastfm_key,
+                lastfm_secret,
+                workers=getattr(self, "lastfm_similar_concurrency", 8),
+                similar_cache=getattr(self, "similar_artist_cache", None),
+            )
         else:
             self.last_fm_user_service = None
 
+    def _lastfm_network(self) -> pylast.LastFMNetwork:
+        settings = self.settings
+        return pylast.LastFMNetwork(api_key=settings.last_fm_api_key, api_secret=settings.last_fm_api_secret)
+
     def format_numbers(self, count: int) -> str:
-        if count >= 1_000_000:
-            return f"{count / 1_000_000:.1f}M"
-        if count >= 1_000:
-            return f"{count / 1_000:.1f}K"
-        return str(count)
+        return format_count(count)
 
     def save_config_to_file(self) -> None:
         tmp_path: Optional[Path] = None
         try:
             self.settings_config_file.parent.mkdir(parents=True, exist_ok=True)
-            payload = {
-                "lidarr_address": self.lidarr_address,
-                "lidarr_api_key": self.lidarr_api_key,
-                "root_folder_path": self.root_folder_path,
-                "fallback_to_top_result": self.fallback_to_top_result,
-                "lidarr_api_timeout": float(self.lidarr_api_timeout),
-                "quality_profile_id": self.quality_profile_id,
-                "metadata_profile_id": self.metadata_profile_id,
-                "search_for_missing_albums": self.search_for_missing_albums,
-                "dry_run_adding_to_lidarr": self.dry_run_adding_to_lidarr,
-                "lidarr_monitor_option": self.lidarr_monitor_option,
-                "lidarr_monitored": self.lidarr_monitored,
-                "lidarr_albums_to_monitor": self.lidarr_albums_to_monitor,
-                "lidarr_monitor_new_items": self.lidarr_monitor_new_items,
-                "app_name": self.app_name,
-                "app_rev": self.app_rev,
-                "app_url": self.app_url,
-                "last_fm_api_key": self.last_fm_api_key,
-                "last_fm_api_secret": self.last_fm_api_secret,
-                "auto_start": self.auto_start,
-                "auto_start_delay": self.auto_start_delay,
-                "youtube_api_key": self.youtube_api_key,
-                "similar_artist_batch_size": self.similar_artist_batch_size,
-                "openai_api_key": self.openai_api_key,
-                "openai_model": self.openai_model,
-                "openai_api_base": self.openai_api_base,
-                "openai_extra_headers": self.openai_extra_headers,
-                "openai_max_seed_artists": self.openai_max_seed_artists,
-                "api_key": self.api_key,
-            }
+            payload = self.settings.to_dict()
+            payload["lidarr_api_timeout"] = float(payload["lidarr_api_timeout"])
 
             with tempfile.NamedTemporaryFile(
                 mode="w",
@@ -1984,7 +3366,8 @@ class DataHandler:
             if tmp_path and tmp_path.exists():
                 tmp_path.unlink(missing_ok=True)
 
-    def get_mbid_from_musicbrainz(self, artist_name: str) -> Optional[str]:
+    def get_mbid_from_musicbrainz(self, artist_name: str, settings: Optional[SettingsSnapshot] = None) -> Optional[str]:
+        settings = settings or self.settings
         result = musicbrainzngs.search_artists(artist=artist_name)
         mbid = None
 
@@ -2007,7 +3390,7 @@ class DataHandler:
                     )
                     break
             else:
-                if self.fallback_to_top_result and artists:
+                if settings.fallback_to_top_result and artists:
                     mbid = artists[0]["id"]
                     self.logger.info(
                         "Artist '%s' matched '%s' with MBID: %s",
@@ -2195,3 +3578,4 @@ class DataHandler:
         self._configure_openai_client()
         self._configure_listening_services()
         self.save_config_to_file()
+
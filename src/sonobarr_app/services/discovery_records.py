@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, Optional
+
+from unidecode import unidecode
+
+PLACEHOLDER_ARTIST_IMAGE = "https://placehold.co/512x512?text=No+Image"
+
+
+def format_count(count: int) -> str:
+    if count >= 1_000_000:
+        return f"{count / 1_000_000:.1f}M"
+    if count >= 1_000:
+        return f"{count / 1_000:.1f}K"
+    return str(count)
+
+
+class SimilarCandidate:
+    """Similar-artist candidate reduced to what batching needs.
+
+    Holding the name instead of the ``pylast.SimilarItem`` drops the per-item network reference;
+    names and keys are interned because the same artists recur across seeds and sessions.
+    """
+
+    __slots__ = ("name", "key", "match")
+
+    def __init__(self, name: str, match: Optional[float]) -> None:
+        self.name = sys.intern(name)
+        self.key = sys.intern(unidecode(name).lower())
+        self.match = match
+
+    def __repr__(self) -> str:  # pragma: no cover - representation helper
+        return f"<SimilarCandidate {self.name!r} match={self.match}>"
+
+
+class ArtistCard:
+    """Slotted artist card kept in session state; :meth:`to_dict` builds the wire payload.
+
+    Metrics are stored as integers and only formatted when emitted. Item access mirrors the wire
+    keys so code handling cards can treat cards and plain payload dicts alike.
+    """
+
+    __slots__ = ("name", "genre", "status", "image", "play_count", "listeners", "similarity")
+
+    _ATTRIBUTES = {"Name": "name", "Genre": "genre", "Status": "status", "Img_Link": "image"}
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        genre: str = "",
+        status: str = "",
+        image: Optional[str] = None,
+        play_count: int = 0,
+        listeners: int = 0,
+        similarity: Optional[float] = None,
+    ) -> None:
+        self.name = sys.intern(name)
+        self.genre = genre
+        self.status = status
+        self.image = image
+        self.play_count = play_count
+        self.listeners = listeners
+        self.similarity = similarity
+
+    def __getitem__(self, key: str) -> Any:
+        attribute = self._ATTRIBUTES.get(key)
+        if attribute == "image":
+            return self.image or PLACEHOLDER_ARTIST_IMAGE
+        if attribute is not None:
+            return getattr(self, attribute)
+        if key == "Popularity":
+            return f"Play Count: {format_count(self.play_count)}"
+        if key == "Followers":
+            return f"Listeners: {format_count(self.listeners)}"
+        if key == "SimilarityScore":
+            return self.similarity
+        if key == "Similarity":
+            return f"Similarity: {self.similarity * 100:.1f}%" if self.similarity is not None else None
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        attribute = self._ATTRIBUTES.get(key)
+        if attribute is None:
+            raise KeyError(key)
+        setattr(self, attribute, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            key: self[key]
+            for key in ("Name", "Genre", "Status", "Img_Link", "Popularity", "Followers", "SimilarityScore", "Similarity")
+        }
+
+    def __repr__(self) -> str:  # pragma: no cover - representation helper
+        return f"<ArtistCard {self.name!r} status={self.status!r}>"
+
+
+def card_payload(card: Any) -> Dict[str, Any]:
+    """Return the wire dict for a card (plain payload dicts pass through unchanged)."""
+    return card.to_dict() if isinstance(card, ArtistCard) else card
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pylast
 
+from ..parallel import imap_unordered
+from ..similar_cache import SimilarArtistCache, SimilarArtists
+
 
 @dataclass
 class LastFmUserArtist:
@@ -18,15 +22,30 @@ class LastFmUserService:
 
     Note: Last.fm does not expose a public API for "personal recommendations" anymore.
     We approximate recommendations by aggregating similar artists to the user's top artists.
-    This does not require user authentication (only a public username).
+    This does not require user authentication (only a public username). Similar-artist lookups
+    for the top artists run on up to ``workers`` threads and go through ``similar_cache``.
     """
 
-    def __init__(self, api_key: str, api_secret: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        *,
+        workers: int = 8,
+        similar_cache: Optional[SimilarArtistCache] = None,
+    ) -> None:
         self.api_key = api_key
         self.api_secret = api_secret
+        self.workers = max(1, int(workers))
+        self.similar_cache = similar_cache if similar_cache is not None else SimilarArtistCache()
+        self._network: Optional[pylast.LastFMNetwork] = None
+        self._network_lock = threading.Lock()
 
     def _client(self) -> pylast.LastFMNetwork:
-        return pylast.LastFMNetwork(api_key=self.api_key, api_secret=self.api_secret)
+        with self._network_lock:
+            if self._network is None:
+                self._network = pylast.LastFMNetwork(api_key=self.api_key, api_secret=self.api_secret)
+            return self._network
 
     def _safe_get_similar(self, network: pylast.LastFMNetwork, artist_name: str):
         """Return similar artists for a base artist without raising transport errors."""
@@ -35,6 +54,25 @@ class LastFmUserService:
         except Exception:
             return []
 
+    def _similar_artists(self, network: pylast.LastFMNetwork, artist_name: str) -> SimilarArtists:
+        """Return ``(name, match)`` pairs similar to ``artist_name``, from the shared cache when possible."""
+        cached = self.similar_cache.get(artist_name)
+        if cached is not None:
+            return cached
+        similar = [self._parse_similarity_candidate(rel) for rel in self._safe_get_similar(network, artist_name)]
+        similar = [(name, match) for name, match in similar if name]
+        if similar:
+            # Empty answers are usually transport errors, so they are retried next time.
+            self.similar_cache.put(artist_name, similar)
+        return similar
+
+    @staticmethod
+    def _playcount_weight(entry) -> float:
+        try:
+            return max(float(entry.weight), 1.0)
+        except (AttributeError, TypeError, ValueError):
+            return 1.0
+
     @staticmethod
     def _parse_similarity_candidate(rel) -> tuple[str, Optional[float]]:
         """Extract candidate artist name and optional similarity score from a relation object."""
@@ -53,28 +91,44 @@ class LastFmUserService:
         top_set: set[str],
         limit: int,
     ) -> List[LastFmUserArtist]:
-        """Aggregate unique similar artists from top artists until the requested limit is reached."""
-        results: List[LastFmUserArtist] = []
-        seen: set[str] = set()
-        for entry in top_entries:
+        """Rank similar artists across all top artists, weighting each match by the base artist's playcount.
+
+        A candidate similar to several heavily played artists outranks one that is a close match to
+        a single rarely played artist. Ties keep the order of the top artists.
+        """
+        bases: Dict[str, Tuple[int, float]] = {}
+        for position, entry in enumerate(top_entries):
             base_name = getattr(entry.item, "name", "")
-            if not base_name:
-                continue
-            for rel in self._safe_get_similar(network, base_name):
-                cand, match_score = self._parse_similarity_candidate(rel)
-                if not cand or cand in top_set or cand in seen:
+            if base_name and base_name not in bases:
+                bases[base_name] = (position, self._playcount_weight(entry))
+        if not bases:
+            return []
+
+        excluded = {name.lower() for name in top_set}
+        scores: Dict[str, List] = {}
+        fan_out = imap_unordered(
+            lambda base_name: self._similar_artists(network, base_name),
+            list(bases),
+            workers=min(self.workers, len(bases)),
+        )
+        for base_name, similar in fan_out:
+            position, weight = bases[base_name]
+            for offset, (cand, match_score) in enumerate(similar):
+                key = cand.lower()
+                if key in excluded:
                     continue
-                seen.add(cand)
-                results.append(
-                    LastFmUserArtist(
-                        name=cand,
-                        playcount=0,
-                        match_score=match_score,
-                    )
-                )
-                if len(results) >= limit:
-                    return results
-        return results
+                match_value = match_score if match_score is not None else 1.0
+                entry = scores.setdefault(key, [cand, 0.0, None, (position, offset)])
+                entry[1] += weight * match_value
+                if match_score is not None and (entry[2] is None or match_score > entry[2]):
+                    entry[2] = match_score
+                entry[3] = min(entry[3], (position, offset))
+
+        ranked = sorted(scores.values(), key=lambda item: (-item[1], item[3]))
+        return [
+            LastFmUserArtist(name=cand, playcount=0, match_score=best_match)
+            for cand, _, best_match, _ in ranked[:limit]
+        ]
 
     def get_top_artists(self, username: str, limit: int = 50) -> List[LastFmUserArtist]:
         if not username:
@@ -97,7 +151,8 @@ class LastFmUserService:
     def get_recommended_artists(self, username: str, limit: int = 50) -> List[LastFmUserArtist]:
         """Approximate recommended artists by aggregating similar-to-top.
 
-        Implementation: user.getTopArtists -> for each, artist.getSimilar, excluding the user's top artists.
+        Implementation: user.getTopArtists -> artist.getSimilar for each (in parallel), excluding the
+        user's top artists and ranking candidates by playcount-weighted similarity.
         """
         if not username:
             return []
@@ -3,11 +3,13 @@ from __future__ import annotations
 import json
 import urllib.parse
 from dataclasses import dataclass
-from typing import List, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Tuple
 
 import requests
 
 LISTENBRAINZ_API_BASE = "https://api.listenbrainz.org/1"
+WEEKLY_EXPLORATION_PERIOD = timedelta(days=7)
 
 
 class ListenBrainzIntegrationError(Exception):
@@ -17,6 +19,14 @@ class ListenBrainzIntegrationError(Exception):
 @dataclass
 class ListenBrainzPlaylistArtists:
     artists: List[str]
+    created_at: Optional[datetime] = None
+
+    @property
+    def next_refresh_at(self) -> Optional[datetime]:
+        """When the next weekly exploration playlist is expected, if the current one's date is known."""
+        if self.created_at is None:
+            return None
+        return self.created_at + WEEKLY_EXPLORATION_PERIOD
 
 
 class ListenBrainzUserService:
@@ -29,14 +39,16 @@ class ListenBrainzUserService:
         if not username:
             return ListenBrainzPlaylistArtists(artists=[])
 
-        playlist_id = self._find_weekly_exploration_playlist(username)
-        if not playlist_id:
+        found = self._find_weekly_exploration_playlist(username)
+        if not found:
             return ListenBrainzPlaylistArtists(artists=[])
 
+        playlist_id, created_at = found
         artists = self._fetch_playlist_artists(playlist_id)
-        return ListenBrainzPlaylistArtists(artists=artists)
+        return ListenBrainzPlaylistArtists(artists=artists, created_at=created_at)
 
-    def _find_weekly_exploration_playlist(self, username: str) -> str | None:
+    def _find_weekly_exploration_playlist(self, username: str) -> Tuple[str, Optional[datetime]] | None:
+        """Return the identifier and creation date of the user's weekly exploration playlist."""
         encoded_username = urllib.parse.quote(username)
         url = f"{LISTENBRAINZ_API_BASE}/user/{encoded_username}/playlists/createdfor"
         response = self._session.get(url, timeout=self._timeout)
@@ -59,7 +71,7 @@ class ListenBrainzUserService:
             identifier = playlist.get("identifier")
             identifier_str = self._normalise_identifier(identifier)
             if identifier_str:
-                return identifier_str
+                return identifier_str, self._parse_date(playlist.get("date"))
         return None
 
     def _fetch_playlist_artists(self, identifier: str) -> List[str]:
@@ -93,6 +105,16 @@ class ListenBrainzUserService:
             identifier_str = identifier_str.rsplit("/", 1)[-1]
         return identifier_str
 
+    @staticmethod
+    def _parse_date(value: object) -> Optional[datetime]:
+        if not isinstance(value, str) or not value.strip():
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
     @staticmethod
     def _extract_track_artists(track: dict) -> List[str]:
         names: List[str] = []
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from unidecode import unidecode
+
+JOURNAL_COMPACT_THRESHOLD = 500
+
+
+class LibraryIndex:
+    """Thread-safe index of Lidarr artist names backed by a snapshot and an append-only journal.
+
+    Full syncs rewrite the snapshot; single add/delete events only append one journal line so
+    webhook updates stay O(1) regardless of library size. Genres reported by Lidarr are kept per
+    artist (from full syncs) to summarize the library's taste.
+    """
+
+    def __init__(self, snapshot_path: Optional[Path] = None, logger: Optional[logging.Logger] = None) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path.with_suffix(".journal") if snapshot_path else None
+        self.logger = logger or logging.getLogger("sonobarr")
+        self._lock = threading.Lock()
+        self._entries: Dict[str, str] = {}
+        self._genres: Dict[str, Tuple[str, ...]] = {}
+        self._journal_length = 0
+        self.version = 0
+
+    @staticmethod
+    def display_name(name: str) -> str:
+        return unidecode(name or "", replace_str=" ").strip()
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        return cls.display_name(name).lower()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        key = self.normalize(name)
+        with self._lock:
+            return key in self._entries
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def cleaned_names(self) -> List[str]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def genres(self) -> Dict[str, Tuple[str, ...]]:
+        """Genres per indexed display name, for artists whose genres are known."""
+        with self._lock:
+            return {self._entries[key]: genres for key, genres in self._genres.items() if key in self._entries}
+
+    def replace(
+        self,
+        names: Iterable[str],
+        *,
+        persist: bool = True,
+        genres: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> None:
+        """Replace the whole index, e.g. after a full Lidarr sync.
+
+        ``genres`` maps artist names to their genres; when omitted, known genres are kept for
+        artists that remain.
+        """
+        entries: Dict[str, str] = {}
+        for raw_name in names:
+            display = self.display_name(raw_name)
+            if display:
+                entries.setdefault(display.lower(), display)
+        with self._lock:
+            self._entries = entries
+            if genres is not None:
+                self._genres = self._clean_genres(genres)
+            self._genres = {key: value for key, value in self._genres.items() if key in entries}
+            self.version += 1
+            if persist:
+                self._write_snapshot_locked()
+
+    def replace_cleaned(self, cleaned_names: Iterable[str]) -> None:
+        """Replace the index keys, keeping known display names for keys that remain."""
+        with self._lock:
+            self._entries = {
+                key: self._entries.get(key, key) for key in (str(name).lower() for name in cleaned_names) if key
+            }
+            self.version += 1
+            self._write_snapshot_locked()
+
+    def add(self, name: str) -> bool:
+        """Add one artist; returns False when it was already indexed."""
+        display = self.display_name(name)
+        if not display:
+            return False
+        key = display.lower()
+        with self._lock:
+            if key in self._entries:
+                return False
+            self._entries[key] = display
+            self.version += 1
+            self._append_journal_locked("add", display)
+        return True
+
+    def remove(self, name: str) -> Optional[str]:
+        """Remove one artist and return the display name that was indexed, if any."""
+        key = self.normalize(name)
+        with self._lock:
+            display = self._entries.pop(key, None)
+            if display is None:
+                return None
+            self._genres.pop(key, None)
+            self.version += 1
+            self._append_journal_locked("remove", display)
+        return display
+
+    @classmethod
+    def _clean_genres(cls, genres: Mapping[str, Sequence[str]]) -> Dict[str, Tuple[str, ...]]:
+        cleaned: Dict[str, Tuple[str, ...]] = {}
+        for name, values in genres.items():
+            key = cls.normalize(name)
+            tags = tuple(str(value).strip() for value in values or () if str(value).strip())
+            if key and tags:
+                cleaned[key] = tags
+        return cleaned
+
+    # Persistence -----------------------------------------------------
+    def load(self) -> None:
+        """Restore the index from the snapshot and replay any journal entries written since."""
+        if self.snapshot_path is None:
+            return
+        entries: Dict[str, str] = {}
+        genres: Dict[str, Tuple[str, ...]] = {}
+        journal_length = 0
+        try:
+            if self.snapshot_path.exists():
+                with self.snapshot_path.open("r", encoding="utf-8") as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+                for name in snapshot.get("names", []):
+                    entries.setdefault(str(name).lower(), str(name))
+                genres = self._clean_genres(snapshot.get("genres") or {})
+            if self.journal_path is not None and self.journal_path.exists():
+                with self.journal_path.open("r", encoding="utf-8") as journal_file:
+                    for line in journal_file:
+                        if not line.strip():
+                            continue
+                        record = json.loads(line)
+                        name = str(record.get("name") or "")
+                        if record.get("op") == "add":
+                            entries.setdefault(name.lower(), name)
+                        elif record.get("op") == "remove":
+                            entries.pop(name.lower(), None)
+                            genres.pop(name.lower(), None)
+                        journal_length += 1
+        except (OSError, ValueError) as exc:
+            self.logger.warning("Ignoring unreadable Lidarr library snapshot: %s", exc)
+            return
+        with self._lock:
+            self._entries = entries
+            self._genres = genres
+            self._journal_length = journal_length
+            self.version += 1
+            if journal_length >= JOURNAL_COMPACT_THRESHOLD:
+                self._write_snapshot_locked()
+
+    def _append_journal_locked(self, op: str, name: str) -> None:
+        if self.journal_path is None:
+            return
+        if self._journal_length + 1 >= JOURNAL_COMPACT_THRESHOLD:
+            self._write_snapshot_locked()
+            return
+        try:
+            with self.journal_path.open("a", encoding="utf-8") as journal_file:
+                journal_file.write(json.dumps({"op": op, "name": name}) + "\n")
+            self._journal_length += 1
+        except OSError as exc:  # pragma: no cover - filesystem errors
+            self.logger.error("Failed to append Lidarr library journal: %s", exc)
+
+    def _write_snapshot_locked(self) -> None:
+        if self.snapshot_path is None:
+            return
+        tmp_path: Optional[Path] = None
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self.snapshot_path.parent,
+                delete=False,
+            ) as tmp_file:
+                json.dump(
+                    {
+                        "names": list(self._entries.values()),
+                        "genres": {self._entries[key]: list(value) for key, value in self._genres.items()},
+                    },
+                    tmp_file,
+                )
+                tmp_path = Path(tmp_file.name)
+            os.replace(tmp_path, self.snapshot_path)
+            if self.journal_path is not None:
+                self.journal_path.unlink(missing_ok=True)
+            self._journal_length = 0
+        except OSError as exc:  # pragma: no cover - filesystem errors
+            self.logger.error("Failed to write Lidarr library snapshot: %s", exc)
+        finally:
+            if tmp_path and tmp_path.exists():
+                tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import hashlib
+from collections import Counter
+from typing import Dict, List, Mapping, Sequence
+
+DEFAULT_LIBRARY_TOKEN_BUDGET = 300
+_CHARS_PER_TOKEN = 4
+_MAX_GENRES = 12
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English-like text)."""
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _stable_order(name: str) -> str:
+    return hashlib.sha1(name.lower().encode("utf-8")).hexdigest()
+
+
+def _representative_artists(names: Sequence[str], genres: Mapping[str, Sequence[str]], top_genres: List[str]) -> List[str]:
+    """Artists ordered so every top genre is represented early, then the rest of the library.
+
+    Ordering within a genre is a stable hash rather than alphabetical, so the sample is spread
+    across the library instead of clustering on names starting with "A".
+    """
+    by_genre: Dict[str, List[str]] = {genre: [] for genre in top_genres}
+    for name in sorted(names, key=_stable_order):
+        for genre in genres.get(name, ()):
+            if genre in by_genre:
+                by_genre[genre].append(name)
+                break
+
+    ordered: List[str] = []
+    seen: set[str] = set()
+    buckets = [bucket for bucket in by_genre.values() if bucket]
+    while buckets:
+        for bucket in list(buckets):
+            name = bucket.pop(0)
+            if name not in seen:
+                seen.add(name)
+                ordered.append(name)
+            if not bucket:
+                buckets.remove(bucket)
+    ordered.extend(name for name in sorted(names, key=_stable_order) if name not in seen)
+    return ordered
+
+
+def build_library_summary(
+    names: Sequence[str],
+    genres: Mapping[str, Sequence[str]],
+    *,
+    token_budget: int = DEFAULT_LIBRARY_TOKEN_BUDGET,
+) -> str:
+    """Compact description of a library for LLM prompts, kept within ``token_budget``.
+
+    Lists the library size, the most common genres with artist counts, and as many representative
+    artists as fit (all of them for small libraries).
+    """
+    if not names:
+        return ""
+    budget = max(1, int(token_budget))
+    lines = [f"{len(names)} artists."]
+
+    genre_counts = Counter(genre for name in names for genre in dict.fromkeys(genres.get(name, ())))
+    top_genres: List[str] = []
+    if genre_counts:
+        genre_parts: List[str] = []
+        for genre, count in genre_counts.most_common(_MAX_GENRES):
+            candidate = "Top genres: " + ", ".join(genre_parts + [f"{genre} ({count})"])
+            # Genres get at most half of the budget; the rest is left for artist names.
+            if estimate_tokens(candidate) > budget // 2:
+                break
+            genre_parts.append(f"{genre} ({count})")
+            top_genres.append(genre)
+        if genre_parts:
+            lines.append("Top genres: " + ", ".join(genre_parts))
+
+    prefix = "Artists include: " if len(names) > 1 else "Artist: "
+    used = estimate_tokens("\n".join(lines)) + estimate_tokens(prefix)
+    sample: List[str] = []
+    for name in _representative_artists(names, genres, top_genres):
+        cost = estimate_tokens(f"{name}, ")
+        if used + cost > budget:
+            break
+        sample.append(name)
+        used += cost
+    if sample:
+        lines.append(prefix + ", ".join(sample))
+    return "\n".join(lines)
@@ -1,24 +1,135 @@
+import asyncio
+import inspect
 import json
+import queue
 import re
-from typing import Any, List, Mapping, Optional, Sequence
+import threading
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional, Sequence, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai import OpenAIError
 
 
 DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
 DEFAULT_MAX_SEED_ARTISTS = 5
 DEFAULT_OPENAI_TIMEOUT = 60.0
+LIBRARY_PREVIEW_SIZE = 50
 
 _SYSTEM_PROMPT = (
     "You are Sonobarr's music discovery assistant. "
     "Given a user request about music tastes, moods, genres, or artists, "
     "respond with a JSON array of up to {max_artists} artist names that best match the request. "
     "Only return the JSON array, with each artist as a string. "
-    "The artists should be discoverable on major streaming services and ideally not already present in the provided library list."
+    "The artists should be discoverable on major streaming services and ideally not already present in the provided library."
 )
 
 
+class JsonArrayStreamParser:
+    """Incrementally extract the elements of a JSON array from streamed text.
+
+    Text before the first ``[`` is ignored. Each element is decoded as soon as the ``,`` or ``]``
+    that ends it arrives, so callers can act on early elements while the rest is still streaming.
+    Nested arrays/objects and strings containing brackets or commas are handled.
+    """
+
+    def __init__(self) -> None:
+        self.complete = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._element: List[str] = []
+
+    def resume(self) -> None:
+        """Keep scanning for another array after the previous one closed."""
+        self.complete = False
+
+    def feed(self, text: str) -> List[Any]:
+        elements: List[Any] = []
+        for char in text:
+            if self.complete:
+                break
+            if self._depth == 0:
+                if char == "[":
+                    self._depth = 1
+                    self._element = []
+                continue
+            if self._in_string:
+                self._element.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}" and self._depth > 1:
+                self._depth -= 1
+            elif self._depth == 1 and char in ",]":
+                self._finish_element(elements)
+                if char == "]":
+                    self._depth = 0
+                    self.complete = True
+                continue
+            self._element.append(char)
+        return elements
+
+    def _finish_element(self, elements: List[Any]) -> None:
+        fragment = "".join(self._element).strip()
+        self._element = []
+        if not fragment:
+            return
+        try:
+            elements.append(json.loads(fragment))
+        except json.JSONDecodeError:
+            pass
+
+
+class _StreamedSeeds:
+    """Seed extraction state for one streamed completion, shared by the sync and async streams."""
+
+    def __init__(self, recommender: "OpenAIRecommender") -> None:
+        self.recommender = recommender
+        self.parser = JsonArrayStreamParser()
+        self.received: List[str] = []
+        self.seen: set[str] = set()
+        self.yielded = 0
+        self.finished = False
+
+    def feed(self, chunk) -> List[str]:
+        """Return the new artists named by ``chunk``; sets :attr:`finished` once no more are wanted."""
+        text = self.recommender._extract_delta_content(chunk)
+        if not text:
+            return []
+        self.received.append(text)
+        artists: List[str] = []
+        for item in self.parser.feed(text):
+            artist = self.recommender._normalize_artist_entry(item)
+            if not artist or artist.lower() in self.seen:
+                continue
+            self.seen.add(artist.lower())
+            self.yielded += 1
+            artists.append(artist)
+            if self.yielded >= self.recommender.max_seed_artists:
+                self.finished = True
+                return artists
+        if self.parser.complete:
+            if self.yielded:
+                self.finished = True
+            else:
+                self.parser.resume()
+        return artists
+
+    def fallback(self) -> List[str]:
+        """Artists parsed from the full text when nothing could be extracted incrementally."""
+        if self.yielded:
+            return []
+        return self.recommender._parse_seed_content("".join(self.received).strip())
+
+
 class OpenAIRecommender:
     def __init__(
         self,
@@ -30,8 +141,10 @@ class OpenAIRecommender:
         max_seed_artists: int = DEFAULT_MAX_SEED_ARTISTS,
         timeout: float | None = DEFAULT_OPENAI_TIMEOUT,
         temperature: float | None = 0.7,
+        retry_on_timeout: bool = True,
     ) -> None:
         self.timeout = timeout
+        self.retry_on_timeout = retry_on_timeout
         client_kwargs: dict[str, Any] = {
             "timeout": timeout,
         }
@@ -45,12 +158,21 @@ class OpenAIRecommender:
         if default_headers:
             client_kwargs["default_headers"] = dict(default_headers)
         self.client = OpenAI(**client_kwargs)
+        self._client_kwargs = client_kwargs
+        self._async_client: Optional[AsyncOpenAI] = None
         self.model = model or DEFAULT_OPENAI_MODEL
         self.max_seed_artists = max_seed_artists
         self.temperature = temperature
         self.base_url = base_url
         self.default_headers = dict(default_headers) if default_headers else {}
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """``AsyncOpenAI`` twin of :attr:`client`, created on first use by the event loop that awaits it."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
+
     @staticmethod
     def _iter_fenced_code_blocks(text: str):
         start = 0
@@ -117,18 +239,32 @@ class OpenAIRecommender:
 
         return self._find_first_json_array(content)
 
-    def _build_prompts(self, prompt: str, existing_artists: Sequence[str]) -> tuple[str, str]:
+    @staticmethod
+    def library_preview(existing_artists: Sequence[str] | None) -> List[str]:
+        """Library artist names included in the prompt (also what the seed cache fingerprints)."""
+        return list(existing_artists or [])[:LIBRARY_PREVIEW_SIZE]
+
+    def _build_prompts(
+        self,
+        prompt: str,
+        existing_artists: Sequence[str],
+        library_summary: str | None = None,
+    ) -> tuple[str, str]:
         system_prompt = _SYSTEM_PROMPT.format(max_artists=self.max_seed_artists)
-        existing_preview = ", ".join(existing_artists[:50]) if existing_artists else "None provided."
+        if library_summary:
+            library_section = f"The user's library:\n{library_summary}"
+        else:
+            preview = self.library_preview(existing_artists)
+            existing_preview = ", ".join(preview) if preview else "None provided."
+            library_section = f"Artists already in the library:\n{existing_preview}"
         user_prompt = (
             "User request:\n"
             f"{prompt.strip()}\n\n"
-            "Artists already in the library:\n"
-            f"{existing_preview}"
+            f"{library_section}"
         )
         return system_prompt, user_prompt
 
-    def _prepare_request(self, system_prompt: str, user_prompt: str) -> dict:
+    def _prepare_request(self, system_prompt: str, user_prompt: str, *, stream: bool = False) -> dict:
         request_kwargs = {
             "model": self.model,
             "messages": [
@@ -138,6 +274,8 @@ class OpenAIRecommender:
         }
         if self.temperature is not None:
             request_kwargs["temperature"] = self.temperature
+        if stream:
+            request_kwargs["stream"] = True
         return request_kwargs
 
     def _execute_request(self, request_kwargs: dict):
@@ -147,21 +285,50 @@ class OpenAIRecommender:
             try:
                 return self.client.chat.completions.create(**request_kwargs)
             except OpenAIError as exc:  # pragma: no cover - network failure path
-                message = str(exc)
                 last_exc = exc
-                if (
-                    "temperature" in message.lower()
-                    and "unsupported" in message.lower()
-                    and request_kwargs.pop("temperature", None) is not None
-                ):
+                if self._should_retry(exc, request_kwargs, attempt, attempts):
                     continue
-                if "timed out" in message.lower() and attempt + 1 < attempts:
+                raise RuntimeError(str(exc)) from exc
+        if last_exc is not None:  # pragma: no cover - defensive
+            raise RuntimeError(str(last_exc)) from last_exc
+        raise RuntimeError("LLM request failed without response")  # pragma: no cover - defensive
+
+    async def _aexecute_request(self, request_kwargs: dict):
+        attempts = 2
+        last_exc: Optional[Exception] = None
+        for attempt in range(attempts):
+            try:
+                return await self.async_client.chat.completions.create(**request_kwargs)
+            except OpenAIError as exc:  # pragma: no cover - network failure path
+                last_exc = exc
+                if self._should_retry(exc, request_kwargs, attempt, attempts):
                     continue
-                raise RuntimeError(message) from exc
+                raise RuntimeError(str(exc)) from exc
         if last_exc is not None:  # pragma: no cover - defensive
             raise RuntimeError(str(last_exc)) from last_exc
         raise RuntimeError("LLM request failed without response")  # pragma: no cover - defensive
 
+    def _should_retry(self, exc: Exception, request_kwargs: dict, attempt: int, attempts: int) -> bool:
+        message = str(exc).lower()
+        if (
+            "temperature" in message
+            and "unsupported" in message
+            and request_kwargs.pop("temperature", None) is not None
+        ):
+            return True
+        return self.retry_on_timeout and "timed out" in message and attempt + 1 < attempts
+
+    @staticmethod
+    def _extract_delta_content(chunk) -> str:
+        try:
+            choices = chunk.choices
+        except AttributeError:
+            return ""
+        if not choices:
+            return ""
+        delta = getattr(choices[0], "delta", None)
+        return getattr(delta, "content", None) or ""
+
     @staticmethod
     def _extract_response_content(response) -> str:
         try:
@@ -217,27 +384,257 @@ class OpenAIRecommender:
                 break
         return seeds
 
+    def _parse_seed_content(self, content: str) -> List[str]:
+        if not content:
+            return []
+
+        array_fragment = self._extract_array_fragment(content)
+        if not array_fragment:
+            raise RuntimeError(
+                "The LLM response did not include a JSON array of artist names. "
+                "Please try rephrasing your request."
+            )
+
+        raw_payload = self._load_json_payload(array_fragment)
+        normalized_items = self._coerce_artist_entries(raw_payload)
+        return self._dedupe_and_limit(normalized_items)
+
     def generate_seed_artists(
         self,
         prompt: str,
         existing_artists: Sequence[str] | None = None,
+        *,
+        library_summary: str | None = None,
     ) -> List[str]:
         catalog_artists = existing_artists or []
-        system_prompt, user_prompt = self._build_prompts(prompt, catalog_artists)
+        system_prompt, user_prompt = self._build_prompts(prompt, catalog_artists, library_summary)
         request_kwargs = self._prepare_request(system_prompt, user_prompt)
         response = self._execute_request(request_kwargs)
 
         content = self._extract_response_content(response).strip()
-        if not content:
+        return self._parse_seed_content(content)
+
+    def stream_seed_artists(
+        self,
+        prompt: str,
+        existing_artists: Sequence[str] | None = None,
+        *,
+        library_summary: str | None = None,
+    ) -> Iterator[str]:
+        """Yield seed artists while the completion streams, each as soon as its array element closes.
+
+        Falls back to parsing the full text (fenced blocks, wrapped objects) when nothing could be
+        extracted incrementally, so the result matches :meth:`generate_seed_artists`.
+        """
+        catalog_artists = existing_artists or []
+        system_prompt, user_prompt = self._build_prompts(prompt, catalog_artists, library_summary)
+        request_kwargs = self._prepare_request(system_prompt, user_prompt, stream=True)
+        stream = self._execute_request(request_kwargs)
+
+        state = _StreamedSeeds(self)
+        try:
+            for chunk in stream:
+                yield from state.feed(chunk)
+                if state.finished:
+                    return
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                close()
+
+        yield from state.fallback()
+
+    async def agenerate_seed_artists(
+        self,
+        prompt: str,
+        existing_artists: Sequence[str] | None = None,
+        *,
+        library_summary: str | None = None,
+    ) -> List[str]:
+        """Async :meth:`generate_seed_artists` using :attr:`async_client`."""
+        catalog_artists = existing_artists or []
+        system_prompt, user_prompt = self._build_prompts(prompt, catalog_artists, library_summary)
+        request_kwargs = self._prepare_request(system_prompt, user_prompt)
+        response = await self._aexecute_request(request_kwargs)
+
+        content = self._extract_response_content(response).strip()
+        return self._parse_seed_content(content)
+
+    async def astream_seed_artists(
+        self,
+        prompt: str,
+        existing_artists: Sequence[str] | None = None,
+        *,
+        library_summary: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Async :meth:`stream_seed_artists`; cancelling the consuming task closes the HTTP stream."""
+        catalog_artists = existing_artists or []
+        system_prompt, user_prompt = self._build_prompts(prompt, catalog_artists, library_summary)
+        request_kwargs = self._prepare_request(system_prompt, user_prompt, stream=True)
+        stream = await self._aexecute_request(request_kwargs)
+
+        state = _StreamedSeeds(self)
+        try:
+            async for chunk in stream:
+                for artist in state.feed(chunk):
+                    yield artist
+                if state.finished:
+                    return
+        finally:
+            close = getattr(stream, "close", None)
+            if callable(close):
+                closing = close()
+                if inspect.isawaitable(closing):
+                    await closing
+
+        for artist in state.fallback():
+            yield artist
+
+
+def build_replacement_prompt(prompt: str, unknown: Sequence[str], suggested: Sequence[str]) -> str:
+    """Follow-up request asking for real artists in place of names no catalog could find."""
+    return (
+        f"{prompt.strip()}\n\n"
+        f"These suggested artists could not be found in any music catalog: {', '.join(unknown)}. "
+        f"Suggest {len(unknown)} different, real, well-documented artists for the same request. "
+        f"Do not repeat any of: {', '.join(suggested)}."
+    )
+
+
+def parse_model_endpoints(raw_value: str | None) -> List[Tuple[str, Optional[str]]]:
+    """Parse ``"model@base_url, model"`` into ``(model, base_url)`` pairs (no URL: the default endpoint)."""
+    endpoints: List[Tuple[str, Optional[str]]] = []
+    for entry in (raw_value or "").split(","):
+        model, _, base_url = entry.strip().partition("@")
+        model = model.strip()
+        if model:
+            endpoints.append((model, base_url.strip() or None))
+    return endpoints
+
+
+class HedgedRecommender:
+    """Query several LLM endpoints with staggered starts and keep the first valid artist list.
+
+    The first recommender starts immediately; each further one starts ``hedge_delay`` seconds
+    later, or as soon as every running request has failed or come back empty. Requests that lose
+    the race are abandoned and their answers discarded; on the async path they are cancelled.
+    """
+
+    def __init__(self, recommenders: Sequence[OpenAIRecommender], *, hedge_delay: float) -> None:
+        if not recommenders:
+            raise ValueError("HedgedRecommender needs at least one recommender")
+        self.recommenders = list(recommenders)
+        self.hedge_delay = max(0.0, float(hedge_delay))
+        primary = self.recommenders[0]
+        self.model = primary.model
+        self.base_url = primary.base_url
+        self.timeout = primary.timeout
+        self.max_seed_artists = primary.max_seed_artists
+        self.models = [recommender.model for recommender in self.recommenders]
+
+    def generate_seed_artists(
+        self,
+        prompt: str,
+        existing_artists: Sequence[str] | None = None,
+        *,
+        library_summary: str | None = None,
+    ) -> List[str]:
+        outcomes: "queue.Queue[Tuple[int, Optional[List[str]], Optional[BaseException]]]" = queue.Queue()
+        abandoned = threading.Event()
+
+        def _attempt(index: int) -> None:
+            try:
+                seeds = self.recommenders[index].generate_seed_artists(
+                    prompt, existing_artists, library_summary=library_summary
+                )
+            except Exception as exc:  # reported to the waiting caller
+                if not abandoned.is_set():
+                    outcomes.put((index, None, exc))
+                return
+            if not abandoned.is_set():
+                outcomes.put((index, seeds, None))
+
+        def _launch(index: int) -> None:
+            threading.Thread(target=_attempt, args=(index,), name=f"llm-hedge-{index}", daemon=True).start()
+
+        launched = 1
+        pending = 1
+        last_error: Optional[BaseException] = None
+        answered_empty = False
+        _launch(0)
+        try:
+            while pending or launched < len(self.recommenders):
+                if pending == 0:
+                    _launch(launched)
+                    launched += 1
+                    pending += 1
+                wait = self.hedge_delay if launched < len(self.recommenders) else None
+                try:
+                    _, seeds, error = outcomes.get(timeout=wait)
+                except queue.Empty:
+                    _launch(launched)
+                    launched += 1
+                    pending += 1
+                    continue
+                pending -= 1
+                if seeds:
+                    return seeds
+                if error is not None:
+                    last_error = error
+                else:
+                    answered_empty = True
+        finally:
+            abandoned.set()
+
+        if answered_empty or last_error is None:
             return []
+        raise last_error
 
-        array_fragment = self._extract_array_fragment(content)
-        if not array_fragment:
-            raise RuntimeError(
-                "The LLM response did not include a JSON array of artist names. "
-                "Please try rephrasing your request."
+    async def agenerate_seed_artists(
+        self,
+        prompt: str,
+        existing_artists: Sequence[str] | None = None,
+        *,
+        library_summary: str | None = None,
+    ) -> List[str]:
+        """Async :meth:`generate_seed_artists`: same hedging, with losing requests cancelled."""
+        tasks: List[asyncio.Task] = []
+        pending: set[asyncio.Task] = set()
+
+        def _launch() -> None:
+            recommender = self.recommenders[len(tasks)]
+            task = asyncio.ensure_future(
+                recommender.agenerate_seed_artists(prompt, existing_artists, library_summary=library_summary)
             )
+            tasks.append(task)
+            pending.add(task)
 
-        raw_payload = self._load_json_payload(array_fragment)
-        normalized_items = self._coerce_artist_entries(raw_payload)
-        return self._dedupe_and_limit(normalized_items)
+        last_error: Optional[BaseException] = None
+        answered_empty = False
+        _launch()
+        try:
+            while pending or len(tasks) < len(self.recommenders):
+                if not pending:
+                    _launch()
+                wait = self.hedge_delay if len(tasks) < len(self.recommenders) else None
+                done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    _launch()
+                    continue
+                for task in sorted(done, key=tasks.index):
+                    pending.discard(task)
+                    error = task.exception()
+                    if error is not None:
+                        last_error = error
+                    elif task.result():
+                        return task.result()
+                    else:
+                        answered_empty = True
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if answered_empty or last_error is None:
+            return []
+        raise last_error
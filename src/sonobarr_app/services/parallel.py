@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .cancellation import CancellationToken, CancelledError
+
+_WORKER_DONE = object()
+
+
+def imap_unordered(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    workers: int,
+    token: Optional[CancellationToken] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """Apply ``func`` to ``items`` on at most ``workers`` threads, yielding ``(item, result)`` as each finishes.
+
+    ``items`` may be a lazy iterator; workers pull from it one item at a time, so a slow producer
+    still gets its first items processed right away. Exceptions from ``func`` or ``items`` are
+    re-raised to the consumer. When ``token`` is cancelled the consumer raises
+    :class:`CancelledError` immediately and workers stop after their current call.
+    """
+    source = iter(items)
+    source_lock = threading.Lock()
+    results: "queue.Queue[Tuple[Any, Any, Optional[BaseException]]]" = queue.Queue()
+    stopped = threading.Event()
+
+    def _worker() -> None:
+        try:
+            while not stopped.is_set() and not (token is not None and token.cancelled):
+                with source_lock:
+                    try:
+                        item = next(source)
+                    except StopIteration:
+                        return
+                results.put((item, func(item), None))
+        except BaseException as exc:  # propagated to the consuming caller
+            results.put((_WORKER_DONE, None, exc))
+        finally:
+            results.put((_WORKER_DONE, None, None))
+
+    def _wake() -> None:
+        results.put((_WORKER_DONE, None, CancelledError()))
+
+    if token is not None:
+        token.raise_if_cancelled()
+        token.add_callback(_wake)
+    running = max(1, int(workers))
+    try:
+        for index in range(running):
+            threading.Thread(target=_worker, name=f"parallel-{index}", daemon=True).start()
+        while running:
+            item, result, error = results.get()
+            if token is not None:
+                token.raise_if_cancelled()
+            if error is not None:
+                raise error
+            if item is _WORKER_DONE:
+                running -= 1
+                continue
+            yield item, result
+    finally:
+        stopped.set()
+        if token is not None:
+            token.remove_callback(_wake)
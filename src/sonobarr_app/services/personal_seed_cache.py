@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class PersonalSeedCache:
+    """Per-username cache of personal discovery seeds (Last.fm, ListenBrainz) with stale-while-revalidate.
+
+    Each entry carries an absolute expiry chosen by its source, e.g. when the next ListenBrainz
+    weekly playlist is due. Expired entries are still served for ``max_stale_seconds``, flagged as
+    stale so the caller can refresh them in the background; :meth:`claim_refresh` keeps that to one
+    refresh per entry at a time. Empty seed lists are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 86400,
+        max_stale_seconds: float = 7 * 86400,
+        max_entries: int = 1000,
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds or 0))
+        self.max_stale_seconds = max(0.0, float(max_stale_seconds or 0))
+        self.max_entries = max(0, int(max_entries or 0))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def key(source: str, username: str) -> str:
+        return f"{source}:{(username or '').strip().casefold()}"
+
+    def get(self, source: str, username: str) -> Optional[Tuple[List[str], bool]]:
+        """Return ``(seeds, stale)`` for a username, or None when nothing usable is cached."""
+        if not self.enabled:
+            return None
+        key = self.key(source, username)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] + self.max_stale_seconds <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            stale = entry[0] <= now
+            self._stats["stale_hits" if stale else "hits"] += 1
+            return list(entry[1]), stale
+
+    def put(
+        self,
+        source: str,
+        username: str,
+        seeds: Sequence[str],
+        *,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """Store seeds until ``expires_at`` (epoch seconds), or for the default TTL."""
+        if not self.enabled or not seeds:
+            return
+        key = self.key(source, username)
+        if expires_at is None:
+            expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, tuple(seeds))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def claim_refresh(self, source: str, username: str) -> bool:
+        """Return True if the caller should refresh this entry (no other refresh is running)."""
+        key = self.key(source, username)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._stats["refreshes"] += 1
+            return True
+
+    def release_refresh(self, source: str, username: str) -> None:
+        with self._lock:
+            self._refreshing.discard(self.key(source, username))
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "refreshing": len(self._refreshing), **self._stats}
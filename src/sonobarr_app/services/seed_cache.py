@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case- and whitespace-insensitive form of a prompt, so "90s  Shoegaze" matches "90s shoegaze"."""
+    return " ".join(str(prompt or "").casefold().split())
+
+
+def library_fingerprint(library_preview: Sequence[str]) -> str:
+    """Order-independent hash of the library names sent alongside a prompt."""
+    names = sorted({" ".join(str(name).casefold().split()) for name in library_preview if name})
+    return hashlib.sha1("\n".join(names).encode("utf-8")).hexdigest()[:16]
+
+
+class SeedCache:
+    """Bounded TTL cache of LLM seed-artist answers.
+
+    Entries are keyed by the normalized prompt, the model (and endpoint), ``max_seed_artists`` and a
+    fingerprint of the library preview, so a settings or library change naturally misses. The least
+    recently used entry is evicted once ``max_entries`` is reached; a TTL or size of 0 disables caching.
+    """
+
+    def __init__(self, *, ttl_seconds: float = 86400, max_entries: int = 256) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds or 0))
+        self.max_entries = max(0, int(max_entries or 0))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def key(
+        prompt: str,
+        *,
+        model: str,
+        max_seed_artists: int,
+        library_preview: Sequence[str],
+        base_url: Optional[str] = None,
+    ) -> str:
+        parts = (
+            normalize_prompt(prompt),
+            str(model or ""),
+            str(base_url or ""),
+            str(max_seed_artists),
+            library_fingerprint(library_preview),
+        )
+        return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return list(entry[1])
+
+    def put(self, key: str, seeds: Sequence[str]) -> None:
+        """Store a non-empty answer; empty answers are never cached so the next request retries."""
+        if not self.enabled or not seeds:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, tuple(seeds))
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                **self._stats,
+            }
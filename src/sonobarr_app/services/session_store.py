@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class SessionStore:
+    """In-process registry of socket sessions.
+
+    Sessions carry locks, stop events and running discovery state, so they live in the process
+    that owns the socket. Sonobarr runs a single worker (see ``gunicorn_config.py``).
+    """
+
+    def __init__(self) -> None:
+        self._local: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_local(self, sid: str) -> Optional[Any]:
+        with self._lock:
+            return self._local.get(sid)
+
+    def local_values(self) -> List[Any]:
+        with self._lock:
+            return list(self._local.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._local)
+
+    def __contains__(self, sid: str) -> bool:
+        return self.get_local(sid) is not None
+
+    def add(self, session: Any) -> None:
+        with self._lock:
+            self._local[session.sid] = session
+
+    def pop(self, sid: str) -> Optional[Any]:
+        with self._lock:
+            return self._local.pop(sid, None)
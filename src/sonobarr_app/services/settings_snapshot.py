@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+# Runtime settings persisted to ``settings_config.json`` and editable from the settings modal.
+SETTINGS_FIELDS = (
+    "lidarr_address",
+    "lidarr_api_key",
+    "root_folder_path",
+    "fallback_to_top_result",
+    "lidarr_api_timeout",
+    "quality_profile_id",
+    "metadata_profile_id",
+    "search_for_missing_albums",
+    "dry_run_adding_to_lidarr",
+    "lidarr_monitor_option",
+    "lidarr_monitored",
+    "lidarr_albums_to_monitor",
+    "lidarr_monitor_new_items",
+    "app_name",
+    "app_rev",
+    "app_url",
+    "last_fm_api_key",
+    "last_fm_api_secret",
+    "auto_start",
+    "auto_start_delay",
+    "youtube_api_key",
+    "similar_artist_batch_size",
+    "openai_api_key",
+    "openai_model",
+    "openai_api_base",
+    "openai_extra_headers",
+    "openai_max_seed_artists",
+    "api_key",
+)
+
+# Inputs of derived clients; a client is rebuilt only when one of its inputs changes.
+OPENAI_SETTINGS: FrozenSet[str] = frozenset(
+    {"openai_api_key", "openai_model", "openai_api_base", "openai_extra_headers", "openai_max_seed_artists"}
+)
+LISTENING_SETTINGS: FrozenSet[str] = frozenset({"last_fm_api_key", "last_fm_api_secret"})
+
+_TUPLE_FIELDS = frozenset({"lidarr_albums_to_monitor"})
+
+
+def _freeze(name: str, value: Any) -> Any:
+    if name in _TUPLE_FIELDS and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable view of every runtime setting, replaced wholesale whenever settings change.
+
+    Readers grab ``handler.settings`` once and see a consistent set of values without locking;
+    ``version`` increases with every published change so caches can tell when to rebuild.
+    An empty string marks a value not loaded yet, matching how settings are merged at startup.
+    """
+
+    version: int = 0
+    lidarr_address: Any = ""
+    lidarr_api_key: Any = ""
+    root_folder_path: Any = ""
+    fallback_to_top_result: Any = ""
+    lidarr_api_timeout: Any = ""
+    quality_profile_id: Any = ""
+    metadata_profile_id: Any = ""
+    search_for_missing_albums: Any = ""
+    dry_run_adding_to_lidarr: Any = ""
+    lidarr_monitor_option: Any = ""
+    lidarr_monitored: Any = ""
+    lidarr_albums_to_monitor: Any = ""
+    lidarr_monitor_new_items: Any = ""
+    app_name: Any = ""
+    app_rev: Any = ""
+    app_url: Any = ""
+    last_fm_api_key: Any = ""
+    last_fm_api_secret: Any = ""
+    auto_start: Any = ""
+    auto_start_delay: Any = ""
+    youtube_api_key: Any = ""
+    similar_artist_batch_size: Any = ""
+    openai_api_key: Any = ""
+    openai_model: Any = ""
+    openai_api_base: Any = ""
+    openai_extra_headers: Any = ""
+    openai_max_seed_artists: Any = ""
+    api_key: Any = ""
+
+    def __post_init__(self) -> None:
+        for name in _TUPLE_FIELDS:
+            object.__setattr__(self, name, _freeze(name, getattr(self, name)))
+
+    def with_changes(self, changes: Mapping[str, Any]) -> "SettingsSnapshot":
+        """Return a new snapshot (next version) with ``changes`` applied, or ``self`` if nothing differs."""
+        unknown = set(changes).difference(SETTINGS_FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown settings: {', '.join(sorted(unknown))}")
+        effective = {
+            name: _freeze(name, value)
+            for name, value in changes.items()
+            if getattr(self, name) != _freeze(name, value)
+        }
+        if not effective:
+            return self
+        return dataclasses.replace(self, version=self.version + 1, **effective)
+
+    def changed_fields(self, previous: "SettingsSnapshot") -> FrozenSet[str]:
+        return frozenset(name for name in SETTINGS_FIELDS if getattr(self, name) != getattr(previous, name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            name: list(value) if name in _TUPLE_FIELDS and isinstance(value, tuple) else value
+            for name in SETTINGS_FIELDS
+            for value in (getattr(self, name),)
+        }
+
+
+class SettingsField:
+    """Expose one snapshot field as an owner attribute; assignment publishes a new snapshot.
+
+    The owner provides ``settings`` and ``_publish_settings(changes)``. Declared in the owner's
+    class body, the field takes its name from the attribute it is assigned to.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self.name = name
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = getattr(obj.settings, self.name)
+        if self.name in _TUPLE_FIELDS and isinstance(value, tuple):
+            return list(value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj._publish_settings({self.name: value})
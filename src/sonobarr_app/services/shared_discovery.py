@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import hashlib
+from typing import List, Sequence
+
+
+def discovery_key(kind: str, parts: Sequence[str]) -> str:
+    """Stable identifier for a discovery run (seed selection, prompt, or personal source)."""
+    normalized = "\n".join(sorted(" ".join(str(part).lower().split()) for part in parts))
+    return hashlib.sha1(f"{kind}\n{normalized}".encode("utf-8")).hexdigest()[:16]
+
+
+class SharedDiscovery:
+    """One discovery run computed by a leader session and mirrored to the user's other tabs.
+
+    Every member socket joins :attr:`room`, so streamed cards and completion events reach all tabs
+    while only the leader fetches from Last.fm.
+    """
+
+    __slots__ = ("user_id", "key", "room", "leader_sid", "members")
+
+    def __init__(self, user_id: int, key: str, leader_sid: str) -> None:
+        self.user_id = user_id
+        self.key = key
+        self.room = f"user:{user_id}:discovery:{key}"
+        self.leader_sid = leader_sid
+        self.members: List[str] = [leader_sid]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from unidecode import unidecode
+
+SimilarArtists = List[Tuple[str, Optional[float]]]
+
+
+class SimilarArtistCache:
+    """Bounded TTL cache of Last.fm ``artist.getSimilar`` answers as ``(name, match)`` pairs.
+
+    Shared by similar-artist discovery and Last.fm personal recommendations, so an artist's
+    neighbours are fetched once per TTL whichever feature asks first. Failed lookups are never
+    cached; a TTL or size of 0 disables caching.
+    """
+
+    def __init__(self, *, ttl_seconds: float = 86400, max_entries: int = 2000) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds or 0))
+        self.max_entries = max(0, int(max_entries or 0))
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[Tuple[str, Optional[float]], ...]]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def key(artist_name: str) -> str:
+        return unidecode(artist_name or "").strip().lower()
+
+    def get(self, artist_name: str) -> Optional[SimilarArtists]:
+        if not self.enabled:
+            return None
+        key = self.key(artist_name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return list(entry[1])
+
+    def put(self, artist_name: str, similar: Sequence[Tuple[str, Optional[float]]]) -> None:
+        if not self.enabled:
+            return
+        key = self.key(artist_name)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, tuple(similar))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, **self._stats}
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from unidecode import unidecode
+
+DEFAULT_TAG_INDEX_MAX_ARTISTS = 20000
+MIN_TAG_WEIGHT = 10
+MAX_TAGS_PER_ARTIST = 15
+_MAX_TAG_WORDS = 4
+
+_WORD_SPLIT = re.compile(r"[^a-z0-9']+")
+# Words that may surround tags in a plain genre request without making it free-form.
+_FILLER_WORDS = frozenset(
+    {"a", "and", "artist", "artists", "band", "bands", "like", "more", "music", "or", "some", "songs", "stuff", "with"}
+)
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in _WORD_SPLIT.split(unidecode(text or "").lower()) if word]
+
+
+def tag_key(tag: str) -> str:
+    """Spelling-insensitive tag key, so "Post-Rock", "post rock" and "postrock" match."""
+    return "".join(_words(tag))
+
+
+class TagIndex:
+    """In-memory inverted index from Last.fm tags to artists, filled as artist cards are hydrated.
+
+    Each artist keeps its strongest top tags with their Last.fm weights (0-100); re-hydrating an
+    artist replaces its tags. The least recently indexed artists are dropped once ``max_artists``
+    is reached.
+    """
+
+    def __init__(self, *, max_artists: int = DEFAULT_TAG_INDEX_MAX_ARTISTS) -> None:
+        self.max_artists = max(0, int(max_artists or 0))
+        self._lock = threading.Lock()
+        self._artists: "OrderedDict[str, Tuple[str, Dict[str, int]]]" = OrderedDict()
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._stats = {"hits": 0, "misses": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_artists > 0
+
+    @staticmethod
+    def artist_key(name: str) -> str:
+        return unidecode(name or "").strip().lower()
+
+    def add(self, artist: str, tags: Iterable[Tuple[str, Any]]) -> None:
+        """Index ``artist`` under its ``(tag, weight)`` pairs, keeping the strongest ones."""
+        key = self.artist_key(artist)
+        if not self.enabled or not key:
+            return
+        weights: Dict[str, int] = {}
+        for tag, weight in tags:
+            try:
+                weight = int(weight)
+            except (TypeError, ValueError):
+                continue
+            normalized = tag_key(str(tag))
+            if normalized and weight >= MIN_TAG_WEIGHT and weight > weights.get(normalized, -1):
+                weights[normalized] = weight
+        strongest = dict(sorted(weights.items(), key=lambda item: -item[1])[:MAX_TAGS_PER_ARTIST])
+        with self._lock:
+            self._remove_locked(key)
+            if not strongest:
+                return
+            self._artists[key] = (artist.strip(), strongest)
+            for tag, weight in strongest.items():
+                self._postings.setdefault(tag, {})[key] = weight
+            while len(self._artists) > self.max_artists:
+                self._remove_locked(next(iter(self._artists)))
+
+    def match(self, query: str) -> Optional[List[str]]:
+        """Split a prompt into known tag keys, or return None when it is more than a tag request.
+
+        Words are matched greedily against the longest known tag (up to four words, so
+        "female fronted synth pop" finds "femalefronted" and "synthpop"); filler words such as
+        "music" or "and" are ignored, and any other unknown word makes the prompt free-form.
+        """
+        words = _words(query)
+        tags: List[str] = []
+        position = 0
+        with self._lock:
+            while position < len(words):
+                for end in range(min(len(words), position + _MAX_TAG_WORDS), position, -1):
+                    candidate = "".join(words[position:end])
+                    if candidate in self._postings:
+                        if candidate not in tags:
+                            tags.append(candidate)
+                        position = end
+                        break
+                else:
+                    if words[position] not in _FILLER_WORDS:
+                        return None
+                    position += 1
+        return tags or None
+
+    def artists(
+        self,
+        tags: Sequence[str],
+        *,
+        limit: int,
+        exclude: Optional[Callable[[str], bool]] = None,
+    ) -> List[str]:
+        """Artists tagged with every one of ``tags``, strongest combined tag weight first."""
+        with self._lock:
+            postings = [self._postings.get(tag, {}) for tag in tags]
+            if not postings or not all(postings):
+                return []
+            candidates = set.intersection(*(set(posting) for posting in postings))
+            ranked = sorted(
+                candidates,
+                key=lambda key: (-sum(posting[key] for posting in postings), key),
+            )
+            names = [self._artists[key][0] for key in ranked]
+        results: List[str] = []
+        for name in names:
+            if exclude is not None and exclude(name):
+                continue
+            results.append(name)
+            if len(results) >= limit:
+                break
+        return results
+
+    def lookup(
+        self,
+        query: str,
+        *,
+        limit: int,
+        exclude: Optional[Callable[[str], bool]] = None,
+    ) -> List[str]:
+        """Answer a plain tag prompt with up to ``limit`` artists; empty unless ``limit`` were found."""
+        tags = self.match(query)
+        results = self.artists(tags, limit=limit, exclude=exclude) if tags else []
+        if len(results) < limit:
+            results = []
+        with self._lock:
+            self._stats["hits" if results else "misses"] += 1
+        return results
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {"artists": len(self._artists), "tags": len(self._postings), **self._stats}
+
+    def _remove_locked(self, key: str) -> None:
+        entry = self._artists.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[1]:
+            posting = self._postings.get(tag)
+            if posting is None:
+                continue
+            posting.pop(key, None)
+            if not posting:
+                del self._postings[tag]
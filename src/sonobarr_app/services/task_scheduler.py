@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_PREVIEW = 1
+PRIORITY_ADD = 2
+PRIORITY_PREFETCH = 3
+PRIORITY_MAINTENANCE = 4
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_PREVIEW: "preview",
+    PRIORITY_ADD: "add",
+    PRIORITY_PREFETCH: "prefetch",
+    PRIORITY_MAINTENANCE: "maintenance",
+}
+
+SYSTEM_OWNER = "system"
+
+
+class _Task:
+    __slots__ = ("seq", "owner", "priority", "key", "func", "args", "enqueued_at")
+
+    def __init__(
+        self,
+        seq: int,
+        owner: str,
+        priority: int,
+        key: Optional[str],
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+    ) -> None:
+        self.seq = seq
+        self.owner = owner
+        self.priority = priority
+        self.key = key
+        self.func = func
+        self.args = args
+        self.enqueued_at = time.monotonic()
+
+
+class TaskScheduler:
+    """Bounded, fair dispatcher for background work triggered by socket events.
+
+    At most ``max_concurrent`` tasks run at once and each owner (a user, or a socket for anonymous
+    work) runs at most ``per_owner_limit`` of them per priority class, so long discoveries never
+    hold up the same user's previews or adds. Higher priority classes are dispatched first and
+    owners at their limit are skipped so one busy user cannot starve the rest. Submissions sharing a
+    debounce ``key`` are collapsed: an identical repeat inside ``debounce_seconds`` is dropped, and a
+    newer submission replaces the arguments of one that is still queued (latest wins).
+    """
+
+    def __init__(
+        self,
+        socketio,
+        *,
+        max_concurrent: int = 16,
+        per_owner_limit: int = 2,
+        max_queued_per_owner: int = 20,
+        debounce_seconds: float = 0.25,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.socketio = socketio
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.per_owner_limit = max(1, int(per_owner_limit))
+        self.max_queued_per_owner = max(1, int(max_queued_per_owner))
+        self.debounce_seconds = max(0.0, float(debounce_seconds))
+        self.logger = logger or logging.getLogger("sonobarr")
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._queues: Dict[int, Deque[_Task]] = {priority: deque() for priority in PRIORITY_NAMES}
+        self._queued_by_key: Dict[Tuple[str, str], _Task] = {}
+        self._queued_per_owner: Dict[str, int] = {}
+        self._running_per_owner: Dict[Tuple[str, int], int] = {}
+        self._last_submit: Dict[Tuple[str, str], Tuple[float, Tuple[Any, ...]]] = {}
+        self._running = 0
+        self._stats = {
+            "submitted": 0,
+            "debounced": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+        self._max_wait = 0.0
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        owner: str,
+        priority: int = PRIORITY_INTERACTIVE,
+        key: Optional[str] = None,
+    ) -> bool:
+        """Queue ``func(*args)`` for ``owner``; returns False when debounced or rejected."""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown task priority: {priority}")
+        owner = str(owner or SYSTEM_OWNER)
+        now = time.monotonic()
+        with self._lock:
+            debounce_key = (owner, key) if key else None
+            if debounce_key is not None:
+                if len(self._last_submit) > 1024:
+                    self._prune_last_submit_locked(now)
+                previous = self._last_submit.get(debounce_key)
+                self._last_submit[debounce_key] = (now, args)
+                if previous is not None and previous[1] == args and now - previous[0] < self.debounce_seconds:
+                    self._stats["debounced"] += 1
+                    return False
+                pending = self._queued_by_key.get(debounce_key)
+                if pending is not None:
+                    pending.func = func
+                    pending.args = args
+                    self._stats["debounced"] += 1
+                    return False
+            if self._queued_per_owner.get(owner, 0) >= self.max_queued_per_owner:
+                self._stats["rejected"] += 1
+                self.logger.warning("Task queue full for %s; dropping %s", owner, getattr(func, "__name__", func))
+                return False
+            task = _Task(next(self._seq), owner, priority, key, func, args)
+            self._queues[priority].append(task)
+            self._queued_per_owner[owner] = self._queued_per_owner.get(owner, 0) + 1
+            if debounce_key is not None:
+                self._queued_by_key[debounce_key] = task
+            self._stats["submitted"] += 1
+            ready = self._take_ready_locked()
+        self._spawn(ready)
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._running,
+                "queued": {PRIORITY_NAMES[priority]: len(queue) for priority, queue in self._queues.items()},
+                "owners_running": len({owner for owner, _ in self._running_per_owner}),
+                "max_concurrent": self.max_concurrent,
+                "per_owner_limit": self.per_owner_limit,
+                "max_wait_seconds": round(self._max_wait, 3),
+                **self._stats,
+            }
+
+    def _prune_last_submit_locked(self, now: float) -> None:
+        stale = [key for key, (at, _) in self._last_submit.items() if now - at >= self.debounce_seconds]
+        for key in stale:
+            del self._last_submit[key]
+
+    def _take_ready_locked(self) -> List[_Task]:
+        ready: List[_Task] = []
+        while self._running < self.max_concurrent:
+            task = self._next_eligible_locked()
+            if task is None:
+                break
+            self._mark_running_locked(task)
+            ready.append(task)
+        return ready
+
+    def _next_eligible_locked(self) -> Optional[_Task]:
+        for priority in sorted(self._queues):
+            queue = self._queues[priority]
+            for index, task in enumerate(queue):
+                if self._running_per_owner.get((task.owner, priority), 0) >= self.per_owner_limit:
+                    continue
+                del queue[index]
+                return task
+        return None
+
+    def _mark_running_locked(self, task: _Task) -> None:
+        remaining = self._queued_per_owner.get(task.owner, 1) - 1
+        if remaining > 0:
+            self._queued_per_owner[task.owner] = remaining
+        else:
+            self._queued_per_owner.pop(task.owner, None)
+        if task.key:
+            self._queued_by_key.pop((task.owner, task.key), None)
+        slot = (task.owner, task.priority)
+        self._running_per_owner[slot] = self._running_per_owner.get(slot, 0) + 1
+        self._running += 1
+        self._max_wait = max(self._max_wait, time.monotonic() - task.enqueued_at)
+
+    def _spawn(self, tasks: List[_Task]) -> None:
+        for task in tasks:
+            self.socketio.start_background_task(self._run, task)
+
+    def _run(self, task: _Task) -> None:
+        failed = False
+        try:
+            task.func(*task.args)
+        except Exception:  # pragma: no cover - defensive background guard
+            failed = True
+            self.logger.exception("Background task %s failed", getattr(task.func, "__name__", task.func))
+        finally:
+            with self._lock:
+                self._running -= 1
+                slot = (task.owner, task.priority)
+                remaining = self._running_per_owner.get(slot, 1) - 1
+                if remaining > 0:
+                    self._running_per_owner[slot] = remaining
+                else:
+                    self._running_per_owner.pop(slot, None)
+                self._stats["failed" if failed else "completed"] += 1
+                ready = self._take_ready_locked()
+            self._spawn(ready)
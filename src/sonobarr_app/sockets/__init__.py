@@ -8,6 +8,8 @@ from flask import request
 from flask_login import current_user
 from flask_socketio import SocketIO, disconnect
 
+from ..services.task_scheduler import PRIORITY_ADD, PRIORITY_INTERACTIVE, PRIORITY_PREVIEW
+
 
 def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOSONAR
     """Register Socket.IO handlers for authenticated Sonobarr user sessions."""
@@ -24,6 +26,18 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
 
         return wrapped
 
+    def _schedule(func, *args, priority: int = PRIORITY_INTERACTIVE, key: str | None = None) -> None:
+        """Hand socket-triggered work to the shared scheduler, owned by the current user."""
+        identifier = current_user.get_id()
+        owner = f"user:{identifier}" if identifier is not None else f"sid:{request.sid}"
+        data_handler.task_scheduler.submit(
+            func,
+            *args,
+            owner=owner,
+            priority=priority,
+            key=f"{key}:{request.sid}" if key else None,
+        )
+
     @socketio.on("connect")
     def handle_connect(auth=None):
         if not current_user.is_authenticated:
@@ -34,11 +48,18 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
             user_id = int(identifier) if identifier is not None else None
         except (TypeError, ValueError):
             user_id = None
+        auth = auth if isinstance(auth, dict) else {}
+        try:
+            known_cards = max(0, int(auth.get("card_count") or 0))
+        except (TypeError, ValueError):
+            known_cards = 0
         data_handler.connection(
             sid,
             user_id,
             current_user.is_admin,
             getattr(current_user, "auto_approve_artist_requests", False),
+            resume_token=str(auth.get("resume_token") or "") or None,
+            known_cards=known_cards,
         )
 
     @socketio.on("disconnect")
@@ -50,12 +71,17 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
     def handle_side_bar_opened():
         data_handler.side_bar_opened(request.sid)
 
+    @socketio.on("sidebar_resync")
+    @_require_authenticated
+    def handle_sidebar_resync():
+        data_handler.resync_sidebar(request.sid)
+
     @socketio.on("get_lidarr_artists")
     @_require_authenticated
     def handle_get_lidarr_artists():
         sid = request.sid
 
-        socketio.start_background_task(data_handler.get_artists_from_lidarr, sid)
+        _schedule(data_handler.get_artists_from_lidarr, sid, key="lidarr_artists")
 
     @socketio.on("start_req")
     @_require_authenticated
@@ -63,17 +89,19 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
         sid = request.sid
         selected = list(selected_artists or [])
 
-        socketio.start_background_task(data_handler.start, sid, selected)
+        _schedule(data_handler.start, sid, selected, key="discovery")
 
     @socketio.on("ai_prompt_req")
     @_require_authenticated
     def handle_ai_prompt(payload: Any):
         sid = request.sid
+        refresh = False
         if isinstance(payload, dict):
             prompt = payload.get("prompt", "")
+            refresh = bool(payload.get("refresh", False))
         else:
             prompt = str(payload or "")
-        socketio.start_background_task(data_handler.ai_prompt, sid, prompt)
+        _schedule(data_handler.ai_prompt, sid, prompt, refresh, key="discovery")
 
     @socketio.on("personal_sources_poll")
     @_require_authenticated
@@ -88,7 +116,7 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
             source = payload.get("source", "")
         else:
             source = str(payload or "")
-        socketio.start_background_task(data_handler.personal_recommendations, sid, source)
+        _schedule(data_handler.personal_recommendations, sid, source, key="discovery")
 
     @socketio.on("stop_req")
     @_require_authenticated
@@ -99,19 +127,30 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
     @_require_authenticated
     def handle_load_more():
         sid = request.sid
-        socketio.start_background_task(data_handler.find_similar_artists, sid)
+        _schedule(data_handler.find_similar_artists, sid, key="load_more")
 
     @socketio.on("adder")
     @_require_authenticated
     def handle_add_artist(raw_artist_name: str):
+        data_handler.enqueue_artist_addition(request.sid, raw_artist_name)
+
+    @socketio.on("bulk_add")
+    @_require_authenticated
+    def handle_bulk_add(payload: Any):
         sid = request.sid
-        socketio.start_background_task(data_handler.add_artists, sid, raw_artist_name)
+        if isinstance(payload, dict):
+            artists = payload.get("artists") or []
+        else:
+            artists = payload or []
+        if not isinstance(artists, list):
+            artists = [artists]
+        _schedule(data_handler.bulk_add_artists, sid, artists, priority=PRIORITY_ADD, key="bulk_add")
 
     @socketio.on("request_artist")
     @_require_authenticated
     def handle_request_artist(raw_artist_name: str):
         sid = request.sid
-        socketio.start_background_task(data_handler.request_artist, sid, raw_artist_name)
+        _schedule(data_handler.request_artist, sid, raw_artist_name, priority=PRIORITY_ADD)
 
     @socketio.on("load_settings")
     @_require_authenticated
@@ -170,4 +209,4 @@ def register_socketio_handlers(socketio: SocketIO, data_handler) -> None:  # NOS
     @_require_authenticated
     def handle_prehear(raw_artist_name: str):
         sid = request.sid
-        socketio.start_background_task(data_handler.prehear, sid, raw_artist_name)
+        _schedule(data_handler.prehear, sid, raw_artist_name, priority=PRIORITY_PREVIEW, key="prehear")
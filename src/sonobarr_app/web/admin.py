@@ -9,6 +9,7 @@ from flask_login import current_user, login_required
 
 from ..extensions import db
 from ..models import User, ArtistRequest
+from ..services.data_handler import SERVICE_SESSION_PREFIX
 
 
 bp = Blueprint("admin", __name__, url_prefix="/admin")
@@ -166,7 +167,7 @@ def _approve_artist_request(artist_request: ArtistRequest):
         flash(f"Failed to add '{artist_request.artist_name}' to Lidarr. Request not approved.", "danger")
         return
 
-    session_key = f"admin_{current_user.id}"
+    session_key = f"{SERVICE_SESSION_PREFIX}{current_user.id}"
     data_handler.ensure_session(session_key, current_user.id, True)
     result_status = data_handler.add_artists(session_key, artist_request.artist_name)
     if result_status != "Added":
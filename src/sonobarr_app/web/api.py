@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 from flask import Blueprint, current_app, jsonify, request, redirect
 from flask_login import current_user
 
-from ..extensions import db
+from ..extensions import csrf, db
 from ..models import ArtistRequest, User
 
 
@@ -13,6 +13,7 @@ bp = Blueprint("api", __name__, url_prefix="/api")
 
 _ERROR_KEY_INVALID = {"error": "Invalid API key"}
 _ERROR_INTERNAL = {"error": "Internal server error"}
+_ERROR_KEY_REQUIRED = {"error": "An API key must be configured to accept webhooks"}
 
 
 def _normalize_api_key(key_value):
@@ -105,6 +106,79 @@ def status():
               properties:
                 lidarr_connected:
                   type: boolean
+            sessions:
+              type: object
+              description: Socket session counts and estimated memory for capacity planning
+              properties:
+                active:
+                  type: integer
+                service:
+                  type: integer
+                detached:
+                  type: integer
+                running:
+                  type: integer
+                reaped_total:
+                  type: integer
+                cards:
+                  type: integer
+                candidates:
+                  type: integer
+                estimated_bytes:
+                  type: integer
+            llm_cache:
+              type: object
+              description: LLM seed answer cache occupancy and hit counters
+              properties:
+                entries:
+                  type: integer
+                hits:
+                  type: integer
+                misses:
+                  type: integer
+            tag_index:
+              type: object
+              description: Local tag-to-artist index size and AI prompts it answered without the LLM
+              properties:
+                artists:
+                  type: integer
+                tags:
+                  type: integer
+                hits:
+                  type: integer
+                misses:
+                  type: integer
+            tasks:
+              type: object
+              description: Background task scheduler load and queue depth per priority class
+              properties:
+                running:
+                  type: integer
+                queued:
+                  type: object
+                  properties:
+                    interactive:
+                      type: integer
+                    add:
+                      type: integer
+                    prefetch:
+                      type: integer
+                    maintenance:
+                      type: integer
+                owners_running:
+                  type: integer
+                max_wait_seconds:
+                  type: number
+                submitted:
+                  type: integer
+                debounced:
+                  type: integer
+                rejected:
+                  type: integer
+                completed:
+                  type: integer
+                failed:
+                  type: integer
       401:
         description: Missing or invalid API key
       500:
@@ -120,10 +194,22 @@ def status():
         data_handler = current_app.extensions.get("data_handler")
         lidarr_connected = False
         llm_connected = False
+        session_metrics = {}
+        task_metrics = {}
+        llm_cache_metrics = {}
+        tag_index_metrics = {}
         if data_handler:
             # Simple check - if we have cached Lidarr data, assume connected
             lidarr_connected = bool(data_handler.cached_lidarr_names)
             llm_connected = bool(getattr(data_handler, "openai_recommender", None))
+            if hasattr(data_handler, "session_metrics"):
+                session_metrics = data_handler.session_metrics()
+            if hasattr(data_handler, "task_scheduler"):
+                task_metrics = data_handler.task_scheduler.metrics()
+            if hasattr(data_handler, "ai_seed_cache"):
+                llm_cache_metrics = data_handler.ai_seed_cache.metrics()
+            if hasattr(data_handler, "tag_index"):
+                tag_index_metrics = data_handler.tag_index.metrics()
 
         return jsonify(
             {
@@ -135,6 +221,10 @@ def status():
                     "lidarr_connected": lidarr_connected,
                     "llm_connected": llm_connected,
                 },
+                "sessions": session_metrics,
+                "tasks": task_metrics,
+                "llm_cache": llm_cache_metrics,
+                "tag_index": tag_index_metrics,
             }
         )
     except Exception as e:
@@ -337,3 +427,69 @@ def stats():
     except Exception as e:
         current_app.logger.error(f"API stats error: {e}")
         return jsonify(_ERROR_INTERNAL), 500
+
+
+@bp.route("/webhooks/lidarr", methods=["POST"])
+@csrf.exempt
+@api_key_required
+def lidarr_webhook():
+    """Receive Lidarr artist add/delete events to keep the library cache current
+    ---
+    tags:
+      - Webhooks
+    security:
+      - ApiKeyAuth: []
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: payload
+        required: true
+        description: Lidarr webhook payload (ArtistAdd, ArtistDelete and Test events are handled)
+        schema:
+          type: object
+          properties:
+            eventType:
+              type: string
+              example: ArtistAdd
+            artist:
+              type: object
+              properties:
+                name:
+                  type: string
+    responses:
+      200:
+        description: Event processed
+        schema:
+          type: object
+          properties:
+            event:
+              type: string
+            result:
+              type: string
+              enum: [added, removed, unchanged, test, ignored]
+      400:
+        description: Payload is not a JSON object
+      401:
+        description: Missing or invalid API key
+      403:
+        description: No API key configured on this server
+      500:
+        description: Internal server error
+    """
+    if not _configured_api_key():
+        return jsonify(_ERROR_KEY_REQUIRED), 403
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        return jsonify({"error": "Expected a JSON object"}), 400
+
+    data_handler = current_app.extensions.get("data_handler")
+    if data_handler is None:
+        return jsonify(_ERROR_INTERNAL), 500
+    try:
+        result = data_handler.apply_lidarr_webhook(payload)
+    except Exception as e:
+        current_app.logger.error(f"API lidarr webhook error: {e}")
+        return jsonify(_ERROR_INTERNAL), 500
+    return jsonify({"event": payload.get("eventType"), "result": result})
@@ -7,6 +7,7 @@ let start_stop_button = document.getElementById('start-stop-button');
 let lidarr_status = document.getElementById('lidarr-status');
 let lidarr_spinner = document.getElementById('lidarr-spinner');
 let load_more_button = document.getElementById('load-more-btn');
+let bulk_add_button = document.getElementById('bulk-add-btn');
 let header_spinner = document.getElementById('artists-loading-spinner');
 
 let lidarr_item_list = document.getElementById('lidarr-item-list');
@@ -134,10 +135,34 @@ const ai_helper_submit = document.getElementById('ai-helper-submit');
 const ai_helper_spinner = document.getElementById('ai-helper-spinner');
 
 let lidarr_items = [];
+let lidarr_sidebar_version = null;
+let lidarr_item_counter = 0;
 let is_admin = false;
 let can_add_without_approval = false;
+const RESUME_TOKEN_KEY = 'sonobarr_resume_token';
 let socket = io({
 	withCredentials: true,
+	// Re-evaluated on every (re)connect so the server can resume this tab's session.
+	auth: function (cb) {
+		let resume_token = null;
+		try {
+			resume_token = globalThis.sessionStorage.getItem(RESUME_TOKEN_KEY);
+		} catch (err) {
+			resume_token = null;
+		}
+		cb({
+			resume_token: resume_token,
+			card_count: document.querySelectorAll('#artist-column').length,
+		});
+	},
+});
+
+socket.on('session_token', function (data) {
+	try {
+		globalThis.sessionStorage.setItem(RESUME_TOKEN_KEY, data.token);
+	} catch (err) {
+		// Storage unavailable (private mode); the server falls back to the user id.
+	}
 });
 
 let personalSourcesState = null;
@@ -646,6 +671,30 @@ function remove_load_more_button() {
 	load_more_button.disabled = false;
 }
 
+/**
+ * Collect visible cards whose add/request button can still be used.
+ * @returns {Array<{name: string, button: Element}>}
+ */
+function collect_actionable_cards() {
+	let actionable = [];
+	document.querySelectorAll('#artist-column').forEach(function (card) {
+		let titleEl = card.querySelector('.card-title');
+		let add_button = card.querySelector('.add-to-lidarr-btn');
+		if (titleEl && add_button && !add_button.disabled) {
+			actionable.push({ name: titleEl.textContent.trim(), button: add_button });
+		}
+	});
+	return actionable;
+}
+
+function update_bulk_add_button() {
+	if (!bulk_add_button) return;
+	let count = collect_actionable_cards().length;
+	bulk_add_button.classList.toggle('d-none', count === 0);
+	let verb = can_add_without_approval ? 'Add' : 'Request';
+	bulk_add_button.textContent = `${verb} all visible (${count})`;
+}
+
 /**
  * Resolve a similarity label for an artist payload.
  * @param {Object} artist
@@ -741,6 +790,15 @@ function apply_artist_status(add_button, statusDot, status, idleText, resetLoadi
 		add_button.classList.add('btn-warning');
 		add_button.disabled = true;
 		add_button.textContent = 'Pending Approval';
+	} else if (
+		status === 'Queued' ||
+		status === 'Resolving' ||
+		status === 'Adding'
+	) {
+		add_button.disabled = true;
+		add_button.innerHTML =
+			'<span class="spinner-border spinner-border-sm me-1" role="status" aria-hidden="true"></span>';
+		add_button.append(`${status}...`);
 	} else if (
 		status === 'Failed to Add' ||
 		status === 'Invalid Path' ||
@@ -824,6 +882,7 @@ function append_artists(artists) {
 	if (initialLoadComplete) {
 		create_load_more_button();
 	}
+	update_bulk_add_button();
 }
 
 // Remove infinite scroll triggers
@@ -867,6 +926,35 @@ function request_artist(artist_name, buttonEl) {
 	}
 }
 
+function bulk_add_visible() {
+	if (!socket.connected) {
+		show_toast('Connection Lost', 'Please reload to continue.');
+		return;
+	}
+	let actionable = collect_actionable_cards();
+	if (actionable.length === 0) {
+		return;
+	}
+	let label = can_add_without_approval ? 'Adding...' : 'Requesting...';
+	actionable.forEach(function (entry) {
+		entry.button.disabled = true;
+		entry.button.innerHTML =
+			'<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span>';
+		entry.button.append(label);
+		entry.button.dataset.loading = 'true';
+	});
+	socket.emit('bulk_add', {
+		artists: actionable.map(function (entry) {
+			return encodeURIComponent(entry.name);
+		}),
+	});
+	update_bulk_add_button();
+}
+
+if (bulk_add_button) {
+	bulk_add_button.addEventListener('click', bulk_add_visible);
+}
+
 function show_toast(header, message) {
 	let toast_container = document.querySelector('.toast-container');
 	let toast_template = document
@@ -1204,44 +1292,121 @@ if (lidarr_sidebar) {
 	});
 }
 
-socket.on('lidarr_sidebar_update', (response) => {
-	if (response.Status == 'Success') {
-		lidarr_status.textContent = 'Lidarr List Retrieved';
-		lidarr_items = response.Data;
-		lidarr_item_list.innerHTML = '';
-		lidarr_select_all_container.classList.remove('d-none');
+/**
+ * Build one sidebar checkbox row for a Lidarr artist.
+ * @param {{name: string, checked: boolean}} item
+ * @returns {HTMLDivElement}
+ */
+function build_lidarr_item(item) {
+	let item_id = 'lidarr-' + lidarr_item_counter++;
 
-		for (let i = 0; i < lidarr_items.length; i++) {
-			let item = lidarr_items[i];
+	let div = document.createElement('div');
+	div.className = 'form-check';
+	div.dataset.name = item.name;
 
-			let div = document.createElement('div');
-			div.className = 'form-check';
+	let input = document.createElement('input');
+	input.type = 'checkbox';
+	input.className = 'form-check-input';
+	input.id = item_id;
+	input.name = 'lidarr-item';
+	input.value = item.name;
 
-			let input = document.createElement('input');
-			input.type = 'checkbox';
-			input.className = 'form-check-input';
-			input.id = 'lidarr-' + i;
-			input.name = 'lidarr-item';
-			input.value = item.name;
+	if (item.checked) {
+		input.checked = true;
+	}
 
-			if (item.checked) {
-				input.checked = true;
-			}
+	let label = document.createElement('label');
+	label.className = 'form-check-label';
+	label.htmlFor = item_id;
+	label.textContent = item.name;
 
-			let label = document.createElement('label');
-			label.className = 'form-check-label';
-			label.htmlFor = 'lidarr-' + i;
-			label.textContent = item.name;
+	input.addEventListener('change', function () {
+		check_if_all_selected();
+	});
 
-			input.addEventListener('change', function () {
-				check_if_all_selected();
-			});
+	div.appendChild(input);
+	div.appendChild(label);
+	return div;
+}
 
-			div.appendChild(input);
-			div.appendChild(label);
+function find_lidarr_item_row(name) {
+	let rows = lidarr_item_list.querySelectorAll('.form-check');
+	for (let row of rows) {
+		if (row.dataset.name === name) {
+			return row;
+		}
+	}
+	return null;
+}
+
+function render_lidarr_snapshot(items) {
+	lidarr_items = items;
+	lidarr_item_list.innerHTML = '';
+	lidarr_item_counter = 0;
+	for (let item of lidarr_items) {
+		lidarr_item_list.appendChild(build_lidarr_item(item));
+	}
+}
 
-			lidarr_item_list.appendChild(div);
+/**
+ * Patch the rendered sidebar with added/removed artists and checked-state changes.
+ * @param {Object} response
+ * @returns {void}
+ */
+function apply_lidarr_delta(response) {
+	let removed = new Set(response.Removed || []);
+	if (removed.size > 0) {
+		lidarr_items = lidarr_items.filter((item) => !removed.has(item.name));
+		removed.forEach(function (name) {
+			let row = find_lidarr_item_row(name);
+			if (row) {
+				row.remove();
+			}
+		});
+	}
+	(response.Added || []).forEach(function (item) {
+		let position = lidarr_items.findIndex(
+			(existing) => existing.name.toLowerCase() > item.name.toLowerCase()
+		);
+		let row = build_lidarr_item(item);
+		if (position === -1) {
+			lidarr_items.push(item);
+			lidarr_item_list.appendChild(row);
+		} else {
+			let next_row = find_lidarr_item_row(lidarr_items[position].name);
+			lidarr_items.splice(position, 0, item);
+			lidarr_item_list.insertBefore(row, next_row);
+		}
+	});
+	let set_checked = function (name, checked) {
+		let row = find_lidarr_item_row(name);
+		if (row) {
+			row.querySelector('input').checked = checked;
 		}
+		let item = lidarr_items.find((existing) => existing.name === name);
+		if (item) {
+			item.checked = checked;
+		}
+	};
+	(response.Checked || []).forEach((name) => set_checked(name, true));
+	(response.Unchecked || []).forEach((name) => set_checked(name, false));
+}
+
+socket.on('lidarr_sidebar_update', (response) => {
+	if (response.Status == 'Success') {
+		if (response.Mode === 'delta') {
+			if (lidarr_sidebar_version !== response.BaseVersion) {
+				// Missed an update: ask for a fresh snapshot instead of patching stale state
+				socket.emit('sidebar_resync');
+				return;
+			}
+			apply_lidarr_delta(response);
+		} else {
+			render_lidarr_snapshot(response.Data || []);
+		}
+		lidarr_sidebar_version = response.Version ?? null;
+		lidarr_status.textContent = 'Lidarr List Retrieved';
+		lidarr_select_all_container.classList.remove('d-none');
 	} else {
 		lidarr_status.textContent = response.Code;
 	}
@@ -1276,25 +1441,35 @@ socket.on('refresh_artist', (artist) => {
 			);
 		}
 	});
+	update_bulk_add_button();
 });
 
-socket.on('more_artists_loaded', function (data) {
+socket.on('more_artists_loaded', function (data, ack) {
 	append_artists(data);
+	// The server requests acks when card flow control is enabled; confirm once rendered.
+	if (typeof ack === 'function') {
+		ack();
+	}
 });
 
+function render_ai_seed_list(seeds) {
+	if (!ai_helper_results) {
+		return;
+	}
+	let listItems = seeds
+		.map(function (seed) {
+			return `<li>${escape_html(seed)}</li>`;
+		})
+		.join('');
+	ai_helper_results.innerHTML = `<strong>AI picked these seed artists:</strong><ul class="mt-2 mb-0">${listItems}</ul>`;
+	ai_helper_results.classList.remove('d-none');
+}
+
 socket.on('ai_prompt_ack', function (payload) {
 	set_ai_form_loading(false);
 	let seeds = Array.isArray(payload?.seeds) ? payload.seeds : [];
 	if (seeds.length > 0) {
-		let listItems = seeds
-			.map(function (seed) {
-				return `<li>${escape_html(seed)}</li>`;
-			})
-			.join('');
-		if (ai_helper_results) {
-			ai_helper_results.innerHTML = `<strong>AI picked these seed artists:</strong><ul class="mt-2 mb-0">${listItems}</ul>`;
-			ai_helper_results.classList.remove('d-none');
-		}
+		render_ai_seed_list(seeds);
 		show_toast(
 			'AI Discovery',
 			'Working from fresh seed artists suggested by the assistant.'
@@ -1306,6 +1481,14 @@ socket.on('ai_prompt_ack', function (payload) {
 	}
 });
 
+// Streamed AI answers acknowledge with the first seed; the full list follows once the answer completes.
+socket.on('ai_prompt_seeds', function (payload) {
+	let seeds = Array.isArray(payload?.seeds) ? payload.seeds : [];
+	if (seeds.length > 0) {
+		render_ai_seed_list(seeds);
+	}
+});
+
 socket.on('ai_prompt_error', function (payload) {
 	set_ai_form_loading(false);
 	let message = payload?.message || 'We could not complete the AI request right now.';
@@ -1387,11 +1570,12 @@ socket.on('new_toast_msg', function (data) {
 });
 
 socket.on('disconnect', function () {
-	show_toast('Connection Lost', 'Please reconnect to continue.');
+	// Cards stay on screen: the server resumes the session on reconnect and only replays what is missing.
+	show_toast('Connection Lost', 'Reconnecting...');
+	lidarr_sidebar_version = null;
 	hide_header_spinner();
 	personalSourcesState = null;
 	setPersonalDiscoveryLoading(null, false);
-	clear_all();
 });
 
 function clear_all() {
@@ -1401,6 +1585,7 @@ function clear_all() {
 		card.remove();
 	});
 	remove_load_more_button();
+	update_bulk_add_button();
 	initialLoadComplete = false;
 	initialLoadHasMore = false;
 	loadMorePending = false;
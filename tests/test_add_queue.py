@@ -0,0 +1,140 @@
+"""Tests for the durable Lidarr artist add queue."""
+
+from __future__ import annotations
+
+import logging
+
+from sonobarr_app.extensions import db
+from sonobarr_app.models import ArtistAddJob, User
+from sonobarr_app.services.add_queue import ADD_JOB_ADDING, ADD_JOB_QUEUED, ADD_JOB_RESOLVING
+from sonobarr_app.services.data_handler import DataHandler
+
+
+class _FakeSocketIO:
+    """Socket.IO test helper capturing emitted events and background tasks."""
+
+    def __init__(self):
+        self.events = []
+        self.tasks = []
+
+    def emit(self, event, payload=None, room=None):
+        self.events.append((event, dict(payload) if isinstance(payload, dict) else payload, room))
+
+    def start_background_task(self, func, *args):
+        self.tasks.append((func.__name__, args))
+        return None
+
+
+def _make_handler(app, tmp_path):
+    socketio = _FakeSocketIO()
+    handler = DataHandler(
+        socketio=socketio,
+        logger=logging.getLogger("test-add-queue"),
+        app_config={
+            "CONFIG_DIR": str(tmp_path / "config"),
+            "SETTINGS_FILE": str(tmp_path / "config" / "settings.json"),
+            "APP_VERSION": "test",
+            "LIDARR_ADD_INTERVAL_SECONDS": 0,
+        },
+    )
+    handler.set_flask_app(app)
+    return handler, socketio
+
+
+def _create_admin() -> int:
+    user = User(username="queue-admin", is_admin=True)
+    user.set_password("password123")
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+
+def test_queued_additions_stream_progress_and_persist_results(app, tmp_path):
+    """Queued jobs should report Queued/Resolving/Adding and record their final result."""
+
+    handler, socketio = _make_handler(app, tmp_path)
+    with app.app_context():
+        user_id = _create_admin()
+
+    session = handler.ensure_session("sid", user_id=user_id, is_admin=True)
+    session.recommended_artists = [
+        {"Name": "Artist One", "Status": ""},
+        {"Name": "Artist Two", "Status": ""},
+    ]
+    handler.add_queue.running = True  # pretend workers are up; jobs are drained manually below
+
+    def fake_perform(session, sid, artist_name, artist_folder, on_stage=None):
+        on_stage(ADD_JOB_RESOLVING)
+        if artist_name == "Artist Two":
+            return "Failed to Add"
+        on_stage(ADD_JOB_ADDING)
+        return "Added"
+
+    handler._perform_artist_addition = fake_perform
+    handler.enqueue_artist_addition("sid", "Artist%20One")
+    handler.enqueue_artist_addition("sid", "Artist%20Two")
+
+    assert handler.add_queue.counts()[ADD_JOB_QUEUED] == 2
+    assert handler.add_queue.run_pending() == 2
+    assert handler.add_queue.counts() == {ADD_JOB_QUEUED: 0, ADD_JOB_RESOLVING: 0, ADD_JOB_ADDING: 0}
+
+    statuses = [payload["Status"] for event, payload, _ in socketio.events if event == "refresh_artist" and payload["Name"] == "Artist One"]
+    assert statuses == ["Queued", "Resolving", "Adding", "Added"]
+
+    with app.app_context():
+        jobs = {job.artist_name: job for job in ArtistAddJob.query.all()}
+        assert jobs["Artist One"].status == "added"
+        assert jobs["Artist Two"].status == "failed"
+        assert jobs["Artist Two"].result == "Failed to Add"
+        assert jobs["Artist One"].attempts == 1
+
+
+def test_start_requeues_interrupted_jobs_and_spawns_workers(app, tmp_path):
+    """Jobs left in flight by a restart should be requeued when the queue starts."""
+
+    handler, socketio = _make_handler(app, tmp_path)
+    with app.app_context():
+        db.session.add(ArtistAddJob(artist_name="Interrupted", status=ADD_JOB_ADDING))
+        db.session.commit()
+
+    handler.add_queue.start()
+
+    assert handler.add_queue.running is True
+    assert [name for name, _ in socketio.tasks] == ["_worker_loop"]
+    assert handler.add_queue.counts()[ADD_JOB_QUEUED] == 1
+
+
+def test_wait_for_returns_results_of_jobs_finished_before_waiting(app, tmp_path):
+    """A tracked job finished before wait_for is called should still report its result."""
+
+    handler, _ = _make_handler(app, tmp_path)
+    handler.add_queue.running = True
+    handler.run_add_job = lambda artist_name, user_id, sid, on_stage=None: "Added"
+
+    tracked, untracked = handler.add_queue.enqueue_many(["Fast", "Other"], user_id=None, sid=None, track=True)
+    assert handler.add_queue.run_pending() == 2
+    handler.add_queue._waiters.pop(untracked)
+    handler.add_queue._results.pop(untracked)
+
+    assert handler.add_queue.wait_for(tracked, timeout=0) == "Added"
+    assert handler.add_queue.wait_for(untracked, timeout=0) == "Added"
+    assert handler.add_queue.wait_for(9999, timeout=0) is None
+
+
+def test_queued_status_is_sent_before_jobs_become_claimable(app, tmp_path, monkeypatch):
+    """"Queued" must go out before the commit, so it cannot overwrite a worker's later status."""
+
+    handler, socketio = _make_handler(app, tmp_path)
+    order = []
+    handler.notify_artist_status = lambda user_id, sid, artist_name, status: order.append(status)
+    commit = db.session.commit
+
+    def recording_commit():
+        order.append("commit")
+        commit()
+
+    with app.app_context():
+        monkeypatch.setattr(db.session, "commit", recording_commit)
+        handler.add_queue.enqueue_many(["Early", "Late"], user_id=None, sid=None)
+
+    assert order == ["Queued", "Queued", "commit"]
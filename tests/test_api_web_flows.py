@@ -328,3 +328,44 @@ def test_api_helpers_and_error_responses(app, client, monkeypatch):
     stats_error = client.get("/api/stats", headers={"X-API-Key": "k"})
     assert stats_error.status_code == 500
     assert stats_error.json["error"] == "Internal server error"
+
+
+def test_lidarr_webhook_updates_library_index(app, client, tmp_path, monkeypatch):
+    """The Lidarr webhook should require a configured key and apply artist add/delete events."""
+
+    from sonobarr_app.services.data_handler import DataHandler
+
+    data_handler = DataHandler(
+        socketio=SimpleNamespace(emit=lambda *args, **kwargs: None),
+        logger=None,
+        app_config={"CONFIG_DIR": str(tmp_path / "config"), "SETTINGS_FILE": str(tmp_path / "config" / "s.json")},
+    )
+    monkeypatch.setitem(app.extensions, "data_handler", data_handler)
+    app.config["API_KEY"] = ""
+    data_handler.api_key = ""
+    unconfigured = client.post("/api/webhooks/lidarr", json={"eventType": "Test"})
+    assert unconfigured.status_code == 403
+
+    app.config["API_KEY"] = "hook-key"
+    assert client.post("/api/webhooks/lidarr", json={"eventType": "Test"}).status_code == 401
+    bad_body = client.post("/api/webhooks/lidarr?api_key=hook-key", data="nope", content_type="text/plain")
+    assert bad_body.status_code == 400
+
+    data_handler.cached_lidarr_names = ["Existing Artist"]
+    added = client.post(
+        "/api/webhooks/lidarr?api_key=hook-key",
+        json={"eventType": "ArtistAdd", "artist": {"name": "Hooked Artist"}},
+    )
+    assert added.json == {"event": "ArtistAdd", "result": "added"}
+    assert "hooked artist" in data_handler.cached_cleaned_lidarr_names
+
+    deleted = client.post(
+        "/api/webhooks/lidarr",
+        headers={"X-API-Key": "hook-key"},
+        json={"eventType": "ArtistDelete", "artist": {"name": "Existing Artist"}},
+    )
+    assert deleted.json["result"] == "removed"
+    assert data_handler.cached_lidarr_names == ["Hooked Artist"]
+
+    grabbed = client.post("/api/webhooks/lidarr?api_key=hook-key", json={"eventType": "Grab"})
+    assert grabbed.json["result"] == "ignored"
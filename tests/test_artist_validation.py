@@ -0,0 +1,32 @@
+"""Tests for cached artist-name validation."""
+
+from __future__ import annotations
+
+from sonobarr_app.services.artist_validation import ArtistNameValidator
+
+
+def test_validator_caches_verdicts_and_trusts_known_names():
+    """Lookups should be cached by normalized name and skipped for locally known artists."""
+
+    calls = []
+
+    def lookup(name):
+        calls.append(name)
+        return {"slowdive": True, "the glimmering vapors": False}.get(name.lower())
+
+    validator = ArtistNameValidator(lookup, known=lambda name: name == "Library Artist", workers=2)
+
+    unknown = []
+    valid = list(
+        validator.iter_valid(["Slowdive", "The Glimmering Vapors", "Library Artist", "Offline"], unknown=unknown)
+    )
+
+    assert sorted(valid) == ["Library Artist", "Offline", "Slowdive"]
+    assert unknown == ["The Glimmering Vapors"]
+    assert validator.check("SLOWDIVE") is True
+    assert validator.check("the  glimmering vapors") is False
+    assert sorted(calls) == ["Offline", "Slowdive", "The Glimmering Vapors"]
+
+    validator.check("Offline")
+    assert calls.count("Offline") == 2  # undetermined answers are not cached
+    assert validator.metrics()["rejected"] == 2
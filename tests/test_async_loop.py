@@ -0,0 +1,141 @@
+"""Tests for the shared asyncio loop runner used by async LLM requests."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from sonobarr_app.services.async_loop import AsyncLoopRunner
+from sonobarr_app.services.cancellation import CancellationToken, CancelledError
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_run_returns_results_and_keeps_requests_on_one_loop_thread():
+    """Concurrent callers should share the loop thread and get their own results or errors."""
+
+    runner = AsyncLoopRunner(poll_interval=0.001)
+    loop_threads = set()
+
+    async def work(value):
+        loop_threads.add(threading.get_ident())
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def boom():
+        raise ValueError("provider down")
+
+    results = {}
+    callers = [
+        threading.Thread(target=lambda value=value: results.__setitem__(value, runner.run(work(value))))
+        for value in range(5)
+    ]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join(5)
+
+    assert results == {value: value * 2 for value in range(5)}
+    assert len(loop_threads) == 1 and threading.get_ident() not in loop_threads
+    assert runner.running
+    with pytest.raises(ValueError):
+        runner.run(boom())
+
+
+def test_run_cancels_the_coroutine_when_the_token_fires():
+    """Cancelling the token should raise at once and cancel the coroutine on the loop."""
+
+    runner = AsyncLoopRunner(poll_interval=0.001)
+    token = CancellationToken()
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def slow():
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    threading.Thread(target=lambda: started.wait(5) and token.cancel(), daemon=True).start()
+    with pytest.raises(CancelledError):
+        runner.run(slow(), token=token)
+    assert cancelled.wait(5)
+
+
+def test_iterate_yields_items_as_they_arrive_and_stops_on_cancel():
+    """Async iterables should be consumed incrementally and closed when the token is cancelled."""
+
+    runner = AsyncLoopRunner(poll_interval=0.001)
+    release = threading.Event()
+    closed = threading.Event()
+
+    async def names():
+        try:
+            yield "Slowdive"
+            while not release.is_set():
+                await asyncio.sleep(0.001)
+            yield "Ride"
+            await asyncio.sleep(30)
+        finally:
+            closed.set()
+
+    token = CancellationToken()
+    stream = runner.iterate(names(), token=token)
+    assert next(stream) == "Slowdive"
+    release.set()
+    assert next(stream) == "Ride"
+    token.cancel()
+    with pytest.raises(CancelledError):
+        next(stream)
+    assert closed.wait(5)
+
+    async def failing():
+        yield "Lush"
+        raise RuntimeError("stream broke")
+
+    stream = runner.iterate(failing())
+    assert next(stream) == "Lush"
+    with pytest.raises(RuntimeError, match="stream broke"):
+        next(stream)
+
+
+def test_loop_resolves_hostnames_and_exits_under_gevent_monkey_patching():
+    """DNS lookups on the loop should finish, and the process exit, once gevent patched the stdlib."""
+
+    script = textwrap.dedent(
+        """
+        from gevent import monkey
+
+        monkey.patch_all()
+
+        import asyncio
+        import socket
+
+        from sonobarr_app.services.async_loop import AsyncLoopRunner
+
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+
+        async def connect():
+            _, writer = await asyncio.wait_for(asyncio.open_connection("localhost", server.getsockname()[1]), 5)
+            writer.close()
+            return "connected"
+
+        print(AsyncLoopRunner(poll_interval=0.001).run(connect()))
+        """
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=30)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "connected"
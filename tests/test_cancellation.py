@@ -0,0 +1,101 @@
+"""Tests for cooperative cancellation tokens."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from sonobarr_app.services.cancellation import CancellationToken, CancelledError
+
+
+def test_run_returns_results_and_propagates_errors():
+    """Calls that finish before cancellation should behave like direct calls."""
+
+    token = CancellationToken()
+    assert token.run(lambda value, scale=1: value * scale, 3, scale=2) == 6
+
+    def boom():
+        raise ValueError("provider down")
+
+    with pytest.raises(ValueError):
+        token.run(boom)
+    assert not token.cancelled
+
+
+def test_cancel_abandons_blocked_call_and_rejects_new_ones():
+    """Cancelling should release the waiting caller without waiting for the call itself."""
+
+    token = CancellationToken()
+    entered = threading.Event()
+    release = threading.Event()
+    outcome = []
+
+    def blocked():
+        entered.set()
+        release.wait(5)
+        return "late"
+
+    def caller():
+        try:
+            outcome.append(token.run(blocked))
+        except CancelledError:
+            outcome.append("cancelled")
+
+    worker = threading.Thread(target=caller)
+    worker.start()
+    assert entered.wait(5)
+    token.cancel()
+    worker.join(1)
+    release.set()
+
+    assert outcome == ["cancelled"]
+    with pytest.raises(CancelledError):
+        token.run(lambda: "never")
+
+    called = []
+    token.add_callback(lambda: called.append(True))
+    assert called == [True]
+
+
+def test_iterate_yields_worker_items_and_stops_on_cancel():
+    """Streamed items should arrive incrementally and cancellation should end the stream."""
+
+    token = CancellationToken()
+    release = threading.Event()
+
+    def produce():
+        yield "first"
+        release.wait(5)
+        yield "second"
+
+    stream = token.iterate(produce)
+    assert next(stream) == "first"
+    token.cancel()
+    with pytest.raises(CancelledError):
+        next(stream)
+    release.set()
+
+    def broken():
+        yield "only"
+        raise ValueError("stream dropped")
+
+    fresh = CancellationToken()
+    items = []
+    with pytest.raises(ValueError):
+        for item in fresh.iterate(broken):
+            items.append(item)
+    assert items == ["only"]
+
+
+def test_run_reuses_a_bounded_pool_and_runs_nested_calls_inline():
+    """Calls share pooled worker threads, and nested calls do not take a second worker."""
+
+    token = CancellationToken()
+    outer_thread, inner_thread = token.run(
+        lambda: (threading.current_thread(), token.run(threading.current_thread))
+    )
+    assert outer_thread is inner_thread
+    assert outer_thread.name.startswith("cancellable-call")
+    assert token.run(threading.current_thread).name.startswith("cancellable-call")
+    assert threading.current_thread() is not outer_thread
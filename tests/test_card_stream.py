@@ -0,0 +1,124 @@
+"""Tests for coalesced and chunked artist card emission."""
+
+from __future__ import annotations
+
+import threading
+
+from sonobarr_app.services.card_stream import CardEmitter, emit_card_chunks
+
+
+class _FakeSocketIO:
+    """Socket.IO double that records frames and defers background tasks."""
+
+    def __init__(self):
+        self.events = []
+        self.tasks = []
+        self.slept = []
+
+        self.callbacks = []
+
+    def emit(self, event, payload=None, room=None, callback=None):
+        self.events.append((event, payload, room))
+        if callback is not None:
+            self.callbacks.append(callback)
+
+    def start_background_task(self, func, *args):
+        self.tasks.append(func)
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+
+
+def test_emitter_sends_first_card_immediately_and_coalesces_the_rest():
+    """The first card should not wait; later cards in the window should share frames."""
+
+    socketio = _FakeSocketIO()
+    emitter = CardEmitter(socketio, "sid", window=60.0, chunk_size=3)
+
+    emitter.add({"Name": "A"})
+    assert socketio.events == [("more_artists_loaded", [{"Name": "A"}], "sid")]
+
+    for name in "BCD":
+        emitter.add({"Name": name})
+    assert socketio.events[-1] == ("more_artists_loaded", [{"Name": "B"}, {"Name": "C"}, {"Name": "D"}], "sid")
+    assert len(socketio.tasks) == 1  # one deferred flush scheduled for the window
+
+    emitter.add({"Name": "E"})
+    socketio.tasks[0]()
+    assert socketio.slept == [60.0]
+    assert socketio.events[-1] == ("more_artists_loaded", [{"Name": "E"}], "sid")
+
+    emitter.flush()
+    assert emitter.frames_sent == 3
+
+
+def test_replays_are_split_into_bounded_chunks():
+    """Large replays should be emitted as several bounded frames in order."""
+
+    socketio = _FakeSocketIO()
+    cards = [{"Name": str(index)} for index in range(7)]
+
+    emit_card_chunks(socketio, "sid", cards, 3)
+
+    assert [len(payload) for _, payload, _ in socketio.events] == [3, 3, 1]
+    assert [card for _, payload, _ in socketio.events for card in payload] == cards
+
+
+def test_ack_window_pauses_producer_until_client_acknowledges():
+    """With an ack window, producers block once the window of unacknowledged frames is full."""
+
+    socketio = _FakeSocketIO()
+    emitter = CardEmitter(socketio, "sid", window=0, ack_window=1, ack_timeout=5)
+
+    emitter.add({"Name": "A"})
+    assert emitter.unacked == 1
+
+    producer = threading.Thread(target=emitter.add, args=({"Name": "B"},))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+    assert len(socketio.events) == 1
+
+    socketio.callbacks[0]()
+    producer.join(5)
+    assert not producer.is_alive()
+    assert [payload for _, payload, _ in socketio.events] == [[{"Name": "A"}], [{"Name": "B"}]]
+    assert emitter.window_stalls == 1
+
+
+def test_ack_window_gives_up_after_timeout():
+    """A client that never acknowledges should not stall the stream forever."""
+
+    socketio = _FakeSocketIO()
+    emitter = CardEmitter(socketio, "sid", window=0, ack_window=1, ack_timeout=0.05)
+
+    emitter.add({"Name": "A"})
+    emitter.add({"Name": "B"})
+
+    assert len(socketio.events) == 2
+    assert emitter.unacked == 1
+
+
+def test_ack_window_is_shared_across_emitters_and_releases_cancel_callbacks():
+    """A shared AckWindow carries unacked frames into the next batch; waits leave no token callbacks."""
+
+    from sonobarr_app.services.cancellation import CancellationToken
+    from sonobarr_app.services.card_stream import AckWindow
+
+    socketio = _FakeSocketIO()
+    acks = AckWindow()
+    token = CancellationToken()
+    CardEmitter(socketio, "sid", window=0, ack_window=1, acks=acks, cancel_token=token).add({"Name": "A"})
+
+    second = CardEmitter(socketio, "sid", window=0, ack_window=1, ack_timeout=5, acks=acks, cancel_token=token)
+    assert second.unacked == 1
+    producer = threading.Thread(target=second.add, args=({"Name": "B"},))
+    producer.start()
+    producer.join(0.2)
+    assert producer.is_alive()
+    socketio.callbacks[0]()
+    producer.join(5)
+
+    assert [payload for _, payload, _ in socketio.events] == [[{"Name": "A"}], [{"Name": "B"}]]
+    assert second.window_stalls == 1
+    assert token._callbacks == []
@@ -134,7 +134,14 @@ def test_update_settings_applies_values_and_clamps(tmp_path, monkeypatch):
     assert handler.lidarr_monitor_new_items == "new"
     assert handler.lidarr_albums_to_monitor == ["album-a", "album-b"]
     assert handler._flask_app.config["API_KEY"] == "api-test"
-    assert refresh_calls == ["openai", "listening", "save", "broadcast"]
+    # Only clients whose inputs changed are rebuilt; Last.fm credentials were untouched.
+    assert refresh_calls == ["openai", "save", "broadcast"]
+
+    version = handler.settings.version
+    refresh_calls.clear()
+    handler.update_settings({"last_fm_api_key": "lfm-key"})
+    assert handler.settings.version == version + 1
+    assert refresh_calls == ["listening", "save", "broadcast"]
 
 
 def test_personal_source_state_and_filtering_helpers(tmp_path):
@@ -171,6 +178,43 @@ def test_personal_source_state_and_filtering_helpers(tmp_path):
     assert session.recommended_artists[0]["Status"] == "Added"
 
 
+def test_sidebar_updates_send_snapshot_then_deltas(tmp_path):
+    """Sidebar emissions should start with a versioned snapshot and continue with deltas only."""
+
+    handler, socketio = _make_handler(tmp_path)
+    session = handler.ensure_session("sid-sidebar")
+    session.lidarr_items = [{"name": "A", "checked": False}, {"name": "B", "checked": False}]
+
+    handler.side_bar_opened("sid-sidebar")
+    snapshot = [event for event in socketio.events if event[0] == "lidarr_sidebar_update"][-1][1]
+    assert snapshot["Mode"] == "snapshot"
+    assert snapshot["Version"] == 1
+    assert [item["name"] for item in snapshot["Data"]] == ["A", "B"]
+
+    session.lidarr_items[0]["checked"] = True
+    session.lidarr_items.pop(1)
+    session.lidarr_items.append({"name": "C", "checked": False})
+    session.running = True
+    handler._emit_sidebar_success("sid-sidebar", session)
+    delta = [event for event in socketio.events if event[0] == "lidarr_sidebar_update"][-1][1]
+    assert delta["Mode"] == "delta"
+    assert delta["BaseVersion"] == 1 and delta["Version"] == 2
+    assert delta["Checked"] == ["A"]
+    assert delta["Removed"] == ["B"]
+    assert delta["Added"] == [{"name": "C", "checked": False}]
+    assert "Data" not in delta and "Unchecked" not in delta
+
+    handler.stop("sid-sidebar")
+    running_only = [event for event in socketio.events if event[0] == "lidarr_sidebar_update"][-1][1]
+    assert running_only["Running"] is False
+    assert set(running_only) == {"Status", "Version", "Running", "Mode", "BaseVersion"}
+
+    handler.resync_sidebar("sid-sidebar")
+    resynced = [event for event in socketio.events if event[0] == "lidarr_sidebar_update"][-1][1]
+    assert resynced["Mode"] == "snapshot"
+    assert resynced["Version"] == 4
+
+
 def test_lidarr_add_payload_and_failure_mapping(tmp_path):
     """Lidarr payload and failure mapping helpers should produce stable frontend statuses."""
 
@@ -221,6 +265,28 @@ def test_lidarr_add_payload_and_failure_mapping(tmp_path):
     assert status_unknown == FAILED_TO_ADD_STATUS
 
 
+def test_artist_addition_uses_one_settings_snapshot_throughout(tmp_path):
+    """A settings update landing mid-add should not mix old and new values in one payload."""
+
+    handler, _ = _make_handler(tmp_path)
+    handler.root_folder_path = "/music"
+    handler.quality_profile_id = 1
+    session = handler.ensure_session("sid-add", user_id=1)
+    submitted = []
+
+    def resolve_then_update(artist_name, settings):
+        handler.update_settings({"root_folder_path": "/archive", "quality_profile_id": 2})
+        return "mbid-1"
+
+    handler.get_mbid_from_musicbrainz = resolve_then_update
+    handler._submit_lidarr_add_request = lambda payload, settings: submitted.append(payload) or (None, 201)
+
+    assert handler._perform_artist_addition(session, "sid-add", "Low", "Low") == "Added"
+    assert submitted[0]["rootFolderPath"] == "/music"
+    assert submitted[0]["qualityProfileId"] == 1
+    assert handler.root_folder_path == "/archive"
+
+
 def test_artist_permission_validation_and_recording(tmp_path):
     """Permission checks and cache updates should synchronize session and global state."""
 
@@ -252,11 +318,11 @@ def test_stream_seed_artists_success_and_failure(tmp_path, monkeypatch):
     session = handler.ensure_session("sid-stream", user_id=1)
 
     session.recommended_artists = []
-    monkeypatch.setattr(handler, "_iter_artist_payloads_from_names", lambda names, missing=None: iter([
+    monkeypatch.setattr(handler, "_iter_artist_payloads_from_names", lambda names, missing=None, **kwargs: iter([
         {"Name": "Artist A", "Status": ""},
         {"Name": "Artist B", "Status": ""},
     ]))
-    monkeypatch.setattr(handler, "prepare_similar_artist_candidates", lambda s: setattr(s, "similar_artist_candidates", [1]))
+    monkeypatch.setattr(handler, "prepare_similar_artist_candidates", lambda s, **kwargs: setattr(s, "similar_artist_candidates", [1]))
 
     ok = handler._stream_seed_artists(
         session,
@@ -277,7 +343,7 @@ def test_stream_seed_artists_success_and_failure(tmp_path, monkeypatch):
 
     socketio.events.clear()
     session.recommended_artists.clear()
-    monkeypatch.setattr(handler, "_iter_artist_payloads_from_names", lambda names, missing=None: iter([]))
+    monkeypatch.setattr(handler, "_iter_artist_payloads_from_names", lambda names, missing=None, **kwargs: iter([]))
 
     failed = handler._stream_seed_artists(
         session,
@@ -326,6 +392,85 @@ def test_openai_header_parsing_and_settings_normalization(tmp_path):
     assert handler.lidarr_api_timeout == float(defaults["lidarr_api_timeout"])
 
 
+def test_hedge_models_wrap_configured_client(tmp_path, monkeypatch):
+    """Hedge endpoints should wrap the configured model and only share credentials with its endpoint."""
+
+    created = []
+
+    class _Recommender:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            self.model = kwargs["model"]
+            self.base_url = kwargs["base_url"]
+            self.timeout = 1
+            self.max_seed_artists = kwargs["max_seed_artists"]
+
+    monkeypatch.setattr("sonobarr_app.services.data_handler.OpenAIRecommender", _Recommender)
+    handler, _ = _make_handler(tmp_path)
+    handler.llm_hedge_models = [("gpt-4o-mini", None), ("llama3", "http://ollama/v1")]
+    handler.openai_api_key = "secret"
+    handler._configure_openai_client()
+
+    assert handler.openai_recommender.models == [None, "gpt-4o-mini", "llama3"]
+    assert [entry["api_key"] for entry in created[-3:]] == ["secret", "secret", None]
+    assert all(entry["retry_on_timeout"] is False for entry in created[-3:])
+
+
+def test_hedge_models_without_url_reuse_the_configured_endpoint(tmp_path, monkeypatch, caplog):
+    """A hedge entry without a URL should target the custom endpoint with its key and headers."""
+
+    created = []
+
+    class _Recommender:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            self.model = kwargs["model"]
+            self.base_url = kwargs["base_url"]
+            self.timeout = 1
+            self.max_seed_artists = kwargs["max_seed_artists"]
+
+    monkeypatch.setattr("sonobarr_app.services.data_handler.OpenAIRecommender", _Recommender)
+    handler, _ = _make_handler(tmp_path)
+    handler.openai_api_base = "http://gateway/v1"
+    handler.openai_api_key = "secret"
+    handler.openai_extra_headers = '{"X-Team": "music"}'
+    handler.llm_stream_seeds = True
+    handler.llm_hedge_models = [("backup-model", None)]
+    with caplog.at_level("INFO"):
+        handler._configure_openai_client()
+
+    hedge = created[-1]
+    assert hedge["base_url"] == "http://gateway/v1"
+    assert hedge["api_key"] == "secret"
+    assert hedge["default_headers"] == {"X-Team": "music"}
+    assert "instead of streaming seeds" in caplog.text
+
+
+def test_artist_existence_lookup_maps_lastfm_errors(tmp_path):
+    """Only Last.fm's "not found" answer should mark an artist as unknown."""
+
+    import pylast
+
+    handler, _ = _make_handler(tmp_path)
+    outcomes = {"Real": 10, "Fake": pylast.WSError(None, "6", "not found"), "Busy": pylast.WSError(None, "29", "slow")}
+
+    class _Artist:
+        def __init__(self, name):
+            self.name = name
+
+        def get_listener_count(self):
+            outcome = outcomes[self.name]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    handler._lastfm_network = lambda: SimpleNamespace(get_artist=_Artist)
+
+    assert handler._artist_exists("Real") is True
+    assert handler._artist_exists("Fake") is False
+    assert handler._artist_exists("Busy") is None
+
+
 def test_misc_helpers_for_counts_and_env_overrides(tmp_path, monkeypatch):
     """Formatting and environment helper wrappers should return predictable types."""
 
@@ -351,3 +496,122 @@ def test_misc_helpers_for_counts_and_env_overrides(tmp_path, monkeypatch):
     assert handler._env_int_or_empty("i_bad") == ""
     assert handler._env_float_or_empty("f_good") == 2.5
     assert handler._env_float_or_empty("f_bad") == ""
+
+
+def test_disconnected_session_resumes_with_token_and_replays_missing_cards(tmp_path):
+    """A reconnect with the resume token should re-attach state and replay only unseen cards."""
+
+    handler, socketio = _make_handler(tmp_path)
+    handler._sync_session_permissions = lambda sess: None
+    handler.emit_personal_sources_state = lambda sid: None
+
+    handler.connection("sid-old", 5)
+    session = handler.get_session_if_exists("sid-old")
+    token = session.resume_token
+    session.recommended_artists = [{"Name": "A"}, {"Name": "B"}, {"Name": "C"}]
+    session.similar_artist_candidates = [{}, {}, {}, {}]
+    session.similar_artist_batch_pointer = 3
+    session.initial_batch_sent = True
+
+    handler.remove_session("sid-old")
+    assert handler.get_session_if_exists("sid-old") is None
+
+    socketio.events.clear()
+    handler.connection("sid-new", 6, resume_token=token, known_cards=0)
+    assert handler.get_session_if_exists("sid-new") is not session  # other users cannot claim it
+
+    socketio.events.clear()
+    handler.connection("sid-new", 5, resume_token=token, known_cards=2)
+    assert handler.get_session_if_exists("sid-new") is session
+    assert session.sid == "sid-new"
+    events = {event: payload for event, payload, room in socketio.events if room == "sid-new"}
+    assert events["session_token"] == {"token": token, "resumed": True}
+    assert events["more_artists_loaded"] == [{"Name": "C"}]
+    assert events["initial_load_complete"] == {"hasMore": True}
+
+    handler.remove_session("sid-new")
+    handler.session_resume_grace = 0
+    socketio.events.clear()
+    handler.connection("sid-late", 5, resume_token=token, known_cards=3)
+    assert handler.get_session_if_exists("sid-late") is not session
+    assert any(event == "clear" and room == "sid-late" for event, _, room in socketio.events)
+
+
+def test_reaper_expires_idle_and_service_sessions_and_caps_retention(tmp_path):
+    """The reaper should drop expired sessions, compact candidates and trim old cards."""
+
+    handler, _ = _make_handler(tmp_path)
+    handler.session_max_cards = 2
+    handler.session_max_candidates = 3
+
+    service = handler.ensure_session("admin_1", user_id=1, is_admin=True)
+    idle = handler.ensure_session("sid-idle", user_id=2)
+    busy = handler.ensure_session("sid-busy", user_id=3)
+    assert service.synthetic and not idle.synthetic
+
+    service.last_activity -= handler.service_session_ttl + 1
+    idle.last_activity -= handler.session_idle_ttl + 1
+    busy.recommended_artists = [{"Name": name} for name in "ABCD"]
+    busy.similar_artist_candidates = [{"match": index} for index in range(10)]
+    busy.similar_artist_batch_pointer = 4
+
+    assert handler.reap_sessions() == 2
+    assert handler.get_session_if_exists("admin_1") is None
+    assert handler.get_session_if_exists("sid-idle") is None
+    assert handler.get_session_if_exists("sid-busy") is busy
+    assert [item["Name"] for item in busy.recommended_artists] == ["C", "D"]
+    assert busy.cards_trimmed == 2
+    assert [item["match"] for item in busy.similar_artist_candidates] == [4, 5, 6]
+    assert busy.similar_artist_batch_pointer == 0
+
+    metrics = handler.session_metrics()
+    assert metrics["active"] == 1
+    assert metrics["service"] == 0
+    assert metrics["reaped_total"] == 2
+    assert metrics["cards"] == 2
+    assert metrics["candidates"] == 3
+    assert metrics["estimated_bytes"] > 0
+
+
+def test_reaper_keeps_connected_idle_sockets_and_trims_detached_sessions(tmp_path):
+    """Idle sessions with a live socket stay registered; parked sessions get the retention caps."""
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.session_max_cards = 1
+    connected = {"sid-open"}
+    socketio.server = SimpleNamespace(
+        manager=SimpleNamespace(is_connected=lambda sid, namespace: sid in connected)
+    )
+
+    open_session = handler.ensure_session("sid-open", user_id=1)
+    gone = handler.ensure_session("sid-gone", user_id=2)
+    for session in (open_session, gone):
+        session.last_activity -= handler.session_idle_ttl + 1
+    parked = handler.ensure_session("sid-parked", user_id=3)
+    parked.recommended_artists = [{"Name": name} for name in "ABC"]
+    handler.remove_session("sid-parked")
+
+    assert handler.reap_sessions() == 1
+    assert handler.get_session_if_exists("sid-open") is open_session
+    assert handler.get_session_if_exists("sid-gone") is None
+    assert [item["Name"] for item in parked.recommended_artists] == ["C"]
+    assert parked.cards_trimmed == 2
+
+
+def test_trimmed_cards_still_receive_status_updates_and_are_not_recommended_again(tmp_path):
+    """Cards trimmed from memory stay on the page, so they keep their status and dedupe entry."""
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.session_max_cards = 1
+    session = handler.ensure_session("sid", user_id=1)
+    session.recommended_artists = [{"Name": "Björk", "Status": ""}, {"Name": "Low", "Status": ""}]
+    handler._enforce_session_caps(session)
+
+    assert session.recommended_names() == {"bjork", "low"}
+    handler.notify_artist_status(1, "sid", "Björk", "Added")
+    handler.notify_artist_status(1, "sid", "Unknown", "Added")
+    refreshes = [payload for event, payload, room in socketio.events if event == "refresh_artist"]
+    assert refreshes == [{"Name": "Björk", "Status": "Added"}]
+
+    session.prepare_for_search()
+    assert session.recommended_names() == set()
@@ -10,6 +10,7 @@ from types import SimpleNamespace
 from sonobarr_app.extensions import db
 from sonobarr_app.models import User
 from sonobarr_app.services.data_handler import DataHandler, FAILED_TO_ADD_STATUS
+from sonobarr_app.services.discovery_records import SimilarCandidate
 
 
 class _FakeSocketIO:
@@ -251,7 +252,7 @@ def test_stop_similarity_helpers_and_candidate_collection(tmp_path, monkeypatch)
     assert handler._parse_similarity_match("bad") is None
     assert handler._parse_similarity_match("0.42") == 0.42
 
-    key = handler._similar_artist_sort_key({"match": None, "artist": SimpleNamespace(item=SimpleNamespace(name="B"))})
+    key = handler._similar_artist_sort_key(SimilarCandidate("B", None))
     assert key[1] == "b"
 
     related = [SimpleNamespace(item=SimpleNamespace(name=f"Artist {idx}"), match="0.5") for idx in range(501)]
@@ -292,9 +293,9 @@ def test_load_batches_and_find_similar_branches(tmp_path, monkeypatch):
     session.prepare_for_search()
     session.recommended_artists = [{"Name": "Dup", "Status": ""}]
     session.similar_artist_candidates = [
-        {"artist": SimpleNamespace(item=SimpleNamespace(name="Dup")), "match": 0.9},
-        {"artist": SimpleNamespace(item=SimpleNamespace(name="Missing")), "match": 0.7},
-        {"artist": SimpleNamespace(item=SimpleNamespace(name="Fresh")), "match": 0.6},
+        SimilarCandidate("Dup", 0.9),
+        SimilarCandidate("Missing", 0.7),
+        SimilarCandidate("Fresh", 0.6),
     ]
     handler.similar_artist_batch_size = 10
 
@@ -372,15 +373,15 @@ def test_lidarr_submission_addition_and_request_error_branches(app, tmp_path, mo
     assert payload is None
 
     session = handler.ensure_session("sid-add", user_id=1)
-    handler.get_mbid_from_musicbrainz = lambda artist_name: None
+    handler.get_mbid_from_musicbrainz = lambda artist_name, settings: None
     failed = handler._perform_artist_addition(session, "sid-add", "No Match", "No Match")
     assert failed == FAILED_TO_ADD_STATUS
 
-    handler.get_mbid_from_musicbrainz = lambda artist_name: "mbid-1"
-    handler._submit_lidarr_add_request = lambda payload: (None, 201)
+    handler.get_mbid_from_musicbrainz = lambda artist_name, settings: "mbid-1"
+    handler._submit_lidarr_add_request = lambda payload, settings: (None, 201)
     assert handler._perform_artist_addition(session, "sid-add", "Added Artist", "Added Artist") == "Added"
 
-    handler._submit_lidarr_add_request = lambda payload: (_Response(status_code=500, payload={"message": "boom"}), 500)
+    handler._submit_lidarr_add_request = lambda payload, settings: (_Response(status_code=500, payload={"message": "boom"}), 500)
     assert handler._perform_artist_addition(session, "sid-add", "Bad Artist", "Bad Artist") == FAILED_TO_ADD_STATUS
 
     with app.app_context():
@@ -403,8 +404,10 @@ def test_settings_preview_audio_and_misc_utility_branches(tmp_path, monkeypatch)
     handler.load_settings("sid-settings")
     assert any(event[0] == "settingsLoaded" for event in socketio.events)
 
-    del handler.lidarr_address
+    snapshot = handler.settings
+    handler.settings = None
     handler.load_settings("sid-settings")
+    handler.settings = snapshot
 
     handler.similar_artist_batch_size = 0
     handler.openai_max_seed_artists = 0
@@ -493,10 +496,10 @@ def test_settings_preview_audio_and_misc_utility_branches(tmp_path, monkeypatch)
 
     session = handler.ensure_session("sid-stream")
     session.recommended_artists = [{"Name": "Duplicate", "Status": ""}]
-    handler._iter_artist_payloads_from_names = lambda names, missing=None: iter(
+    handler._iter_artist_payloads_from_names = lambda names, missing=None, **kwargs: iter(
         [{"Name": "Duplicate", "Status": ""}, {"Name": "Fresh", "Status": ""}]
     )
-    handler.prepare_similar_artist_candidates = lambda s: setattr(s, "similar_artist_candidates", [])
+    handler.prepare_similar_artist_candidates = lambda s, **kwargs: setattr(s, "similar_artist_candidates", [])
     ok = handler._stream_seed_artists(
         session,
         "sid-stream",
@@ -646,13 +649,13 @@ def test_candidate_loop_and_batch_stop_branches(tmp_path, monkeypatch):
     monkeypatch.setattr("sonobarr_app.services.data_handler.pylast.LastFMNetwork", lambda **kwargs: _Lfm())
     candidates = handler._collect_similar_candidates(session)
     assert len(candidates) == 1
-    assert candidates[0]["artist"].item.name == "Fresh"
+    assert candidates[0].name == "Fresh"
 
     loop_session = handler.ensure_session("sid-loop")
     loop_session.prepare_for_search()
     loop_session.similar_artist_candidates = [
-        {"artist": SimpleNamespace(item=SimpleNamespace(name="A")), "match": 0.8},
-        {"artist": SimpleNamespace(item=SimpleNamespace(name="B")), "match": 0.7},
+        SimilarCandidate("A", 0.8),
+        SimilarCandidate("B", 0.7),
     ]
     loop_session.recommended_artists = []
     handler.similar_artist_batch_size = 10
@@ -710,7 +713,7 @@ def test_stream_missing_seed_toast_and_save_config_tmp_cleanup(tmp_path, monkeyp
     handler, socketio = _make_handler(tmp_path)
     session = handler.ensure_session("sid-stream-missing")
 
-    def _iter_payloads(_names, missing=None):
+    def _iter_payloads(_names, missing=None, **kwargs):
         if missing is not None:
             missing.append("Missing Artist")
         yield {
@@ -723,7 +726,7 @@ def test_stream_missing_seed_toast_and_save_config_tmp_cleanup(tmp_path, monkeyp
         }
 
     handler._iter_artist_payloads_from_names = _iter_payloads
-    handler.prepare_similar_artist_candidates = lambda s: setattr(s, "similar_artist_candidates", [])
+    handler.prepare_similar_artist_candidates = lambda s, **kwargs: setattr(s, "similar_artist_candidates", [])
     ok = handler._stream_seed_artists(
         session,
         "sid-stream-missing",
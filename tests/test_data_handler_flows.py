@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -84,7 +85,7 @@ def test_get_artists_from_lidarr_success_and_error(tmp_path, monkeypatch):
         "sonobarr_app.services.data_handler.requests.get",
         lambda endpoint, headers, timeout: _Response(
             200,
-            payload=[{"artistName": "B"}, {"artistName": "A"}],
+            payload=[{"artistName": "B", "genres": ["Shoegaze"]}, {"artistName": "A"}],
         ),
     )
 
@@ -93,6 +94,7 @@ def test_get_artists_from_lidarr_success_and_error(tmp_path, monkeypatch):
     success = [event for event in socketio.events if event[0] == "lidarr_sidebar_update"][-1]
     assert success[1]["Status"] == "Success"
     assert [item["name"] for item in success[1]["Data"]] == ["A", "B"]
+    assert "Top genres: Shoegaze (1)" in handler.library_summary()
 
     monkeypatch.setattr(
         "sonobarr_app.services.data_handler.requests.get",
@@ -104,6 +106,78 @@ def test_get_artists_from_lidarr_success_and_error(tmp_path, monkeypatch):
     assert error[1]["Code"] == 500
 
 
+def test_library_webhook_and_full_sync_update_open_sidebars(tmp_path, monkeypatch):
+    """Webhook events and full syncs should patch session sidebars and push deltas."""
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.cached_lidarr_names = ["A", "B"]
+    session = handler.ensure_session("sid")
+    handler.side_bar_opened("sid")
+    idle = handler.ensure_session("sid-idle")
+
+    assert handler.apply_lidarr_webhook({"eventType": "ArtistAdd", "artist": {"name": "C"}}) == "added"
+    assert handler.apply_lidarr_webhook({"eventType": "ArtistAdd", "artist": {"name": "c"}}) == "unchanged"
+    assert handler.apply_lidarr_webhook({"eventType": "ArtistDelete", "artist": {"name": "A"}}) == "removed"
+    assert handler.apply_lidarr_webhook({"eventType": "ArtistDelete", "artist": {}}) == "ignored"
+    assert [item["name"] for item in session.lidarr_items] == ["B", "C"]
+    assert idle.lidarr_items == []
+
+    deltas = [event[1] for event in socketio.events if event[0] == "lidarr_sidebar_update"][1:]
+    assert deltas[0]["Added"] == [{"name": "C", "checked": False}]
+    assert deltas[1]["Removed"] == ["A"]
+
+    session.lidarr_items[0]["checked"] = True
+    handler.lidarr_address = "http://lidarr"
+    monkeypatch.setattr(
+        "sonobarr_app.services.data_handler.requests.get",
+        lambda endpoint, headers, timeout: _Response(200, payload=[{"artistName": "D"}, {"artistName": "B"}]),
+    )
+    assert handler.sync_library_from_lidarr() is True
+    assert session.lidarr_items == [{"name": "B", "checked": True}, {"name": "D", "checked": False}]
+    last_delta = [event[1] for event in socketio.events if event[0] == "lidarr_sidebar_update"][-1]
+    assert last_delta["Removed"] == ["C"]
+    assert last_delta["Added"] == [{"name": "D", "checked": False}]
+
+
+def test_library_webhook_matches_sidebar_names_like_the_library_index(tmp_path):
+    """Webhook deltas should match sidebar entries by the library index's normalized names."""
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.cached_lidarr_names = ["Sigur Ros", "Bjork"]
+    session = handler.ensure_session("sid")
+    handler.side_bar_opened("sid")
+
+    assert handler.apply_lidarr_webhook({"eventType": "ArtistDelete", "artist": {"name": " bjork "}}) == "removed"
+    handler._record_added_artist(session, "Björk")
+    assert session.add_sidebar_item("BJÖRK ") is None
+    assert [item["name"] for item in session.lidarr_items] == ["Sigur Ros", "Björk"]
+    assert session.cleaned_lidarr_items == ["sigur ros", "bjork"]
+
+    deltas = [event[1] for event in socketio.events if event[0] == "lidarr_sidebar_update"][1:]
+    assert deltas[0]["Removed"] == ["Bjork"]
+    assert deltas[1]["Added"] == [{"name": "Björk", "checked": False}]
+    assert session.sidebar_snapshot == {"Sigur Ros": False, "Björk": False}
+
+
+def test_replacing_the_sidebar_rebuilds_its_name_index(tmp_path):
+    """A same-length replacement sidebar should be indexed by its own names, not the old ones."""
+
+    handler, socketio = _make_handler(tmp_path)
+    session = handler.ensure_session("sid")
+    session.set_sidebar_items([{"name": "Low", "checked": False}, {"name": "Lush", "checked": False}], ["low", "lush"])
+    assert set(session.sidebar_items_by_key()) == {"low", "lush"}
+    handler._emit_sidebar_success("sid", session)
+    first_snapshot = session.sidebar_snapshot
+
+    session.set_sidebar_items([{"name": "Low", "checked": False}, {"name": "Ride", "checked": False}], ["low", "ride"])
+    assert session.remove_sidebar_item("ride")["name"] == "Ride"
+    assert session.remove_sidebar_item("lush") is None
+    handler._emit_sidebar_success("sid", session, changes={"Removed": ["Lush"]})
+
+    assert first_snapshot == {"Low": False, "Lush": False}
+    assert session.sidebar_snapshot == {"Low": False}
+
+
 def test_start_flow_handles_empty_and_selected_lidarr_items(tmp_path, monkeypatch):
     """Start should request selection when empty and trigger candidate loading when seeds are selected."""
 
@@ -116,8 +190,8 @@ def test_start_flow_handles_empty_and_selected_lidarr_items(tmp_path, monkeypatc
     assert "Choose at least one" in warning_toast[1]["message"]
 
     calls = []
-    monkeypatch.setattr(handler, "prepare_similar_artist_candidates", lambda s: calls.append("prepare"))
-    monkeypatch.setattr(handler, "load_similar_artist_batch", lambda s, sid: calls.append("load"))
+    monkeypatch.setattr(handler, "prepare_similar_artist_candidates", lambda s, **kwargs: calls.append("prepare"))
+    monkeypatch.setattr(handler, "load_similar_artist_batch", lambda s, sid, **kwargs: calls.append("load"))
     handler.start("sid", ["A"])
 
     assert "prepare" in calls and "load" in calls
@@ -146,7 +220,7 @@ def test_ai_prompt_branches(tmp_path):
             self.model = "m"
             self.timeout = 1
 
-        def generate_seed_artists(self, prompt, existing):
+        def generate_seed_artists(self, prompt, existing, **kwargs):
             return list(self._seeds)
 
     socketio.events.clear()
@@ -163,11 +237,284 @@ def test_ai_prompt_branches(tmp_path):
     stream_calls = []
     handler._stream_seed_artists = lambda *args, **kwargs: stream_calls.append((args, kwargs)) or True
     handler.openai_recommender = _Recommender(["X", "Y"])
-    handler.ai_prompt("sid", "shoegaze")
+    handler.ai_prompt("sid", "shoegaze", refresh=True)
     assert stream_calls
     assert any(event[0] == "new_toast_msg" for event in socketio.events)
 
 
+def test_shared_ai_prompt_acks_and_errors_reach_tabs_that_joined_early(tmp_path):
+    """Tabs joining a shared AI run before the LLM answers wait for its ack or error in the run room."""
+
+    import threading
+
+    from sonobarr_app.services.shared_discovery import discovery_key
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.share_discovery = True
+    asked = threading.Event()
+    answer = threading.Event()
+
+    class _SlowRecommender:
+        model = "m"
+        timeout = 1
+
+        def generate_seed_artists(self, prompt, existing, **kwargs):
+            asked.set()
+            answer.wait(5)
+            return []
+
+    handler.openai_recommender = _SlowRecommender()
+    for sid in ("sid-a", "sid-b"):
+        handler.ensure_session(sid, user_id=1)
+
+    leader = threading.Thread(target=handler.ai_prompt, args=("sid-a", "dream pop"))
+    leader.start()
+    assert asked.wait(5)
+    handler.ai_prompt("sid-b", "dream pop")
+    assert not [event for event in socketio.events if event[0] == "ai_prompt_ack"]
+    answer.set()
+    leader.join(5)
+
+    room = f"user:1:discovery:{discovery_key('ai', ['dream pop'])}"
+    errors = [event for event in socketio.events if event[0] == "ai_prompt_error"]
+    assert [event[2] for event in errors] == [room]
+    assert handler.shared_discoveries == {}
+    assert handler.get_session_if_exists("sid-b").shared_discovery is None
+
+
+def test_ai_prompt_reuses_cached_seeds_for_repeated_prompts(tmp_path):
+    """Identical prompts should be answered from the seed cache without calling the provider."""
+
+    handler, _ = _make_handler(tmp_path)
+    handler.ensure_session("sid")
+    streamed = []
+    handler._stream_seed_artists = lambda session, sid, seeds, **kwargs: streamed.append(list(seeds)) or True
+
+    class _Recommender:
+        model = "m"
+        base_url = None
+        max_seed_artists = 5
+        timeout = 1
+
+        def __init__(self):
+            self.calls = 0
+
+        def generate_seed_artists(self, prompt, existing, **kwargs):
+            self.calls += 1
+            return ["Slowdive", "Ride"]
+
+    recommender = _Recommender()
+    handler.openai_recommender = recommender
+
+    handler.ai_prompt("sid", "90s shoegaze")
+    handler.ai_prompt("sid", "  90s   Shoegaze ")
+    assert recommender.calls == 1
+    assert streamed == [["Slowdive", "Ride"], ["Slowdive", "Ride"]]
+    assert handler.ai_seed_cache.metrics()["hits"] == 1
+
+    handler.ai_prompt("sid", "90s shoegaze", refresh=True)
+    assert recommender.calls == 2
+
+    handler.library_index.add("Slowdive")
+    handler.ai_prompt("sid", "90s shoegaze")
+    assert recommender.calls == 3
+
+
+def test_ai_prompt_answers_tag_prompts_from_hydrated_cards(tmp_path, monkeypatch):
+    """Hydrated cards should feed the tag index, which then answers plain tag prompts without the LLM."""
+
+    handler, _ = _make_handler(tmp_path)
+    handler.ensure_session("sid")
+    handler.openai_max_seed_artists = 2
+    handler.library_index.add("Mogwai")
+    tags = {
+        "Mogwai": [("post-rock", 100)],
+        "Explosions in the Sky": [("post-rock", 100), ("instrumental", 70)],
+        "Godspeed You! Black Emperor": [("Post Rock", 90)],
+    }
+
+    def get_artist(name):
+        top_tags = [
+            SimpleNamespace(item=SimpleNamespace(get_name=lambda tag=tag: tag), weight=weight)
+            for tag, weight in tags[name]
+        ]
+        return SimpleNamespace(get_name=lambda: name, get_top_tags=lambda: top_tags)
+
+    monkeypatch.setattr(handler, "_resolve_artist_image", lambda name: None)
+    for name in tags:
+        handler._fetch_artist_payload(SimpleNamespace(get_artist=get_artist), name)
+
+    streamed = []
+    handler._stream_seed_artists = lambda session, sid, seeds, **kwargs: streamed.append(list(seeds)) or True
+
+    class _Recommender:
+        model = "m"
+        timeout = 1
+
+        def __init__(self):
+            self.prompts = []
+
+        def generate_seed_artists(self, prompt, existing, **kwargs):
+            self.prompts.append(prompt)
+            return ["Slint"]
+
+    handler.openai_recommender = None
+    handler.ai_prompt("sid", "Post-rock music")
+    assert streamed == [["Explosions in the Sky", "Godspeed You! Black Emperor"]]
+
+    recommender = _Recommender()
+    handler.openai_recommender = recommender
+    handler.ai_prompt("sid", "instrumental post rock")
+    handler.ai_prompt("sid", "post rock for late nights")
+    assert recommender.prompts == ["instrumental post rock", "post rock for late nights"]
+    assert handler.tag_index.metrics()["hits"] == 1
+
+
+def test_ai_prompt_replaces_unknown_seeds_with_one_follow_up(tmp_path):
+    """Seeds no catalog knows should be dropped and replaced by a single re-ask to the LLM."""
+
+    handler, _ = _make_handler(tmp_path)
+    handler.ensure_session("sid")
+    handler.last_fm_api_key = "lfm"
+    handler._artist_exists = lambda name: name != "Made Up Band"
+    handler.artist_validator.lookup = handler._artist_exists
+    streamed = []
+    handler._stream_seed_artists = lambda session, sid, seeds, **kwargs: streamed.append(list(seeds)) or True
+
+    class _Recommender:
+        model = "m"
+        timeout = 1
+
+        def __init__(self):
+            self.prompts = []
+
+        def generate_seed_artists(self, prompt, existing, **kwargs):
+            self.prompts.append(prompt)
+            if len(self.prompts) == 1:
+                return ["Slowdive", "Made Up Band"]
+            return ["Slowdive", "Ride", "Lush"]
+
+    recommender = _Recommender()
+    handler.openai_recommender = recommender
+    handler.ai_prompt("sid", "shoegaze")
+
+    assert len(recommender.prompts) == 2
+    assert "Made Up Band" in recommender.prompts[1]
+    assert sorted(streamed[0]) == ["Ride", "Slowdive"]
+
+
+def test_ai_prompt_streams_seeds_into_hydration(tmp_path, monkeypatch):
+    """Streamed seeds should be hydrated as they arrive, then reported and cached once complete."""
+
+    from sonobarr_app.services.discovery_records import ArtistCard
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.ensure_session("sid")
+    handler.library_index.add("Known")
+    fetched = []
+    first_card = threading.Event()
+
+    class _Recommender:
+        model = "m"
+        base_url = None
+        max_seed_artists = 5
+        timeout = 1
+
+        def stream_seed_artists(self, prompt, existing, **kwargs):
+            yield "Known"
+            yield "Slowdive"
+            # The rest of the answer only arrives once the first card has been hydrated.
+            assert first_card.wait(5)
+            yield "Ride"
+
+    def fake_fetch(_network, name, similarity_score=None):
+        fetched.append(name)
+        first_card.set()
+        return ArtistCard(name)
+
+    monkeypatch.setattr(handler, "_fetch_artist_payload", fake_fetch)
+    monkeypatch.setattr(handler, "prepare_similar_artist_candidates", lambda session, **kwargs: None)
+    monkeypatch.setattr("sonobarr_app.services.data_handler.pylast.LastFMNetwork", lambda **kwargs: object())
+    handler.openai_recommender = _Recommender()
+
+    handler.ai_prompt("sid", "shoegaze")
+
+    names = [event[0] for event in socketio.events]
+    assert ("ai_prompt_ack", {"seeds": ["Slowdive"]}, "sid") in socketio.events
+    assert ("ai_prompt_seeds", {"seeds": ["Slowdive", "Ride"]}, "sid") in socketio.events
+    assert names.index("ai_prompt_seeds") < names.index("initial_load_complete")
+    assert "new_toast_msg" in names
+    assert fetched == ["Slowdive", "Ride"]
+    assert handler.ai_seed_cache.metrics()["stores"] == 1
+
+
+def test_async_llm_requests_run_on_the_shared_loop_and_cancel_on_stop(tmp_path):
+    """Async-capable recommenders should be awaited on the LLM loop and cancelled with the run."""
+
+    import asyncio
+
+    from sonobarr_app.services.cancellation import CancellationToken, CancelledError
+
+    handler, _ = _make_handler(tmp_path)
+    closed = threading.Event()
+
+    class _Recommender:
+        model = "m"
+        base_url = None
+        max_seed_artists = 5
+        timeout = 1
+
+        async def agenerate_seed_artists(self, prompt, existing, **kwargs):
+            return ["Lush", "Ride"]
+
+        def stream_seed_artists(self, prompt, existing, **kwargs):
+            raise AssertionError("the async stream should be used")
+
+        async def astream_seed_artists(self, prompt, existing, **kwargs):
+            try:
+                yield "Slowdive"
+                await asyncio.sleep(30)
+            finally:
+                closed.set()
+
+    recommender = _Recommender()
+    token = CancellationToken()
+    seeds, cached = handler._generate_ai_seeds(recommender, "shoegaze", [], token)
+    seeds = iter(seeds)
+    assert next(seeds) == "Slowdive" and not cached
+    token.cancel()
+    with pytest.raises(CancelledError):
+        next(seeds)
+    assert closed.wait(5)
+
+    handler.llm_stream_seeds = False
+    handler.ai_seed_cache.max_entries = 0
+    assert handler._generate_ai_seeds(recommender, "dream pop", [], CancellationToken()) == (["Lush", "Ride"], False)
+    assert handler.llm_loop.running
+
+
+def test_seed_hydration_runs_concurrently_and_reports_missing(tmp_path, monkeypatch):
+    """Seed cards should be fetched in parallel, deduplicated, with unloadable names reported."""
+
+    handler, _ = _make_handler(tmp_path)
+    monkeypatch.setattr("sonobarr_app.services.data_handler.pylast.LastFMNetwork", lambda **kwargs: object())
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_fetch(_network, name):
+        if name in ("A", "B"):
+            both_started.wait()  # only passes when two fetches are in flight together
+        return None if name == "Missing" else {"Name": name}
+
+    handler._fetch_artist_payload = fake_fetch
+    missing = []
+    payloads = list(
+        handler._iter_artist_payloads_from_names(["A", "a", "B", "Missing"], missing=missing, concurrency=2)
+    )
+
+    assert sorted(payload["Name"] for payload in payloads) == ["A", "B"]
+    assert missing == ["Missing"]
+
+
 def test_personal_recommendations_branches(tmp_path):
     """Personal recommendation flow should handle source validation and successful streaming."""
 
@@ -219,14 +566,62 @@ def test_personal_recommendations_branches(tmp_path):
     handler._resolve_user = lambda user_id: SimpleNamespace(
         username="u", lastfm_username="lfm", listenbrainz_username=""
     )
-    handler._iter_artist_payloads_from_names = lambda names, missing=None: iter(
+    handler._iter_artist_payloads_from_names = lambda names, missing=None, **kwargs: iter(
         [{"Name": "New Artist", "Status": "", "Img_Link": "", "Genre": "", "Popularity": "", "Followers": ""}]
     )
-    handler.prepare_similar_artist_candidates = lambda s: setattr(s, "similar_artist_candidates", [1])
+    handler.prepare_similar_artist_candidates = lambda s, **kwargs: setattr(s, "similar_artist_candidates", [1])
     handler.personal_recommendations("sid", "lastfm")
     assert any(event[0] == "user_recs_ack" for event in socketio.events)
 
 
+def test_personal_seeds_are_cached_and_refreshed_in_the_background(tmp_path):
+    """Repeat clicks should reuse cached seeds; stale ones are served at once and refreshed behind."""
+
+    from datetime import datetime, timedelta, timezone
+
+    handler, socketio = _make_handler(tmp_path)
+    created = datetime.now(timezone.utc) - timedelta(days=2)
+    answers = [["Slowdive", "Ride"], ["Lush"]]
+    calls = []
+
+    class _ListenBrainzService:
+        def get_weekly_exploration_artists(self, username):
+            calls.append(username)
+            return SimpleNamespace(artists=answers[len(calls) - 1], next_refresh_at=created + timedelta(days=7))
+
+    handler.listenbrainz_user_service = _ListenBrainzService()
+    config = handler._personal_source_definitions()["listenbrainz"]
+
+    assert handler._fetch_personal_recommendation_seeds("sid", "listenbrainz", config, "listener") == [
+        "Slowdive",
+        "Ride",
+    ]
+    assert handler._fetch_personal_recommendation_seeds("sid", "listenbrainz", config, "listener") == [
+        "Slowdive",
+        "Ride",
+    ]
+    assert calls == ["listener"]
+    expires_at = handler.personal_seed_cache._entries["listenbrainz:listener"][0]
+    assert abs(expires_at - (created + timedelta(days=7)).timestamp()) < 1
+
+    handler.personal_seed_cache._entries["listenbrainz:listener"] = (0.0, ("Slowdive", "Ride"))
+    handler.personal_seed_cache.max_stale_seconds = float("inf")
+    assert handler._fetch_personal_recommendation_seeds("sid", "listenbrainz", config, "listener") == [
+        "Slowdive",
+        "Ride",
+    ]
+    assert handler._fetch_personal_recommendation_seeds("sid", "listenbrainz", config, "listener") == [
+        "Slowdive",
+        "Ride",
+    ]
+    assert len(socketio.tasks) == 1
+
+    _, (task,) = socketio.tasks[0]
+    handler.task_scheduler._run(task)
+    assert calls == ["listener", "listener"]
+    assert handler._fetch_personal_recommendation_seeds("sid", "listenbrainz", config, "listener") == ["Lush"]
+
+
 def test_find_similar_artists_and_add_artist_paths(tmp_path, monkeypatch):
     """Similar-artist loading and add artist flow should update session status and emit user feedback."""
 
@@ -280,7 +675,8 @@ def test_request_artist_db_operations_and_flow(app, tmp_path, monkeypatch):
     session_auto.recommended_artists = [{"Name": "Auto Artist", "Status": ""}]
     handler_auto._can_add_without_approval = lambda s: True
     auto_calls = []
-    handler_auto.add_artists = lambda sid, artist: auto_calls.append((sid, artist)) or "Added"
+    handler_auto.add_artists = lambda sid, artist: pytest.fail("auto-approved requests must not wait for the add")
+    handler_auto.enqueue_artist_addition = lambda sid, artist: auto_calls.append((sid, artist))
     handler_auto.request_artist("sid-auto", "Auto%20Artist")
     assert auto_calls
 
@@ -358,3 +754,218 @@ def test_openai_config_and_file_merge_helpers(tmp_path, monkeypatch):
     handler._merge_config_file_overrides()
     handler._apply_missing_defaults(defaults)
     assert handler.lidarr_address == "http://from-file"
+
+
+def test_bulk_add_skips_library_artists_and_requests_for_members(app, tmp_path):
+    """Bulk add should check permissions once, skip known artists, and batch requests for members."""
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.set_flask_app(app)
+    with app.app_context():
+        admin_id = _create_user("bulk-admin", is_admin=True).id
+        member_id = _create_user("bulk-member").id
+
+    handler.cached_lidarr_names = ["Known Artist"]
+    admin_session = handler.ensure_session("admin-sid", user_id=admin_id)
+    admin_session.recommended_artists = [
+        {"Name": "Known Artist", "Status": ""},
+        {"Name": "New Artist", "Status": ""},
+    ]
+    added = []
+    handler._perform_artist_addition = lambda session, sid, name, folder, on_stage=None: added.append(name) or "Added"
+
+    handler.bulk_add_artists("admin-sid", ["Known%20Artist", "New%20Artist", "new artist", ""])
+    assert added == ["New Artist"]
+    assert [item["Status"] for item in admin_session.recommended_artists] == ["Already in Lidarr", "Added"]
+
+    member_session = handler.ensure_session("member-sid", user_id=member_id)
+    member_session.recommended_artists = [{"Name": "Wanted", "Status": ""}]
+    handler.request_artist("member-sid", "Wanted")
+    member_session.recommended_artists.append({"Name": "Known Artist", "Status": ""})
+    handler.bulk_add_artists("member-sid", ["Wanted", "Also%20Wanted", "Known%20Artist"])
+
+    with app.app_context():
+        pending = sorted(r.artist_name for r in ArtistRequest.query.filter_by(requested_by_id=member_id).all())
+    assert pending == ["Also Wanted", "Wanted"]
+    assert member_session.recommended_artists[0]["Status"] == "Requested"
+    assert member_session.recommended_artists[1]["Status"] == "Already in Lidarr"
+    assert any(
+        event[0] == "new_toast_msg" and event[1]["title"] == "Requests Submitted" and "1 were already pending" in event[1]["message"]
+        for event in socketio.events
+    )
+
+
+def test_concurrent_additions_for_same_artist_share_one_lidarr_call(tmp_path):
+    """Concurrent adds of one artist should run once, share the result, then short-circuit."""
+
+    import threading
+
+    handler, _socketio = _make_handler(tmp_path)
+    release = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def slow_perform(session, sid, artist_name, artist_folder, on_stage=None):
+        calls.append(artist_name)
+        started.set()
+        release.wait(5)
+        handler._record_added_artist(session, artist_name)
+        return "Added"
+
+    handler._perform_artist_addition = slow_perform
+    first = handler.ensure_session("sid-a", user_id=1)
+    second = handler.ensure_session("sid-b", user_id=2)
+    results = {}
+
+    leader = threading.Thread(target=lambda: results.__setitem__("a", handler._execute_artist_addition(first, "sid-a", "Dup Artist")))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.__setitem__("b", handler._execute_artist_addition(second, "sid-b", "dup artist")))
+    follower.start()
+    follower.join(0.2)  # follower blocks on the leader's in-flight call
+    assert follower.is_alive()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert calls == ["Dup Artist"]
+    assert results["a"] == "Added"
+    assert results["b"] == "Added"
+    assert handler._execute_artist_addition(second, "sid-b", "Dup Artist") == "Already in Lidarr"
+    assert calls == ["Dup Artist"]
+
+
+def test_spellings_sharing_an_mbid_post_once_and_index_only_the_leader(tmp_path):
+    """Different spellings resolving to one MBID should share the POST without indexing an alias."""
+
+    import threading
+
+    handler, _socketio = _make_handler(tmp_path)
+    release = threading.Event()
+    started = threading.Event()
+    posts = []
+
+    def slow_submit(payload, settings):
+        posts.append(payload)
+        started.set()
+        release.wait(5)
+        return None, 201
+
+    handler.get_mbid_from_musicbrainz = lambda artist_name, settings: "mbid-beatles"
+    handler._build_lidarr_add_payload = lambda artist_name, artist_folder, mbid, settings: {"artistName": artist_name}
+    handler._submit_lidarr_add_request = slow_submit
+    first = handler.ensure_session("sid-a", user_id=1)
+    second = handler.ensure_session("sid-b", user_id=2)
+    results = {}
+
+    leader = threading.Thread(target=lambda: results.__setitem__("a", handler._execute_artist_addition(first, "sid-a", "The Beatles")))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.__setitem__("b", handler._execute_artist_addition(second, "sid-b", "Beatles")))
+    follower.start()
+    follower.join(0.2)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert posts == [{"artistName": "The Beatles"}]
+    assert results == {"a": "Added", "b": "Added"}
+    assert handler.library_index.names() == ["The Beatles"]
+
+
+def test_stop_abandons_in_flight_provider_call_and_frees_search_lock(tmp_path, monkeypatch):
+    """Stopping should return from a blocked provider call at once so a new search can start."""
+
+    import threading
+
+    from sonobarr_app.services.discovery_records import SimilarCandidate
+
+    handler, socketio = _make_handler(tmp_path)
+    session = handler.ensure_session("sid")
+    session.prepare_for_search()
+    session.similar_artist_candidates = [SimilarCandidate("Slow", 0.9), SimilarCandidate("Next", 0.8)]
+    monkeypatch.setattr("sonobarr_app.services.data_handler.pylast.LastFMNetwork", lambda **kwargs: object())
+    entered = threading.Event()
+    release = threading.Event()
+    fetched = []
+
+    def blocking_fetch(_network, name, similarity_score=None):
+        fetched.append(name)
+        entered.set()
+        release.wait(5)
+        return {"Name": name, "Status": ""}
+
+    handler._fetch_artist_payload = blocking_fetch
+
+    def run_batch():
+        with session.search_lock:
+            handler.load_similar_artist_batch(session, "sid")
+
+    worker = threading.Thread(target=run_batch)
+    worker.start()
+    assert entered.wait(5)
+    handler.stop("sid")
+    worker.join(1)
+    release.set()
+
+    assert not worker.is_alive()
+    assert fetched == ["Slow"]
+    assert session.recommended_artists == []
+    assert not any(event[0] == "more_artists_loaded" for event in socketio.events)
+    assert session.search_lock.acquire(blocking=False)
+    session.search_lock.release()
+
+
+def test_tabs_of_one_user_share_a_discovery_run(tmp_path, monkeypatch):
+    """A second tab asking for the same seeds should mirror the first tab's run, not recompute it."""
+
+    from sonobarr_app.services.discovery_records import ArtistCard, SimilarCandidate
+    from sonobarr_app.services.shared_discovery import discovery_key
+
+    handler, socketio = _make_handler(tmp_path)
+    handler.share_discovery = True
+    handler.similar_artist_batch_size = 1
+    fetched = []
+
+    def fake_prepare(session, **kwargs):
+        session.similar_artist_candidates = [SimilarCandidate("One", 0.9), SimilarCandidate("Two", 0.8)]
+        session.similar_artist_batch_pointer = 0
+        session.initial_batch_sent = False
+
+    def fake_fetch(_network, name, similarity_score=None):
+        fetched.append(name)
+        return ArtistCard(name, similarity=similarity_score)
+
+    monkeypatch.setattr(handler, "prepare_similar_artist_candidates", fake_prepare)
+    monkeypatch.setattr(handler, "_fetch_artist_payload", fake_fetch)
+    monkeypatch.setattr("sonobarr_app.services.data_handler.pylast.LastFMNetwork", lambda **kwargs: object())
+    for sid in ("sid-a", "sid-b"):
+        handler.ensure_session(sid, user_id=1).lidarr_items = [{"name": "Seed", "checked": False}]
+
+    room = f"user:1:discovery:{discovery_key('lidarr', ['Seed'])}"
+    handler.start("sid-a", ["Seed"])
+    assert ("more_artists_loaded", [ArtistCard("One", similarity=0.9).to_dict()], room) in socketio.events
+
+    socketio.events.clear()
+    handler.start("sid-b", ["Seed"])
+    tab_b = handler.get_session_if_exists("sid-b")
+    assert fetched == ["One"]
+    assert [card["Name"] for card in tab_b.recommended_artists] == ["One"]
+    assert [event[0] for event in socketio.events if event[2] == "sid-b"][:3] == [
+        "clear",
+        "more_artists_loaded",
+        "initial_load_complete",
+    ]
+
+    handler.find_similar_artists("sid-b")
+    tab_a = handler.get_session_if_exists("sid-a")
+    assert fetched == ["One", "Two"]
+    assert [card["Name"] for card in tab_a.recommended_artists] == ["One", "Two"]
+    assert [card["Name"] for card in tab_b.recommended_artists] == ["One", "Two"]
+    assert ("load_more_complete", {"hasMore": False}, room) in socketio.events
+
+    handler.remove_session("sid-a")
+    group = handler.shared_discoveries[(1, discovery_key("lidarr", ["Seed"]))]
+    assert group.leader_sid == "sid-b" and group.members == ["sid-b"]
+    handler.remove_session("sid-b")
+    assert handler.shared_discoveries == {}
@@ -0,0 +1,54 @@
+"""Tests for the compact candidate and card records kept in session state."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from sonobarr_app.services.discovery_records import ArtistCard, SimilarCandidate, card_payload
+
+
+def _deep_size(item) -> int:
+    if isinstance(item, dict):
+        values = item.values()
+    else:
+        values = (getattr(item, slot) for slot in item.__slots__)
+    return sys.getsizeof(item) + sum(sys.getsizeof(value) for value in values)
+
+
+def test_artist_card_builds_the_wire_payload_lazily():
+    """Cards should render the legacy payload dict and accept status updates by key."""
+
+    card = ArtistCard("Artist", genre="Rock, Pop", play_count=12_300, listeners=2_000_000, similarity=0.875)
+    card["Status"] = "Added"
+
+    assert card_payload(card) == {
+        "Name": "Artist",
+        "Genre": "Rock, Pop",
+        "Status": "Added",
+        "Img_Link": "https://placehold.co/512x512?text=No+Image",
+        "Popularity": "Play Count: 12.3K",
+        "Followers": "Listeners: 2.0M",
+        "SimilarityScore": 0.875,
+        "Similarity": "Similarity: 87.5%",
+    }
+    assert card.get("Missing", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        card["Popularity"] = "nope"
+
+    plain = {"Name": "Plain"}
+    assert card_payload(plain) is plain
+    assert _deep_size(card) < _deep_size(card.to_dict())
+
+
+def test_similar_candidates_intern_names_and_keys():
+    """Candidates should share interned strings and expose a normalized key."""
+
+    first = SimilarCandidate("Sigur Rós", 0.5)
+    second = SimilarCandidate("".join(["Sigur", " Rós"]), None)
+
+    assert first.key == "sigur ros"
+    assert first.name is second.name
+    assert first.key is second.key
+    assert not hasattr(first, "__dict__")
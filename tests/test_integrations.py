@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
+from datetime import datetime, timezone
 from types import SimpleNamespace
 
 import pytest
 
 from sonobarr_app.services.integrations.lastfm_user import LastFmUserArtist, LastFmUserService
+from sonobarr_app.services.similar_cache import SimilarArtistCache
 from sonobarr_app.services.integrations.listenbrainz_user import (
     ListenBrainzIntegrationError,
     ListenBrainzUserService,
@@ -141,6 +144,47 @@ def test_lastfm_collect_recommendations_returns_early_at_limit():
     assert len(recs) == 1
 
 
+def test_lastfm_recommendations_weight_by_playcount_in_parallel_with_shared_cache(monkeypatch):
+    """Similar lookups should overlap, be cached, and rank candidates by playcount-weighted match."""
+
+    top_entries = [
+        SimpleNamespace(item=SimpleNamespace(name="Rare"), weight="2"),
+        SimpleNamespace(item=SimpleNamespace(name="Heavy"), weight="100"),
+        SimpleNamespace(item=SimpleNamespace(name="Mid"), weight="40"),
+    ]
+    similar = {
+        "Rare": [("Niche", "1.0"), ("Shared", "0.2")],
+        "Heavy": [("Shared", "0.5"), ("heavy", "0.9")],
+        "Mid": [("Shared", "0.5"), ("Niche", "0.1")],
+    }
+    lookups = []
+    overlapping = threading.Barrier(3, timeout=5)
+
+    def get_artist(name):
+        def get_similar():
+            lookups.append(name)
+            overlapping.wait()
+            return [SimpleNamespace(item=SimpleNamespace(name=cand), match=match) for cand, match in similar[name]]
+
+        return SimpleNamespace(get_similar=get_similar)
+
+    network = SimpleNamespace(
+        get_user=lambda username: SimpleNamespace(get_top_artists=lambda limit: top_entries),
+        get_artist=get_artist,
+    )
+    cache = SimilarArtistCache()
+    service = LastFmUserService("key", "secret", workers=3, similar_cache=cache)
+    monkeypatch.setattr(service, "_client", lambda: network)
+
+    recs = service.get_recommended_artists("user", limit=10)
+    assert [(item.name, item.match_score) for item in recs] == [("Shared", 0.5), ("Niche", 1.0)]
+    assert sorted(lookups) == ["Heavy", "Mid", "Rare"]
+
+    assert [item.name for item in service.get_recommended_artists("other", limit=1)] == ["Shared"]
+    assert len(lookups) == 3
+    assert cache.get("HEAVY") == [("Shared", 0.5), ("heavy", 0.9)]
+
+
 def test_listenbrainz_weekly_exploration_flow():
     """Service should extract weekly exploration playlist artists and dedupe names."""
 
@@ -149,6 +193,7 @@ def test_listenbrainz_weekly_exploration_flow():
             {
                 "playlist": {
                     "identifier": ["https://listenbrainz.org/playlist/abc123/"],
+                    "date": "2024-05-13T00:00:00.123456Z",
                     "extension": {
                         "https://musicbrainz.org/doc/jspf#playlist": {
                             "additional_metadata": {
@@ -194,6 +239,8 @@ def test_listenbrainz_weekly_exploration_flow():
     result = service.get_weekly_exploration_artists("listener")
 
     assert result.artists == ["Artist One", "Artist Two"]
+    assert result.next_refresh_at == datetime(2024, 5, 20, 0, 0, 0, 123456, tzinfo=timezone.utc)
+    assert ListenBrainzUserService._parse_date("not a date") is None
 
 
 def test_listenbrainz_validation_and_error_paths():
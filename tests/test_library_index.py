@@ -0,0 +1,61 @@
+"""Tests for the persisted Lidarr library index."""
+
+from __future__ import annotations
+
+from sonobarr_app.services import library_index as library_index_module
+from sonobarr_app.services.library_index import LibraryIndex
+
+
+def test_library_index_journal_replays_incremental_changes(tmp_path):
+    """Add/remove events should be journaled and survive a reload without a full snapshot rewrite."""
+
+    snapshot_path = tmp_path / "lidarr_library.json"
+    index = LibraryIndex(snapshot_path)
+    index.replace(["Björk", "Air"])
+    assert index.cleaned_names() == ["bjork", "air"]
+
+    assert index.add("Caribou") is True
+    assert index.add("caribou") is False
+    assert index.remove("AIR") == "Air"
+    assert index.remove("Unknown") is None
+    assert index.journal_path.read_text(encoding="utf-8").count("\n") == 2
+
+    restored = LibraryIndex(snapshot_path)
+    restored.load()
+    assert restored.names() == ["Bjork", "Caribou"]
+    assert "bjork" in restored and "Air" not in restored
+
+
+def test_library_index_compacts_long_journals(tmp_path, monkeypatch):
+    """Reaching the journal threshold should fold changes into a fresh snapshot."""
+
+    monkeypatch.setattr(library_index_module, "JOURNAL_COMPACT_THRESHOLD", 3)
+    index = LibraryIndex(tmp_path / "lidarr_library.json")
+    index.replace([])
+    index.add("A")
+    index.add("B")
+    index.add("C")
+    assert not index.journal_path.exists()
+
+    restored = LibraryIndex(tmp_path / "lidarr_library.json")
+    restored.load()
+    assert restored.names() == ["A", "B", "C"]
+
+    index.replace_cleaned(["a", "z"])
+    assert index.names() == ["A", "z"]
+
+
+def test_library_index_keeps_genres_across_reloads_and_removals(tmp_path):
+    """Genres from full syncs should persist with the snapshot and follow artist removals."""
+
+    snapshot_path = tmp_path / "lidarr_library.json"
+    index = LibraryIndex(snapshot_path)
+    index.replace(["Slowdive", "Air"], genres={"Slowdive": ["Shoegaze", " "], "Air": ["Electronic"]})
+    index.remove("Air")
+
+    restored = LibraryIndex(snapshot_path)
+    restored.load()
+    assert restored.genres() == {"Slowdive": ("Shoegaze",)}
+
+    restored.replace(["Slowdive", "Ride"])
+    assert restored.genres() == {"Slowdive": ("Shoegaze",)}
@@ -0,0 +1,34 @@
+"""Tests for the token-bounded library summary used in AI prompts."""
+
+from __future__ import annotations
+
+from sonobarr_app.services.library_summary import build_library_summary, estimate_tokens
+
+
+def test_summary_lists_top_genres_and_small_libraries_in_full():
+    """Small libraries should be listed completely alongside genre counts."""
+
+    summary = build_library_summary(
+        ["Slowdive", "Ride", "Air"],
+        {"Slowdive": ["Shoegaze"], "Ride": ["Shoegaze", "Rock"], "Air": ["Electronic"]},
+    )
+
+    lines = summary.splitlines()
+    assert lines[0] == "3 artists."
+    assert lines[1].startswith("Top genres: Shoegaze (2)")
+    assert sorted(lines[2].removeprefix("Artists include: ").split(", ")) == ["Air", "Ride", "Slowdive"]
+
+
+def test_summary_respects_token_budget_and_samples_each_genre():
+    """Large libraries should be sampled within budget, covering the top genres first."""
+
+    names = [f"Rock Band {index}" for index in range(500)] + ["Lone Jazz Trio"]
+    genres = {name: ["Rock"] for name in names[:-1]}
+    genres["Lone Jazz Trio"] = ["Jazz"]
+
+    summary = build_library_summary(names, genres, token_budget=60)
+
+    assert estimate_tokens(summary) <= 60
+    assert summary.startswith("501 artists.\nTop genres: Rock (500), Jazz (1)")
+    assert "Lone Jazz Trio" in summary
+    assert build_library_summary([], {}) == ""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -184,3 +186,221 @@ def test_generate_seed_artists_returns_empty_when_response_body_is_blank(monkeyp
     recommender = OpenAIRecommender(api_key="secret")
     recommender.client.chat.completions = _FakeCompletions([_response("   ")])
     assert recommender.generate_seed_artists("ambient") == []
+
+
+def _chunk(content):
+    """Build a minimal streamed chat completion chunk."""
+
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def test_stream_parser_emits_elements_as_they_close():
+    """The incremental parser should decode each element once its delimiter arrives."""
+
+    parser = openai_client.JsonArrayStreamParser()
+
+    assert parser.feed('Sure: ["Slow') == []
+    assert parser.feed('dive", {"name": "Ride, [UK]"}') == ["Slowdive"]
+    assert parser.feed(', "Lush"]') == [{"name": "Ride, [UK]"}, "Lush"]
+    assert parser.complete
+
+
+def test_stream_seed_artists_yields_before_completion_ends(monkeypatch):
+    """Streaming should hand out seeds incrementally and stop once the limit is reached."""
+
+    monkeypatch.setattr(openai_client, "OpenAI", _FakeOpenAI)
+    recommender = OpenAIRecommender(api_key="secret", max_seed_artists=2)
+    consumed = []
+
+    def _stream():
+        for piece in ['["Slowdive", ', '"slowdive", "Ride"', ', "Lush"', ', "Pale Saints"]']:
+            consumed.append(piece)
+            yield _chunk(piece)
+
+    completions = _FakeCompletions([_stream()])
+    recommender.client.chat.completions = completions
+
+    seeds = recommender.stream_seed_artists("Shoegaze")
+    assert next(seeds) == "Slowdive"
+    assert len(consumed) == 1
+    assert list(seeds) == ["Ride"]
+    assert len(consumed) == 3
+    assert completions.calls[0]["stream"] is True
+
+
+def test_stream_seed_artists_skips_unusable_arrays_and_validates_full_text(monkeypatch):
+    """Arrays without artist names should be skipped, and prose-only answers should still fail clearly."""
+
+    monkeypatch.setattr(openai_client, "OpenAI", _FakeOpenAI)
+    recommender = OpenAIRecommender(api_key="secret")
+    recommender.client.chat.completions = _FakeCompletions(
+        [
+            iter([_chunk("Top [1] pick:\n```json\n"), _chunk('{"seeds": ["Cocteau Twins"]}'), _chunk("\n```")]),
+            iter([_chunk("No structured "), _chunk("output"), SimpleNamespace(choices=[])]),
+        ]
+    )
+
+    assert list(recommender.stream_seed_artists("Dream pop")) == ["Cocteau Twins"]
+    with pytest.raises(RuntimeError, match="did not include a JSON array"):
+        list(recommender.stream_seed_artists("Anything"))
+
+
+class _StubRecommender:
+    """Recommender double returning a programmed answer after an optional gate."""
+
+    def __init__(self, model, outcome, gate=None):
+        self.model = model
+        self.base_url = None
+        self.timeout = 1
+        self.max_seed_artists = 5
+        self.outcome = outcome
+        self.gate = gate
+        self.calls = 0
+
+    def generate_seed_artists(self, prompt, existing=None, **kwargs):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return list(self.outcome)
+
+
+def test_hedged_recommender_returns_first_valid_answer():
+    """A slow primary should be overtaken by the hedge once the delay has passed."""
+
+    slow_gate = threading.Event()
+    primary = _StubRecommender("local", ["Slow"], gate=slow_gate)
+    hedge = _StubRecommender("hosted", ["Fast"])
+    hedged = openai_client.HedgedRecommender([primary, hedge], hedge_delay=0.05)
+
+    assert hedged.generate_seed_artists("shoegaze") == ["Fast"]
+    assert hedged.model == "local"
+    slow_gate.set()
+
+
+def test_hedged_recommender_skips_delay_after_failures():
+    """Failed or empty answers should start the next endpoint without waiting for the delay."""
+
+    failing = _StubRecommender("local", RuntimeError("boom"))
+    empty = _StubRecommender("other", [])
+    valid = _StubRecommender("hosted", ["Ride"])
+
+    hedged = openai_client.HedgedRecommender([failing, empty, valid], hedge_delay=60)
+    assert hedged.generate_seed_artists("shoegaze") == ["Ride"]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        openai_client.HedgedRecommender([failing, failing], hedge_delay=60).generate_seed_artists("x")
+    assert openai_client.HedgedRecommender([failing, empty], hedge_delay=60).generate_seed_artists("x") == []
+
+
+class _FakeAsyncCompletions(_FakeCompletions):
+    """Awaitable chat completion double."""
+
+    async def create(self, **kwargs):
+        return super().create(**kwargs)
+
+
+class _FakeAsyncStream:
+    """Async chunk stream double that records when it is closed."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        return self._chunks.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_async_client_generates_and_streams_seed_artists(monkeypatch):
+    """The async path should share client settings and match the blocking results."""
+
+    monkeypatch.setattr(openai_client, "OpenAI", _FakeOpenAI)
+    monkeypatch.setattr(openai_client, "AsyncOpenAI", _FakeOpenAI)
+    recommender = OpenAIRecommender(api_key="secret", base_url="https://llm.example/v1", max_seed_artists=2)
+    assert recommender.async_client.kwargs == recommender.client.kwargs
+
+    stream = _FakeAsyncStream([_chunk('["Slowdive", '), _chunk('"Ride", '), _chunk('"Lush"]')])
+    completions = _FakeAsyncCompletions([_response('["Cocteau Twins"]'), stream])
+    recommender.async_client.chat.completions = completions
+
+    async def scenario():
+        generated = await recommender.agenerate_seed_artists("Dream pop")
+        streamed = [name async for name in recommender.astream_seed_artists("Shoegaze")]
+        return generated, streamed
+
+    assert asyncio.run(scenario()) == (["Cocteau Twins"], ["Slowdive", "Ride"])
+    assert stream.closed
+    assert completions.calls[1]["stream"] is True
+
+
+class _AsyncStubRecommender(_StubRecommender):
+    """Recommender double with an async path that can be held open until cancelled."""
+
+    def __init__(self, model, outcome, delay=0.0):
+        super().__init__(model, outcome)
+        self.delay = delay
+        self.cancelled = False
+
+    async def agenerate_seed_artists(self, prompt, existing=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return list(self.outcome)
+
+
+def test_async_hedged_recommender_cancels_losing_requests():
+    """The async hedge should return the first valid answer and cancel the slower request."""
+
+    slow = _AsyncStubRecommender("local", ["Slow"], delay=30)
+    fast = _AsyncStubRecommender("hosted", ["Fast"])
+    hedged = openai_client.HedgedRecommender([slow, fast], hedge_delay=0.01)
+
+    async def scenario():
+        result = await hedged.agenerate_seed_artists("shoegaze")
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(scenario()) == ["Fast"]
+    assert slow.cancelled
+
+    failing = _AsyncStubRecommender("local", RuntimeError("boom"))
+    empty = _AsyncStubRecommender("other", [])
+    valid = _AsyncStubRecommender("hosted", ["Ride"])
+    hedged = openai_client.HedgedRecommender([failing, empty, valid], hedge_delay=60)
+    assert asyncio.run(hedged.agenerate_seed_artists("shoegaze")) == ["Ride"]
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(openai_client.HedgedRecommender([failing], hedge_delay=60).agenerate_seed_artists("x"))
+
+
+def test_parse_model_endpoints():
+    """Hedge endpoint lists should accept bare models and model@url pairs."""
+
+    assert openai_client.parse_model_endpoints(" gpt-4o-mini, llama3@http://ollama:11434/v1 ,, ") == [
+        ("gpt-4o-mini", None),
+        ("llama3", "http://ollama:11434/v1"),
+    ]
+
+
+def test_prompt_uses_library_summary_when_provided(monkeypatch):
+    """A library summary should replace the raw name preview in the user prompt."""
+
+    monkeypatch.setattr(openai_client, "OpenAI", _FakeOpenAI)
+    recommender = OpenAIRecommender(api_key="secret")
+
+    _, user_prompt = recommender._build_prompts("dream pop", ["A", "B"], "2 artists.\nTop genres: Rock (2)")
+    assert "Top genres: Rock (2)" in user_prompt
+    assert "A, B" not in user_prompt
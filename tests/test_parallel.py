@@ -0,0 +1,66 @@
+"""Tests for the bounded parallel map helper."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from sonobarr_app.services.cancellation import CancellationToken, CancelledError
+from sonobarr_app.services.parallel import imap_unordered
+
+
+def test_imap_unordered_bounds_concurrency_and_yields_every_result():
+    """No more than ``workers`` calls should run at once and every item should be returned."""
+
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def work(value):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        threading.Event().wait(0.01)
+        with lock:
+            active[0] -= 1
+        return value * 2
+
+    results = dict(imap_unordered(work, range(12), workers=3))
+
+    assert results == {value: value * 2 for value in range(12)}
+    assert 1 < peak[0] <= 3
+
+
+def test_imap_unordered_yields_fast_items_before_slow_ones():
+    """Results should arrive in completion order rather than input order."""
+
+    release = threading.Event()
+
+    def work(value):
+        if value == "slow":
+            release.wait(5)
+        return value
+
+    stream = imap_unordered(work, ["slow", "fast"], workers=2)
+    assert next(stream) == ("fast", "fast")
+    release.set()
+    assert list(stream) == [("slow", "slow")]
+
+
+def test_imap_unordered_propagates_errors_and_cancellation():
+    """Worker errors should reach the consumer and cancelling should stop the stream at once."""
+
+    def boom(_value):
+        raise ValueError("provider down")
+
+    with pytest.raises(ValueError):
+        list(imap_unordered(boom, [1], workers=2))
+
+    token = CancellationToken()
+    blocked = threading.Event()
+    stream = imap_unordered(lambda value: blocked.wait(5) or value, [1, 2], workers=2, token=token)
+    token.cancel()
+    with pytest.raises(CancelledError):
+        next(stream)
+    blocked.set()
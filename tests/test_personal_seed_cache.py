@@ -0,0 +1,41 @@
+"""Tests for the per-username personal seed cache."""
+
+from __future__ import annotations
+
+from sonobarr_app.services import personal_seed_cache as personal_seed_cache_module
+from sonobarr_app.services.personal_seed_cache import PersonalSeedCache
+
+
+def test_entries_go_stale_then_expire(monkeypatch):
+    """Entries should be fresh until their expiry, then served as stale until the stale window ends."""
+
+    now = [1000.0]
+    monkeypatch.setattr(personal_seed_cache_module.time, "time", lambda: now[0])
+    cache = PersonalSeedCache(ttl_seconds=10, max_stale_seconds=100)
+
+    cache.put("lastfm", "Listener", ["A", "B"])
+    cache.put("listenbrainz", "listener", ["C"], expires_at=1500.0)
+    cache.put("lastfm", "empty", [])
+
+    assert cache.get("lastfm", " listener ") == (["A", "B"], False)
+    now[0] = 1011.0
+    assert cache.get("lastfm", "listener") == (["A", "B"], True)
+    assert cache.get("listenbrainz", "listener") == (["C"], False)
+    now[0] = 1111.0
+    assert cache.get("lastfm", "listener") is None
+    assert cache.get("lastfm", "empty") is None
+    assert cache.metrics()["entries"] == 1
+
+
+def test_refresh_claims_are_exclusive_and_cache_can_be_disabled():
+    """Only one refresh per entry should be claimed at a time; a zero TTL disables caching."""
+
+    cache = PersonalSeedCache()
+    assert cache.claim_refresh("lastfm", "listener")
+    assert not cache.claim_refresh("lastfm", "LISTENER")
+    cache.release_refresh("lastfm", "listener")
+    assert cache.claim_refresh("lastfm", "listener")
+
+    disabled = PersonalSeedCache(ttl_seconds=0)
+    disabled.put("lastfm", "listener", ["A"])
+    assert disabled.get("lastfm", "listener") is None
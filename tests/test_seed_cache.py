@@ -0,0 +1,49 @@
+"""Tests for the LLM seed answer cache."""
+
+from __future__ import annotations
+
+from sonobarr_app.services import seed_cache as seed_cache_module
+from sonobarr_app.services.seed_cache import SeedCache
+
+
+def _key(prompt, library=("A", "B"), model="m"):
+    return SeedCache.key(prompt, model=model, max_seed_artists=5, library_preview=list(library))
+
+
+def test_key_normalizes_prompt_and_library_order():
+    """Case, spacing and library ordering should not produce distinct keys."""
+
+    assert _key("90s Shoegaze") == _key(" 90s   shoegaze ", library=("b", "a"))
+    assert _key("90s shoegaze") != _key("90s shoegaze", model="other")
+    assert _key("90s shoegaze") != _key("90s shoegaze", library=("A", "B", "C"))
+
+
+def test_entries_expire_and_are_bounded(monkeypatch):
+    """Entries should expire after the TTL and the least recently used one is evicted first."""
+
+    now = [100.0]
+    monkeypatch.setattr(seed_cache_module.time, "monotonic", lambda: now[0])
+    cache = SeedCache(ttl_seconds=10, max_entries=2)
+
+    cache.put("a", ["A"])
+    cache.put("b", ["B"])
+    assert cache.get("a") == ["A"]
+    cache.put("c", ["C"])
+    assert cache.get("b") is None
+    assert cache.get("a") == ["A"]
+
+    cache.put("empty", [])
+    assert cache.get("empty") is None
+
+    now[0] += 11
+    assert cache.get("a") is None
+    assert cache.metrics()["evictions"] == 1
+
+
+def test_zero_ttl_disables_cache():
+    """A TTL of zero should turn the cache into a pass-through."""
+
+    cache = SeedCache(ttl_seconds=0, max_entries=10)
+    cache.put("a", ["A"])
+    assert not cache.enabled
+    assert cache.get("a") is None
@@ -0,0 +1,59 @@
+"""Tests for the immutable runtime settings snapshot."""
+
+from __future__ import annotations
+
+import pytest
+
+from sonobarr_app.services.data_handler import DataHandler
+from sonobarr_app.services.settings_snapshot import SETTINGS_FIELDS, SettingsField, SettingsSnapshot
+
+
+class _Owner:
+    lidarr_address = SettingsField("lidarr_address")
+    lidarr_albums_to_monitor = SettingsField("lidarr_albums_to_monitor")
+
+    def __init__(self):
+        self.settings = SettingsSnapshot()
+
+    def _publish_settings(self, changes):
+        self.settings = self.settings.with_changes(changes)
+
+
+def test_with_changes_bumps_version_only_when_values_differ():
+    """Publishing identical values should keep the snapshot and its version."""
+
+    snapshot = SettingsSnapshot(lidarr_address="http://a")
+
+    assert snapshot.with_changes({"lidarr_address": "http://a"}) is snapshot
+    updated = snapshot.with_changes({"lidarr_address": "http://b", "openai_model": "m"})
+    assert updated.version == snapshot.version + 1
+    assert updated.changed_fields(snapshot) == {"lidarr_address", "openai_model"}
+    assert snapshot.lidarr_address == "http://a"
+
+    with pytest.raises(KeyError):
+        snapshot.with_changes({"not_a_setting": 1})
+
+
+def test_settings_field_reads_snapshot_and_publishes_on_assignment():
+    """Attribute access should proxy the snapshot and lists should round-trip as copies."""
+
+    owner = _Owner()
+    before = owner.settings
+
+    owner.lidarr_address = "http://lidarr"
+    owner.lidarr_albums_to_monitor = ["a", "b"]
+
+    assert before.lidarr_address == ""
+    assert owner.lidarr_address == "http://lidarr"
+    assert owner.settings.lidarr_albums_to_monitor == ("a", "b")
+    assert owner.lidarr_albums_to_monitor == ["a", "b"]
+    assert owner.settings.to_dict()["lidarr_albums_to_monitor"] == ["a", "b"]
+    assert owner.settings.version == 2
+
+
+def test_data_handler_declares_a_field_for_every_setting():
+    """Every snapshot setting should be a named SettingsField on DataHandler."""
+
+    declared = {name for name, value in vars(DataHandler).items() if isinstance(value, SettingsField)}
+    assert declared == set(SETTINGS_FIELDS)
+    assert all(vars(DataHandler)[name].name == name for name in SETTINGS_FIELDS)
@@ -6,6 +6,7 @@ from types import SimpleNamespace
 
 import sonobarr_app.sockets as sockets_module
 from sonobarr_app.sockets import register_socketio_handlers
+from sonobarr_app.services.task_scheduler import PRIORITY_ADD, PRIORITY_PREVIEW
 
 
 class _FakeSocketIO:
@@ -30,15 +31,31 @@ class _FakeSocketIO:
         self.tasks.append((func.__name__, args))
 
 
+class _FakeScheduler:
+    """Task scheduler double recording submitted background work."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, func, *args, owner, priority=0, key=None):
+        self.submitted.append((func.__name__, args, {"owner": owner, "priority": priority, "key": key}))
+        return True
+
+    @property
+    def tasks(self):
+        return [(name, args) for name, args, _ in self.submitted]
+
+
 class _FakeDataHandler:
     """Data handler double exposing the methods invoked by socket handlers."""
 
     def __init__(self):
         self.calls = []
         self.logger = SimpleNamespace(exception=lambda *args, **kwargs: None)
+        self.task_scheduler = _FakeScheduler()
 
-    def connection(self, *args):
-        self.calls.append(("connection", args))
+    def connection(self, *args, **kwargs):
+        self.calls.append(("connection", args, kwargs))
 
     def remove_session(self, sid):
         self.calls.append(("remove_session", sid))
@@ -46,13 +63,16 @@ class _FakeDataHandler:
     def side_bar_opened(self, sid):
         self.calls.append(("side_bar_opened", sid))
 
+    def resync_sidebar(self, sid):
+        self.calls.append(("resync_sidebar", sid))
+
     def get_artists_from_lidarr(self, sid):
         self.calls.append(("get_artists_from_lidarr", sid))
 
     def start(self, sid, selected):
         self.calls.append(("start", sid, selected))
 
-    def ai_prompt(self, sid, prompt):
+    def ai_prompt(self, sid, prompt, refresh=False):
         self.calls.append(("ai_prompt", sid, prompt))
 
     def emit_personal_sources_state(self, sid):
@@ -67,8 +87,11 @@ class _FakeDataHandler:
     def find_similar_artists(self, sid):
         self.calls.append(("find_similar_artists", sid))
 
-    def add_artists(self, sid, name):
-        self.calls.append(("add_artists", sid, name))
+    def enqueue_artist_addition(self, sid, name):
+        self.calls.append(("enqueue_artist_addition", sid, name))
+
+    def bulk_add_artists(self, sid, names):
+        self.calls.append(("bulk_add_artists", sid, names))
 
     def request_artist(self, sid, name):
         self.calls.append(("request_artist", sid, name))
@@ -118,6 +141,7 @@ def test_socket_handlers_route_events_and_authorization(monkeypatch):
     fake_socketio.handlers["connect"]()
     fake_socketio.handlers["disconnect"]()
     fake_socketio.handlers["side_bar_opened"]()
+    fake_socketio.handlers["sidebar_resync"]()
     fake_socketio.handlers["personal_sources_poll"]()
     fake_socketio.handlers["stop_req"]()
     fake_socketio.handlers["preview_req"]("artist")
@@ -128,6 +152,7 @@ def test_socket_handlers_route_events_and_authorization(monkeypatch):
     fake_socketio.handlers["load_more_artists"]()
     fake_socketio.handlers["adder"]("A")
     fake_socketio.handlers["request_artist"]("B")
+    fake_socketio.handlers["bulk_add"]({"artists": ["C", "D"]})
     fake_socketio.handlers["load_settings"]()
     fake_socketio.handlers["update_settings"]({"x": 1})
     fake_socketio.handlers["prehear_req"]("Artist")
@@ -136,13 +161,22 @@ def test_socket_handlers_route_events_and_authorization(monkeypatch):
     assert "connection" in call_names
     assert "remove_session" in call_names
     assert "side_bar_opened" in call_names
+    assert "resync_sidebar" in call_names
     assert "emit_personal_sources_state" in call_names
     assert "stop" in call_names
     assert "preview" in call_names
     assert "update_settings" in call_names
     assert "save_config_to_file" in call_names
     assert "load_settings" in call_names
-    assert len(fake_socketio.tasks) >= 6
+    assert "enqueue_artist_addition" in call_names
+    scheduler = fake_data_handler.task_scheduler
+    assert ("bulk_add_artists", ("sid-1", ["C", "D"])) in scheduler.tasks
+    assert len(scheduler.tasks) >= 6
+    assert fake_socketio.tasks == []
+    options = {name: extra for name, _, extra in scheduler.submitted}
+    assert options["start"] == {"owner": "user:9", "priority": 0, "key": "discovery:sid-1"}
+    assert options["request_artist"] == {"owner": "user:9", "priority": PRIORITY_ADD, "key": None}
+    assert options["prehear"]["priority"] == PRIORITY_PREVIEW
 
 
 def test_socket_admin_restrictions_emit_unauthorized(monkeypatch):
@@ -187,9 +221,20 @@ def test_socket_handlers_accept_non_dict_payloads_and_invalid_user_ids(monkeypat
     )
 
     fake_socketio.handlers["connect"]()
+    fake_socketio.handlers["connect"]({"resume_token": "tok", "card_count": "oops"})
     fake_socketio.handlers["ai_prompt_req"]("discover shoegaze")
     fake_socketio.handlers["user_recs_req"]("listenbrainz")
 
-    assert ("connection", ("sid-edge", None, True, False)) in fake_data_handler.calls
-    assert ("ai_prompt", ("sid-edge", "discover shoegaze")) in fake_socketio.tasks
-    assert ("personal_recommendations", ("sid-edge", "listenbrainz")) in fake_socketio.tasks
+    assert (
+        "connection",
+        ("sid-edge", None, True, False),
+        {"resume_token": None, "known_cards": 0},
+    ) in fake_data_handler.calls
+    assert (
+        "connection",
+        ("sid-edge", None, True, False),
+        {"resume_token": "tok", "known_cards": 0},
+    ) in fake_data_handler.calls
+    scheduler = fake_data_handler.task_scheduler
+    assert ("ai_prompt", ("sid-edge", "discover shoegaze", False)) in scheduler.tasks
+    assert ("personal_recommendations", ("sid-edge", "listenbrainz")) in scheduler.tasks
@@ -0,0 +1,61 @@
+"""Tests for the local tag-to-artist index used for AI tag prompts."""
+
+from __future__ import annotations
+
+from sonobarr_app.services.tag_index import TagIndex, tag_key
+
+
+def _index():
+    index = TagIndex(max_artists=10)
+    index.add("Slowdive", [("shoegaze", 100), ("dream pop", 60), ("seen live", 5)])
+    index.add("Ride", [("Shoegaze", 100), ("britpop", 30)])
+    index.add("Mogwai", [("Post-Rock", 100), ("scottish", 40)])
+    index.add("Lush", [("shoegaze", 80), ("dream pop", 90)])
+    return index
+
+
+def test_tag_keys_ignore_spelling_variants():
+    """Case, hyphens and spacing should not change a tag key."""
+
+    assert tag_key("Post-Rock") == tag_key("post rock") == tag_key("postrock") == "postrock"
+
+
+def test_match_splits_plain_tag_prompts_and_rejects_free_form_ones():
+    """Prompts made of known tags and filler words match; anything else is left to the LLM."""
+
+    index = _index()
+
+    assert index.match("post rock") == ["postrock"]
+    assert index.match("Some dream-pop and shoegaze music") == ["dreampop", "shoegaze"]
+    assert index.match("seen live") is None
+    assert index.match("songs for a rainy sunday like slowdive") is None
+    assert index.match("music") is None
+
+
+def test_artists_rank_by_combined_weight_and_respect_exclusions():
+    """Artists need every requested tag and are ordered by summed tag weight."""
+
+    index = _index()
+
+    assert index.artists(["shoegaze"], limit=5) == ["Ride", "Slowdive", "Lush"]
+    assert index.artists(["shoegaze", "dreampop"], limit=5) == ["Lush", "Slowdive"]
+    assert index.artists(["shoegaze"], limit=5, exclude=lambda name: name == "Ride") == ["Slowdive", "Lush"]
+    assert index.lookup("shoegaze", limit=2) == ["Ride", "Slowdive"]
+    assert index.lookup("dream pop", limit=3) == []
+    assert index.metrics() == {"artists": 4, "tags": 5, "hits": 1, "misses": 1}
+
+
+def test_reindexing_replaces_tags_and_eviction_drops_postings():
+    """Re-adding an artist replaces its tags, and the oldest artists are evicted past the bound."""
+
+    index = TagIndex(max_artists=2)
+    index.add("Slowdive", [("shoegaze", 100)])
+    index.add("Slowdive", [("ambient", 100)])
+    assert index.artists(["shoegaze"], limit=5) == []
+    assert index.artists(["ambient"], limit=5) == ["Slowdive"]
+
+    index.add("Ride", [("shoegaze", 100)])
+    index.add("Mogwai", [("post-rock", 100)])
+    assert index.match("ambient") is None
+    assert index.metrics()["artists"] == 2
+    assert not TagIndex(max_artists=0).enabled
@@ -0,0 +1,100 @@
+"""Tests for the fair, bounded background task scheduler."""
+
+from __future__ import annotations
+
+from sonobarr_app.services.task_scheduler import (
+    PRIORITY_ADD,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_MAINTENANCE,
+    PRIORITY_PREVIEW,
+    TaskScheduler,
+)
+
+
+class _DeferredSocketIO:
+    """Socket.IO double that queues background tasks until the test runs them."""
+
+    def __init__(self):
+        self.pending = []
+
+    def start_background_task(self, func, *args):
+        self.pending.append((func, args))
+
+    def run_next(self, index=0):
+        func, args = self.pending.pop(index)
+        func(*args)
+
+
+def test_scheduler_caps_concurrency_per_user_and_prefers_priority():
+    """Busy users should be skipped at their cap while higher priorities go first."""
+
+    socketio = _DeferredSocketIO()
+    scheduler = TaskScheduler(socketio, max_concurrent=2, per_owner_limit=1, debounce_seconds=0)
+    ran = []
+
+    scheduler.submit(ran.append, "heavy-1", owner="user:1")
+    scheduler.submit(ran.append, "heavy-2", owner="user:1")
+    scheduler.submit(ran.append, "other", owner="user:2")
+    scheduler.submit(ran.append, "sync", owner="system", priority=PRIORITY_MAINTENANCE)
+    scheduler.submit(ran.append, "light", owner="user:3", priority=PRIORITY_INTERACTIVE)
+
+    assert len(socketio.pending) == 2
+    metrics = scheduler.metrics()
+    assert metrics["running"] == 2
+    assert metrics["queued"] == {"interactive": 2, "preview": 0, "add": 0, "prefetch": 0, "maintenance": 1}
+
+    # user:1 still runs heavy-1, so freed slots skip heavy-2 and go to user:3, then to maintenance.
+    socketio.run_next(1)
+    assert socketio.pending[1][1][0].args == ("light",)
+    socketio.run_next(1)
+    assert socketio.pending[1][1][0].args == ("sync",)
+    while socketio.pending:
+        socketio.run_next()
+    assert ran == ["other", "light", "heavy-1", "sync", "heavy-2"]
+    assert scheduler.metrics()["completed"] == 5
+    assert scheduler.metrics()["owners_running"] == 0
+
+
+def test_scheduler_debounces_and_bounds_per_user_queue():
+    """Repeats collapse into the queued task and overflowing users are rejected."""
+
+    socketio = _DeferredSocketIO()
+    scheduler = TaskScheduler(
+        socketio,
+        max_concurrent=1,
+        per_owner_limit=1,
+        max_queued_per_owner=2,
+        debounce_seconds=60,
+    )
+    ran = []
+
+    assert scheduler.submit(ran.append, "first", owner="user:1", key="load_more") is True
+    assert scheduler.submit(ran.append, "first", owner="user:1", key="load_more") is False
+    assert scheduler.submit(ran.append, "second", owner="user:1", key="load_more") is True
+    assert scheduler.submit(ran.append, "third", owner="user:1", key="load_more") is False
+    assert scheduler.submit(ran.append, "add-a", owner="user:1", priority=PRIORITY_ADD) is True
+    assert scheduler.submit(ran.append, "add-b", owner="user:1", priority=PRIORITY_ADD) is False
+
+    while socketio.pending:
+        socketio.run_next()
+
+    assert ran == ["first", "third", "add-a"]
+    metrics = scheduler.metrics()
+    assert metrics["debounced"] == 2
+    assert metrics["rejected"] == 1
+
+
+def test_discoveries_at_the_user_limit_do_not_block_previews_or_adds():
+    """Each priority class has its own per-user slots, so quick work bypasses long discoveries."""
+
+    socketio = _DeferredSocketIO()
+    scheduler = TaskScheduler(socketio, max_concurrent=8, per_owner_limit=1, debounce_seconds=0)
+
+    scheduler.submit(lambda: None, owner="user:1")
+    scheduler.submit(lambda: None, owner="user:1")
+    scheduler.submit(lambda: None, owner="user:1", priority=PRIORITY_PREVIEW)
+    scheduler.submit(lambda: None, owner="user:1", priority=PRIORITY_ADD)
+
+    assert [args[0].priority for _, args in socketio.pending] == [PRIORITY_INTERACTIVE, PRIORITY_PREVIEW, PRIORITY_ADD]
+    assert scheduler.metrics()["queued"]["interactive"] == 1
+    assert scheduler.metrics()["owners_running"] == 1